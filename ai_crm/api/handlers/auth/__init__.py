@@ -6,26 +6,33 @@ from ai_crm.api.handlers.auth import (
     auth_refresh_v1,
     auth_register_v1,
 )
-from ai_crm.api.middlewares import jwt_auth
+from ai_crm.api.middlewares import jwt_auth, rate_limit
 from ai_crm.pkg.context import web_context
 from ai_crm.pkg.models.ai_crm import auth as auth_models
 from ai_crm.pkg.models.ai_crm import user as user_models
+from ai_crm.pkg.models.base import exception as base_exceptions
 from ai_crm.pkg.models.exceptions import auth as auth_exceptions
+from ai_crm.pkg.models.exceptions import executor as executor_exceptions
+from ai_crm.pkg.models.exceptions import rate_limit as rate_limit_exceptions
 from ai_crm.pkg.models.exceptions import users as users_exceptions
 
 auth_router = APIRouter(
     prefix="/v1/auth",
     tags=["Auth"],
-    responses={
-        **auth_exceptions.InvalidCredentials.generate_openapi(),
-        **auth_exceptions.InvalidToken.generate_openapi(),
-        **users_exceptions.UserAlreadyExists.generate_openapi(),
-    },
+    # Several exceptions share 401 and 429
+    responses=base_exceptions.generate_openapi_responses(
+        auth_exceptions.InvalidCredentials,
+        auth_exceptions.InvalidToken,
+        users_exceptions.UserAlreadyExists,
+        executor_exceptions.ExecutorOverloaded,
+        rate_limit_exceptions.RateLimitExceeded,
+    ),
 )
 
 
 @auth_router.post(
     "/register",
+    dependencies=[Depends(rate_limit.limit_auth_by_ip)],
     status_code=status.HTTP_201_CREATED,
     description="Register a new user",
     response_model=auth_models.TokenResponse,
@@ -41,6 +48,7 @@ async def _auth_register_v1(
 
 @auth_router.post(
     "/login",
+    dependencies=[Depends(rate_limit.limit_auth_by_ip)],
     status_code=status.HTTP_200_OK,
     description="Login user and get JWT tokens",
     response_model=auth_models.TokenResponse,
@@ -56,6 +64,7 @@ async def _auth_login_v1(
 
 @auth_router.post(
     "/refresh",
+    dependencies=[Depends(rate_limit.limit_auth_by_ip)],
     status_code=status.HTTP_200_OK,
     description="Refresh access token using refresh token",
     response_model=auth_models.TokenResponse,
@@ -73,10 +82,12 @@ async def _auth_refresh_v1(
     "/me",
     status_code=status.HTTP_200_OK,
     description="Get current authenticated user",
-    response_model=user_models.User,
+    response_model=user_models.UserPrincipal,
 )
 async def _auth_me_v1(
-    current_user: user_models.User = Depends(jwt_auth.get_current_user),
+    current_user: user_models.UserPrincipal = Depends(
+        jwt_auth.get_current_user
+    ),
 ):
     return current_user
 
@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends, File, Form, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from starlette import status
 
 from ai_crm.api.handlers.resumes import (
+    resumes_ai_personalize_status_v1,
+    resumes_ai_personalize_stream_v1,
+    resumes_ai_personalize_submit_v1,
     resumes_ai_personalize_v1,
     resumes_delete_v1,
     resumes_download_v1,
@@ -12,6 +15,7 @@ from ai_crm.api.handlers.resumes import (
 from ai_crm.api.middlewares import jwt_auth
 from ai_crm.pkg.context import web_context
 from ai_crm.pkg.models.ai_crm import ai_resume as ai_resume_models
+from ai_crm.pkg.models.ai_crm import personalization_job as job_models
 from ai_crm.pkg.models.ai_crm import resume as resume_models
 from ai_crm.pkg.models.ai_crm import user as user_models
 from ai_crm.pkg.models.exceptions import ai as ai_exceptions
@@ -27,6 +31,7 @@ resume_router = APIRouter(
         **resume_exceptions.FileTooLarge.generate_openapi(),
         **ai_exceptions.ResumeParsingFailed.generate_openapi(),
         **ai_exceptions.ResumePersonalizationFailed.generate_openapi(),
+        **ai_exceptions.PersonalizationJobNotFound.generate_openapi(),
     },
 )
 
@@ -41,7 +46,9 @@ async def _resumes_upload_v1(
     file: UploadFile = File(..., description="PDF file to upload"),
     title: str | None = Form(None, description="Resume title"),
     description: str | None = Form(None, description="Resume description"),
-    current_user: user_models.User = Depends(jwt_auth.get_current_user),
+    current_user: user_models.UserPrincipal = Depends(
+        jwt_auth.get_current_user
+    ),
     web_context: web_context.WebContext = Depends(
         web_context.get_web_context_dependency()
     ),
@@ -58,7 +65,9 @@ async def _resumes_upload_v1(
     response_model=list[resume_models.ResumeListResponse],
 )
 async def _resumes_list_v1(
-    current_user: user_models.User = Depends(jwt_auth.get_current_user),
+    current_user: user_models.UserPrincipal = Depends(
+        jwt_auth.get_current_user
+    ),
     web_context: web_context.WebContext = Depends(
         web_context.get_web_context_dependency()
     ),
@@ -69,12 +78,14 @@ async def _resumes_list_v1(
 @resume_router.get(
     "/download/{resume_id}",
     status_code=status.HTTP_200_OK,
-    description="Download resume PDF file",
-    response_class=StreamingResponse,
+    description="Download resume file, supports Range requests",
+    response_class=FileResponse,
 )
 async def _resumes_download_v1(
     resume_id: str,
-    current_user: user_models.User = Depends(jwt_auth.get_current_user),
+    current_user: user_models.UserPrincipal = Depends(
+        jwt_auth.get_current_user
+    ),
     web_context: web_context.WebContext = Depends(
         web_context.get_web_context_dependency()
     ),
@@ -91,7 +102,9 @@ async def _resumes_download_v1(
 )
 async def _resumes_delete_v1(
     resume_id: str,
-    current_user: user_models.User = Depends(jwt_auth.get_current_user),
+    current_user: user_models.UserPrincipal = Depends(
+        jwt_auth.get_current_user
+    ),
     web_context: web_context.WebContext = Depends(
         web_context.get_web_context_dependency()
     ),
@@ -109,7 +122,9 @@ async def _resumes_delete_v1(
 )
 async def _resumes_ai_personalize_v1(
     request: ai_resume_models.PersonalizeResumeRequest,
-    current_user: user_models.User = Depends(jwt_auth.get_current_user),
+    current_user: user_models.UserPrincipal = Depends(
+        jwt_auth.get_current_user
+    ),
     web_context: web_context.WebContext = Depends(
         web_context.get_web_context_dependency()
     ),
@@ -117,3 +132,68 @@ async def _resumes_ai_personalize_v1(
     return await resumes_ai_personalize_v1.handle(
         web_context, request, current_user.id
     )
+
+
+@resume_router.post(
+    "/ai/personalize/submit",
+    status_code=status.HTTP_202_ACCEPTED,
+    description=(
+        "Enqueue AI resume personalization, poll the returned job for result"
+    ),
+    response_model=job_models.PersonalizationJobResponse,
+)
+async def _resumes_ai_personalize_submit_v1(
+    request: ai_resume_models.PersonalizeResumeRequest,
+    current_user: user_models.UserPrincipal = Depends(
+        jwt_auth.get_current_user
+    ),
+    web_context: web_context.WebContext = Depends(
+        web_context.get_web_context_dependency()
+    ),
+):
+    return await resumes_ai_personalize_submit_v1.handle(
+        web_context, request, current_user.id
+    )
+
+
+@resume_router.get(
+    "/ai/personalize/status/{job_id}",
+    status_code=status.HTTP_200_OK,
+    description="Get AI resume personalization job status",
+    response_model=job_models.PersonalizationJobResponse,
+)
+async def _resumes_ai_personalize_status_v1(
+    job_id: str,
+    current_user: user_models.UserPrincipal = Depends(
+        jwt_auth.get_current_user
+    ),
+    web_context: web_context.WebContext = Depends(
+        web_context.get_web_context_dependency()
+    ),
+):
+    return await resumes_ai_personalize_status_v1.handle(
+        web_context, job_id, current_user.id
+    )
+
+
+@resume_router.post(
+    "/ai/personalize/stream",
+    status_code=status.HTTP_200_OK,
+    description=(
+        "Personalize resume using AI, streaming stage transitions and partial "
+        "results as Server-Sent Events"
+    ),
+    response_class=StreamingResponse,
+)
+async def _resumes_ai_personalize_stream_v1(
+    request: ai_resume_models.PersonalizeResumeRequest,
+    current_user: user_models.UserPrincipal = Depends(
+        jwt_auth.get_current_user
+    ),
+    web_context: web_context.WebContext = Depends(
+        web_context.get_web_context_dependency()
+    ),
+):
+    return await resumes_ai_personalize_stream_v1.handle(
+        web_context, request, current_user.id
+    )
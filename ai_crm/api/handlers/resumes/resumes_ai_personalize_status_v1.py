@@ -0,0 +1,16 @@
+"""Handler for polling an asynchronous resume personalization."""
+
+from ai_crm.internal.services.resumes import personalization_jobs
+from ai_crm.pkg.context import web_context
+from ai_crm.pkg.models.ai_crm import personalization_job as job_models
+
+
+async def handle(
+    context: web_context.WebContext,
+    job_id: str,
+    user_id: str,
+) -> job_models.PersonalizationJobResponse:
+    job = await personalization_jobs.get_job(context, job_id, user_id)
+    return job_models.PersonalizationJobResponse.model_validate(
+        job.model_dump()
+    )
@@ -0,0 +1,148 @@
+"""Handler for AI resume personalization with Server-Sent Events progress."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+
+from ai_crm.internal.services.resumes import ai_resume_service, resumes
+from ai_crm.pkg.context import web_context
+from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.models.ai_crm import ai_resume as ai_resume_models
+from ai_crm.pkg.models.base import exception as base_exceptions
+
+logger = logger_lib.get_logger(__name__)
+
+# Comment lines keep proxies from closing an idle stream during GPT calls
+HEARTBEAT_INTERVAL_SECONDS = 15.0
+
+# Pipelines outliving their stream (client went away) must not be
+# garbage collected before they finish saving the resumes
+_background_pipelines: set[asyncio.Task] = set()
+
+
+async def handle(
+    context: web_context.WebContext,
+    request: ai_resume_models.PersonalizeResumeRequest,
+    user_id: str,
+) -> StreamingResponse:
+    """Handle AI resume personalization streaming progress as SSE.
+
+    Every stage transition is sent as ``event: <stage>`` with a
+    :class:`.PersonalizationProgressEvent` JSON payload. The stream ends with
+    a ``completed`` event holding the resume ids or a ``failed`` one.
+
+    Raises:
+        ResumeNotFound: If resume doesn't exist
+        ResumeAccessDenied: If user doesn't own the resume
+    """
+    # Fail with a regular HTTP error before the stream is started
+    await resumes.get_resume_by_id(context, request.resume_id, user_id)
+
+    logger.info(
+        "Starting streamed AI resume personalization",
+        resume_id=request.resume_id,
+        user_id=user_id,
+    )
+
+    return StreamingResponse(
+        _stream_progress(context, request, user_id),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Disable response buffering in nginx
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+async def _stream_progress(
+    context: web_context.WebContext,
+    request: ai_resume_models.PersonalizeResumeRequest,
+    user_id: str,
+) -> AsyncIterator[str]:
+    events: asyncio.Queue[ai_resume_models.PersonalizationProgressEvent] = (
+        asyncio.Queue()
+    )
+
+    pipeline = asyncio.create_task(
+        _run_pipeline(context, request, user_id, events.put)
+    )
+    _background_pipelines.add(pipeline)
+    pipeline.add_done_callback(_background_pipelines.discard)
+
+    while True:
+        try:
+            event = await asyncio.wait_for(
+                events.get(), timeout=HEARTBEAT_INTERVAL_SECONDS
+            )
+        except TimeoutError:
+            yield ": heartbeat\n\n"
+            continue
+
+        yield _format_event(event)
+
+        if event.stage in (
+            ai_resume_models.PersonalizationStage.COMPLETED,
+            ai_resume_models.PersonalizationStage.FAILED,
+        ):
+            return
+
+
+async def _run_pipeline(
+    context: web_context.WebContext,
+    request: ai_resume_models.PersonalizeResumeRequest,
+    user_id: str,
+    on_progress: ai_resume_service.ProgressCallback,
+) -> None:
+    last_step = 0
+
+    async def _track_progress(
+        event: ai_resume_models.PersonalizationProgressEvent,
+    ) -> None:
+        nonlocal last_step
+        last_step = event.step
+        await on_progress(event)
+
+    try:
+        await ai_resume_service.personalize_and_save_resume(
+            context=context,
+            resume_id=request.resume_id,
+            user_id=user_id,
+            job_description=request.job_description,
+            on_progress=_track_progress,
+        )
+    except base_exceptions.BaseAPIException as error:
+        logger.error(
+            "Streamed AI resume personalization failed",
+            error_code=error.error_code,
+        )
+        await on_progress(
+            _failed_event(last_step, error.error_code, error.error_msg)
+        )
+    except Exception:
+        logger.exception("Streamed AI resume personalization crashed")
+        await on_progress(
+            _failed_event(
+                last_step,
+                base_exceptions.BaseError.error_code,
+                base_exceptions.BaseError.error_msg,
+            )
+        )
+
+
+def _failed_event(
+    step: int, error_code: str, error_message: str
+) -> ai_resume_models.PersonalizationProgressEvent:
+    return ai_resume_models.PersonalizationProgressEvent(
+        stage=ai_resume_models.PersonalizationStage.FAILED,
+        step=step,
+        total_steps=ai_resume_service.TOTAL_STEPS,
+        error_code=error_code,
+        error_message=error_message,
+    )
+
+
+def _format_event(event: ai_resume_models.PersonalizationProgressEvent) -> str:
+    payload = event.model_dump_json(exclude_none=True)
+    return f"event: {event.stage}\ndata: {payload}\n\n"
@@ -0,0 +1,22 @@
+"""Handler for submitting an asynchronous resume personalization."""
+
+from ai_crm.internal.services.resumes import personalization_jobs
+from ai_crm.pkg.context import web_context
+from ai_crm.pkg.models.ai_crm import ai_resume as ai_resume_models
+from ai_crm.pkg.models.ai_crm import personalization_job as job_models
+
+
+async def handle(
+    context: web_context.WebContext,
+    request: ai_resume_models.PersonalizeResumeRequest,
+    user_id: str,
+) -> job_models.PersonalizationJobResponse:
+    job = await personalization_jobs.submit_job(
+        context=context,
+        resume_id=request.resume_id,
+        user_id=user_id,
+        job_description=request.job_description,
+    )
+    return job_models.PersonalizationJobResponse.model_validate(
+        job.model_dump()
+    )
@@ -1,9 +1,8 @@
 """Handler for AI-powered resume personalization."""
 
-import io
-
-from fastapi.responses import StreamingResponse
+from starlette.responses import Response
 
+from ai_crm.api.handlers.resumes import resumes_download_v1
 from ai_crm.internal.services.resumes import ai_resume_service
 from ai_crm.pkg.context import web_context
 from ai_crm.pkg.logger import logger as logger_lib
@@ -16,36 +15,27 @@ async def handle(
     context: web_context.WebContext,
     request: ai_resume_models.PersonalizeResumeRequest,
     user_id: str,
-) -> StreamingResponse:
+) -> Response:
     """Handle AI resume personalization request.
 
     Returns:
-        StreamingResponse with PDF file
+        Response with PDF file
     """
     logger.info(
         f"Starting AI resume personalization for resume_id: "
         f"{request.resume_id}, user: {user_id}"
     )
 
-    new_resume = await ai_resume_service.personalize_and_save_resume(
+    new_resumes = await ai_resume_service.personalize_and_save_resume(
         context=context,
         resume_id=request.resume_id,
         user_id=user_id,
         job_description=request.job_description,
     )
-
-    file_content = await context.storage.get_file(new_resume.storage_path)
+    new_resume = new_resumes.pdf
 
     logger.info(
         f"Returning AI-personalized resume: {new_resume.original_filename}"
     )
 
-    return StreamingResponse(
-        io.BytesIO(file_content),
-        media_type=new_resume.mime_type,
-        headers={
-            "Content-Disposition": (
-                f'attachment; filename="{new_resume.original_filename}"'
-            )
-        },
-    )
+    return resumes_download_v1.build_file_response(context, new_resume)
@@ -1,26 +1,45 @@
-from io import BytesIO
-
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.responses import Response
 
 from ai_crm.internal.services.resumes import resumes as resumes_service
 from ai_crm.pkg.context import web_context
+from ai_crm.pkg.models.ai_crm import resume as resume_models
 
 
 async def handle(
     context: web_context.WebContext,
     resume_id: str,
     user_id: str,
-) -> StreamingResponse:
-    file_content, original_filename = await resumes_service.download_resume(
-        context, resume_id, user_id
-    )
+) -> Response:
+    resume = await resumes_service.download_resume(context, resume_id, user_id)
+    return build_file_response(context, resume)
+
+
+def build_file_response(
+    context: web_context.WebContext, resume: resume_models.Resume
+) -> Response:
+    """Send resume file without loading it into memory.
+
+    Local files are sent with ``FileResponse``: it supports ``Range`` and
+    ``If-Range`` and uses sendfile where the server supports it. Other storages
+    are streamed chunk by chunk.
+    """
+    local_path = context.storage.local_path(resume.storage_path)
+
+    if local_path is not None:
+        return FileResponse(
+            local_path,
+            media_type=resume.mime_type,
+            filename=resume.original_filename,
+        )
 
     return StreamingResponse(
-        BytesIO(file_content),
-        media_type="application/pdf",
+        context.storage.open_stream(resume.storage_path),
+        media_type=resume.mime_type,
         headers={
+            "Content-Length": str(resume.file_size),
             "Content-Disposition": (
-                f'attachment; filename="{original_filename}"'
-            )
+                f'attachment; filename="{resume.original_filename}"'
+            ),
         },
     )
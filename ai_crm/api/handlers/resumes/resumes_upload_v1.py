@@ -12,13 +12,10 @@ async def handle(
     title: str | None = None,
     description: str | None = None,
 ) -> resume_models.ResumeUploadResponse:
-    file_content = await file.read()
-
     resume = await resumes_service.upload_resume(
         context=context,
         user_id=user_id,
-        file_content=file_content,
-        original_filename=file.filename or "no_name_resume.pdf",
+        file=file,
         title=title,
         description=description,
     )
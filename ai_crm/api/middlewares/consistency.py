@@ -0,0 +1,64 @@
+"""Consistency token middleware."""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.connectors.postgresql import consistency
+
+CONSISTENCY_TOKEN_HEADER = "X-Consistency-Token"
+
+
+class ConsistencyTokenMiddleware:
+    """Pure ASGI middleware for read-your-writes across API processes.
+
+    Responses to requests that wrote to PostgreSQL carry the WAL position
+    of the writes in the ``X-Consistency-Token`` header. A client sending
+    it back gets reads that see those writes, whichever process serves
+    them.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if (
+            scope["type"] != "http"
+            or not settings.ai_crm_env.POSTGRES.READ_YOUR_WRITES
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        token = consistency.start_session(min_lsn=_get_client_lsn(scope))
+        session = consistency.get_session()
+
+        async def send_wrapper(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and session.write_lsn is not None
+            ):
+                headers = MutableHeaders(scope=message)
+                headers[CONSISTENCY_TOKEN_HEADER] = consistency.format_lsn(
+                    session.write_lsn
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            consistency.end_session(token)
+
+
+def _get_client_lsn(scope: Scope) -> int | None:
+    header_name = CONSISTENCY_TOKEN_HEADER.lower().encode("latin-1")
+    for name, value in scope["headers"]:
+        if name == header_name:
+            try:
+                return consistency.parse_lsn(value.decode("latin-1"))
+            except ValueError:
+                # A broken token only costs reads from replicas
+                return None
+
+    return None
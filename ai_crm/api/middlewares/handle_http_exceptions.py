@@ -26,10 +26,17 @@ def handle_api_exceptions(
 
     del request  # unused
 
-    logger.info(f"api exception: {str(type(exc))}: {exc}")
+    logger.info(
+        "API exception",
+        exception_type=type(exc).__name__,
+        error_code=exc.error_code,
+        http_code=exc.http_code,
+    )
 
     return JSONResponse(
-        status_code=exc.http_code, content={"message": exc.error_msg}
+        status_code=exc.http_code,
+        content={"message": exc.error_msg},
+        headers=exc.headers,
     )
 
 
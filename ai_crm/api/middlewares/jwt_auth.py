@@ -18,7 +18,7 @@ async def get_current_user(
     web_context: web_context.WebContext = Depends(
         web_context.get_web_context_dependency()
     ),
-) -> user_models.User:
+) -> user_models.UserPrincipal:
     """Dependency to get current authenticated user from JWT token.
 
     Args:
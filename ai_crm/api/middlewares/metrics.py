@@ -1,22 +1,16 @@
 """Middleware for expose internal metrics to public endpoint."""
 
-# TODO prometheus
-# from prometheus_client.openmetrics.exposition import (
-#     CONTENT_TYPE_LATEST,
-#     generate_latest,
-# )
-# from prometheus_client.registry import REGISTRY
 from starlette.requests import Request
 from starlette.responses import Response
 
-from ai_crm.pkg.logger import logger as logger_lib
-
-logger = logger_lib.get_logger(__name__)
+from ai_crm.pkg.metrics import exposition
 
 
 def metrics(request: Request) -> Response:
     """Expose internal metrics to public endpoint.
 
+    In multiprocess mode (gunicorn) metrics of all workers are merged.
+
     Args:
         request:
             ``Request`` instance.
@@ -27,9 +21,5 @@ def metrics(request: Request) -> Response:
 
     del request  # unused
 
-    logger.error("METRICS NOT SETTED!")
-
-    return Response(
-        # generate_latest(REGISTRY),
-        # headers={"Content-Type": CONTENT_TYPE_LATEST},
-    )
+    payload, content_type = exposition.generate_metrics()
+    return Response(payload, headers={"Content-Type": content_type})
@@ -1,151 +1,204 @@
-"""Prometheus middleware."""  # TODO prometheus
+"""Prometheus middleware."""
 
+import re
 import time
 
-# from opentelemetry import trace
-# from prometheus_client import Counter, Gauge, Histogram
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
 from starlette.requests import Request
-from starlette.responses import Response
-from starlette.routing import Match
+from starlette.routing import BaseRoute, Match, Route
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ai_crm.api.middlewares.handle_http_exceptions import (
     handle_api_exceptions,
     handle_internal_exception,
 )
 from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.metrics import server as server_metrics
 from ai_crm.pkg.models.base import exception as base_exceptions
-from ai_crm.pkg.models.types import fastapi
+from ai_crm.pkg.utils.lru_cache import LRUCache
 
 logger = logger_lib.get_logger(__name__)
 
+# Path segments that are surely path params: numbers and UUIDs
+_DYNAMIC_SEGMENT = re.compile(
+    r"\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}"
+    r"-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+
+class _RouteTemplateResolver:
+    """Resolves request path to the template of the matching route.
+
+    Routes are indexed once: static paths go to a dict, the rest keep their
+    compiled regex. Results are cached per (method, path shape), where the
+    shape is the path with ids replaced, so ``/resumes/download/<uuid>``
+    resolves once for all ids.
+    """
+
+    def __init__(self, routes: list[BaseRoute], cache_size: int = 1024):
+        # Positions keep Starlette's "first declared route wins" order
+        self._static_routes: dict[str, list[tuple[int, Route]]] = {}
+        self._dynamic_routes: list[tuple[int, BaseRoute]] = []
+        self._cache: LRUCache[tuple[str, bool]] = LRUCache(cache_size)
+        self._routes_count = len(routes)
+
+        for position, route in enumerate(routes):
+            if isinstance(route, Route) and not route.param_convertors:
+                self._static_routes.setdefault(route.path, []).append(
+                    (position, route)
+                )
+            else:
+                self._dynamic_routes.append((position, route))
+
+    def resolve(self, scope: Scope) -> tuple[str, bool]:
+        """Get route template for request.
+
+        Returns:
+            Tuple of (path template or request path, is_handled_path)
+        """
+        route_path = _get_route_path(scope)
+        cache_key = (scope["method"], self._get_path_shape(route_path))
+
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            template, is_handled = cached
+            return (template, True) if is_handled else (route_path, False)
+
+        template = self._match(scope, route_path)
+        self._cache.set(cache_key, (template or route_path, bool(template)))
+        return (template, True) if template else (route_path, False)
+
+    def _match(self, scope: Scope, route_path: str) -> str | None:
+        method = scope["method"]
+
+        static_position, static_template = self._routes_count, None
+        for position, route in self._static_routes.get(route_path, ()):
+            if not route.methods or method in route.methods:
+                static_position, static_template = position, route.path
+                break
+
+        for position, route in self._dynamic_routes:
+            if position > static_position:
+                break
+            if isinstance(route, Route):
+                if route.methods and method not in route.methods:
+                    continue
+                if route.path_regex.match(route_path):
+                    return route.path
+            else:
+                # Mounts and others: rare, use regular matching
+                match, _ = route.matches(scope)
+                if match == Match.FULL:
+                    return getattr(route, "path", route_path)
+
+        return static_template
+
+    @staticmethod
+    def _get_path_shape(route_path: str) -> str:
+        return "/".join(
+            "{}" if _DYNAMIC_SEGMENT.fullmatch(segment) else segment
+            for segment in route_path.split("/")
+        )
+
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    """Middleware for collecting metrics from FastAPI application."""
+class PrometheusMiddleware:
+    """Pure ASGI middleware for collecting metrics from FastAPI application.
 
-    app: fastapi.instance
+    Request duration is measured until the last body chunk is sent, so
+    streaming responses are timed completely.
+    """
 
     __filter_unhandled_paths: bool
     __app_name: str
 
-    # __INFO = Gauge("fastapi_app_info", "FastAPI application information.", ["app_name"])
-    # __REQUESTS = Counter(
-    #     "fastapi_requests_total",
-    #     "Total count of requests by method and path.",
-    #     ["method", "path", "app_name"],
-    # )
-    # __RESPONSES = Counter(
-    #     "fastapi_responses_total",
-    #     "Total count of responses by method, path and status codes.",
-    #     ["method", "path", "status_code", "app_name"],
-    # )
-    # __REQUESTS_PROCESSING_TIME = Histogram(
-    #     "fastapi_requests_duration_seconds",
-    #     "Histogram of requests processing time by path (in seconds)",
-    #     ["method", "path", "app_name"],
-    # )
-    # __EXCEPTIONS = Counter(
-    #     "fastapi_exceptions_total",
-    #     "Total count of exceptions raised by path and exception type",
-    #     ["method", "path", "exception_type", "app_name"],
-    # )
-    # __REQUESTS_IN_PROGRESS = Gauge(
-    #     "fastapi_requests_in_progress",
-    #     "Gauge of requests by method and path currently being processed",
-    #     ["method", "path", "app_name"],
-    # )
-
     def __init__(
         self,
         app: ASGIApp,
         app_name: str = "api",
         filter_unhandled_paths: bool = True,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.__app_name = app_name
-        # self.__INFO.labels(app_name=self.__app_name).inc()
+        server_metrics.INFO.labels(app_name=self.__app_name).set(1)
         self.__filter_unhandled_paths = filter_unhandled_paths
+        self.__resolver: _RouteTemplateResolver | None = None
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        method = request.method  # noqa: F841
-        path_template, is_handled_path = self.__get_path_template(request)
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path_template, is_handled_path = self.__get_path_template(scope)
 
         if self.__is_path_filtered(is_handled_path):
-            return await call_next(request)
-
-        # self.__REQUESTS_IN_PROGRESS.labels(
-        #     method=method,
-        #     path=path_template,
-        #     app_name=self.__app_name,
-        # ).inc()
-        # self.__REQUESTS.labels(
-        #     method=method,
-        #     path=path_template,
-        #     app_name=self.__app_name,
-        # ).inc()
-        before_time = time.perf_counter()
+            await self.app(scope, receive, send)
+            return
+
+        labels = {
+            "method": scope["method"],
+            "path": path_template,
+            "app_name": self.__app_name,
+        }
+        server_metrics.REQUESTS_IN_PROGRESS.labels(**labels).inc()
+        server_metrics.REQUESTS.labels(**labels).inc()
+
         status_code = HTTP_500_INTERNAL_SERVER_ERROR
-        try:
-            response = await call_next(request)
-        except (  # pylint: disable=broad-exception-caught
-            base_exceptions.BaseAPIException,
-            Exception,
-        ) as e:
-            # self.__EXCEPTIONS.labels(
-            #     method=method,
-            #     path=path_template,
-            #     exception_type=type(e).__name__,
-            #     app_name=self.__app_name,
-            # ).inc()
-            if isinstance(e, base_exceptions.BaseAPIException):
-                return handle_api_exceptions(request=request, exc=e)
-            return handle_internal_exception(request=request, exc=e)
-        else:
-            status_code = response.status_code  # noqa: F841
-            after_time = time.perf_counter()
-            logger.info(
-                f"Request processed in {after_time - before_time} seconds"
-            )  # TODO: remove
-            # span = trace.get_current_span()
-            # trace_id = trace.format_trace_id(span.get_span_context().trace_id)
-
-            # self.__REQUESTS_PROCESSING_TIME.labels(
-            #     method=method,
-            #     path=path_template,
-            #     app_name=self.__app_name,
-            # ).observe(after_time - before_time, exemplar={"TraceID": trace_id})
-        # finally:
-        #     self.__RESPONSES.labels(
-        #         method=method,
-        #         path=path_template,
-        #         status_code=status_code,
-        #         app_name=self.__app_name,
-        #     ).inc()
-        #     self.__REQUESTS_IN_PROGRESS.labels(
-        #         method=method,
-        #         path=path_template,
-        #         app_name=self.__app_name,
-        #     ).dec()
-
-        return response
+        is_response_started = False
 
-    @staticmethod
-    def __get_path_template(request: Request) -> tuple[str, bool]:
-        for route in request.app.routes:
-            match, _ = route.matches(request.scope)
-            if match == Match.FULL:
-                return route.path, True
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, is_response_started
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                is_response_started = True
+            await send(message)
 
-        return request.url.path, False
+        before_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            server_metrics.EXCEPTIONS.labels(
+                exception_type=type(e).__name__, **labels
+            ).inc()
+            if is_response_started:
+                raise
+
+            request = Request(scope, receive)
+            if isinstance(e, base_exceptions.BaseAPIException):
+                response = handle_api_exceptions(request=request, exc=e)
+            else:
+                response = handle_internal_exception(request=request, exc=e)
+            await response(scope, receive, send_wrapper)
+        finally:
+            server_metrics.REQUESTS_PROCESSING_TIME.labels(**labels).observe(
+                time.perf_counter() - before_time
+            )
+            server_metrics.RESPONSES.labels(
+                status_code=status_code, **labels
+            ).inc()
+            server_metrics.REQUESTS_IN_PROGRESS.labels(**labels).dec()
+
+    def __get_path_template(self, scope: Scope) -> tuple[str, bool]:
+        # Routes are complete only once the app serves requests
+        if self.__resolver is None:
+            self.__resolver = _RouteTemplateResolver(scope["app"].routes)
+
+        return self.__resolver.resolve(scope)
 
     def __is_path_filtered(self, is_handled_path: bool) -> bool:
         return self.__filter_unhandled_paths and not is_handled_path
+
+
+def _get_route_path(scope: Scope) -> str:
+    """Get request path without ``root_path``, like Starlette routing does."""
+    path: str = scope["path"]
+    root_path: str = scope.get("root_path", "")
+
+    if root_path and path.startswith(root_path):
+        if path == root_path:
+            return ""
+        if path[len(root_path)] == "/":
+            return path[len(root_path) :]
+
+    return path
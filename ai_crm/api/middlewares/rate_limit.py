@@ -0,0 +1,25 @@
+"""Rate limit dependencies for routes open to anonymous clients."""
+
+from fastapi import Request
+
+from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.utils import rate_limit as rate_limit_lib
+
+_auth_ip_limiter = rate_limit_lib.RateLimiter(
+    "auth_ip",
+    per_minute=settings.ai_crm_env.API.AUTH_IP_RATE_PER_MINUTE,
+    burst=settings.ai_crm_env.API.AUTH_IP_BURST,
+)
+
+
+async def limit_auth_by_ip(request: Request) -> None:
+    """Dependency limiting auth attempts of the client IP.
+
+    The IP is the peer address: behind a proxy, run uvicorn with
+    ``--proxy-headers`` so it is taken from ``X-Forwarded-For``.
+
+    Raises:
+        RateLimitExceeded: If the IP has no attempts left.
+    """
+    client_ip = request.client.host if request.client else "unknown"
+    await _auth_ip_limiter.check(client_ip)
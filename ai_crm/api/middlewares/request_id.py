@@ -0,0 +1,59 @@
+"""Request id middleware."""
+
+import re
+import uuid
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ai_crm.pkg.configuration import context_vars
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Ids from clients are echoed to logs and headers, so keep them boring
+_VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._-]{1,128}")
+
+
+class RequestIdMiddleware:
+    """Pure ASGI middleware binding a request id to the current task.
+
+    The id is taken from the ``X-Request-ID`` header when it is valid,
+    otherwise generated. It's added to every log record of the request and
+    returned in the response header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _get_request_id(scope)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        token = context_vars.request_id.set(request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            context_vars.request_id.reset(token)
+
+
+def _get_request_id(scope: Scope) -> str:
+    header_name = REQUEST_ID_HEADER.lower().encode("latin-1")
+    for name, value in scope["headers"]:
+        if name == header_name:
+            request_id = value.decode("latin-1")
+            if _VALID_REQUEST_ID.fullmatch(request_id):
+                return request_id
+            break
+
+    return uuid.uuid4().hex
@@ -7,11 +7,18 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from ai_crm.api import handlers
 from ai_crm.api.logger import EndpointFilter
-from ai_crm.api.middlewares import handle_http_exceptions, metrics, prometheus
+from ai_crm.api.middlewares import (
+    consistency,
+    handle_http_exceptions,
+    metrics,
+    prometheus,
+    request_id,
+)
 from ai_crm.pkg.configuration import settings
 from ai_crm.pkg.context.web_context import WebContext
 from ai_crm.pkg.models.base import exception as base_exception
 from ai_crm.pkg.models.types import fastapi
+from ai_crm.worker.personalization import PersonalizationWorker
 
 
 class Server:
@@ -49,11 +56,21 @@ class Server:
 
     def _register_events(self, app: fastapi.instance) -> None:
         app.on_event("startup")(self.__web_context.on_startup)
+
+        # Local mode: run personalization jobs without a separate worker
+        if settings.ai_crm_env.JOBS.RUN_IN_API:
+            worker = PersonalizationWorker(self.__web_context)
+            app.on_event("startup")(worker.on_startup)
+            app.on_event("shutdown")(worker.on_shutdown)
+
         app.on_event("shutdown")(self.__web_context.on_shutdown)
 
     def _register_middlewares(self, app: fastapi.instance) -> None:
         self.__register_cors_origins(app)
         self.__register_prometheus(app)
+        app.add_middleware(consistency.ConsistencyTokenMiddleware)
+        # Outermost, so every log record of the request has the id
+        app.add_middleware(request_id.RequestIdMiddleware)
 
     @staticmethod
     def _register_http_exceptions(app: fastapi.instance) -> None:
@@ -73,6 +90,11 @@ class Server:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=[
+                request_id.REQUEST_ID_HEADER,
+                consistency.CONSISTENCY_TOKEN_HEADER,
+                "Retry-After",
+            ],
         )
 
     def __register_prometheus(self, app: fastapi.instance) -> None:
@@ -1,5 +1,6 @@
 from ai_crm.internal.repository.postgresql.collect_response import (
     collect_response,
+    track_query,
 )
 from ai_crm.pkg import context
 from ai_crm.pkg.connectors.postgresql import psql
@@ -100,6 +101,7 @@ async def update_gift(
         return row
 
 
+@track_query
 async def delete_gift(
     context: context.AnyContext, request: gift_models.GiftDeleteRequest
 ) -> None:
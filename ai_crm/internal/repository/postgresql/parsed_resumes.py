@@ -0,0 +1,49 @@
+from ai_crm.internal.repository.postgresql.collect_response import (
+    collect_response,
+)
+from ai_crm.pkg import context
+from ai_crm.pkg.connectors.postgresql import psql
+from ai_crm.pkg.models.ai_crm import parsed_resume as parsed_resume_models
+
+
+@collect_response
+async def get_parsed_resume(
+    context: context.AnyContext,
+    content_hash: str,
+    schema_version: str,
+) -> parsed_resume_models.ParsedResumeRecord:
+    async with psql.get_connection(context, read_only=True) as conn:
+        row = await conn.fetchrow(
+            """
+            SELECT * FROM parsed_resumes
+            WHERE content_hash = $1 AND schema_version = $2
+            """,
+            content_hash,
+            schema_version,
+        )
+        return row
+
+
+@collect_response
+async def save_parsed_resume(
+    context: context.AnyContext,
+    content_hash: str,
+    schema_version: str,
+    parsed_resume: parsed_resume_models.ParsedResume,
+) -> parsed_resume_models.ParsedResumeRecord:
+    async with psql.get_connection(context) as conn:
+        row = await conn.fetchrow(
+            """
+            INSERT INTO parsed_resumes (
+                content_hash, schema_version, parsed_data
+            )
+            VALUES ($1, $2, $3::jsonb)
+            ON CONFLICT (content_hash, schema_version)
+            DO UPDATE SET parsed_data = EXCLUDED.parsed_data
+            RETURNING *
+            """,
+            content_hash,
+            schema_version,
+            parsed_resume.model_dump_json(),
+        )
+        return row
@@ -0,0 +1,134 @@
+from ai_crm.internal.repository.postgresql.collect_response import (
+    collect_response,
+)
+from ai_crm.pkg import context
+from ai_crm.pkg.connectors.postgresql import psql
+from ai_crm.pkg.models.ai_crm import personalization_job as job_models
+
+
+@collect_response
+async def create_job(
+    context: context.AnyContext,
+    user_id: str,
+    resume_id: str,
+    job_description: str,
+) -> job_models.PersonalizationJob:
+    async with psql.get_connection(context) as conn:
+        row = await conn.fetchrow(
+            """
+            INSERT INTO personalization_jobs (
+                user_id, resume_id, job_description
+            )
+            VALUES ($1, $2, $3)
+            RETURNING *
+            """,
+            user_id,
+            resume_id,
+            job_description,
+        )
+        return row
+
+
+@collect_response
+async def get_job_by_id(
+    context: context.AnyContext, job_id: str
+) -> job_models.PersonalizationJob:
+    # Job status changes right after submit, so a lagging replica is no use
+    async with psql.get_connection(context) as conn:
+        row = await conn.fetchrow(
+            "SELECT * FROM personalization_jobs WHERE id = $1", job_id
+        )
+        return row
+
+
+@collect_response
+async def claim_next_job(
+    context: context.AnyContext, lease_seconds: float
+) -> job_models.PersonalizationJob:
+    """Atomically claim the oldest pending job.
+
+    A running job whose lease has expired (its worker died) is claimed
+    again. ``FOR UPDATE SKIP LOCKED`` lets concurrent workers claim
+    different rows without blocking each other.
+
+    Raises:
+        EmptyResult: when there is no job to claim.
+    """
+    async with psql.get_connection(context) as conn:
+        row = await conn.fetchrow(
+            """
+            UPDATE personalization_jobs
+            SET status = 'running',
+                attempts = attempts + 1,
+                error_code = NULL,
+                started_at = NOW(),
+                locked_until = NOW() + make_interval(secs => $1)
+            WHERE id = (
+                SELECT id FROM personalization_jobs
+                WHERE status = 'pending'
+                   OR (status = 'running' AND locked_until < NOW())
+                ORDER BY created_at
+                LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING *
+            """,
+            lease_seconds,
+        )
+        return row
+
+
+@collect_response
+async def mark_job_succeeded(
+    context: context.AnyContext,
+    job_id: str,
+    pdf_resume_id: str,
+    docx_resume_id: str,
+) -> job_models.PersonalizationJob:
+    async with psql.get_connection(context) as conn:
+        row = await conn.fetchrow(
+            """
+            UPDATE personalization_jobs
+            SET status = 'succeeded',
+                pdf_resume_id = $2,
+                docx_resume_id = $3,
+                locked_until = NULL,
+                finished_at = NOW()
+            WHERE id = $1
+            RETURNING *
+            """,
+            job_id,
+            pdf_resume_id,
+            docx_resume_id,
+        )
+        return row
+
+
+@collect_response
+async def mark_job_failed(
+    context: context.AnyContext,
+    job_id: str,
+    error_code: str,
+    retry: bool = False,
+) -> job_models.PersonalizationJob:
+    """Record a failed attempt.
+
+    With ``retry`` the job goes back to ``pending`` to be claimed again,
+    otherwise it is finished as ``failed``.
+    """
+    async with psql.get_connection(context) as conn:
+        row = await conn.fetchrow(
+            """
+            UPDATE personalization_jobs
+            SET status = CASE WHEN $3 THEN 'pending' ELSE 'failed' END,
+                error_code = $2,
+                locked_until = NULL,
+                finished_at = CASE WHEN $3 THEN NULL ELSE NOW() END
+            WHERE id = $1
+            RETURNING *
+            """,
+            job_id,
+            error_code,
+            retry,
+        )
+        return row
@@ -1,5 +1,6 @@
 from ai_crm.internal.repository.postgresql.collect_response import (
     collect_response,
+    track_query,
 )
 from ai_crm.pkg import context
 from ai_crm.pkg.connectors.postgresql import psql
@@ -19,6 +20,7 @@ async def create_resume(
     media_type: str = "cv",
     title: str | None = None,
     description: str | None = None,
+    content_hash: str | None = None,
 ) -> resume_models.Resume:
     async with psql.get_connection(context) as conn:
         row = await conn.fetchrow(
@@ -26,9 +28,9 @@ async def create_resume(
             INSERT INTO resumes (
                 user_id, filename, original_filename, file_size,
                 mime_type, storage_path, storage_type, media_type,
-                title, description
+                title, description, content_hash
             )
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
             RETURNING *
             """,
             user_id,
@@ -41,11 +43,12 @@ async def create_resume(
             media_type,
             title,
             description,
+            content_hash,
         )
         return row
 
 
-@collect_response
+@collect_response(trusted=True)
 async def get_resume_by_id(
     context: context.AnyContext, resume_id: str
 ) -> resume_models.Resume:
@@ -56,7 +59,7 @@ async def get_resume_by_id(
         return row
 
 
-@collect_response
+@collect_response(trusted=True)
 async def get_user_resumes(
     context: context.AnyContext,
     user_id: str,
@@ -84,6 +87,7 @@ async def get_user_resumes(
         return rows
 
 
+@track_query
 async def delete_resume(context: context.AnyContext, resume_id: str) -> bool:
     """Soft delete resume (set is_active to False).
 
@@ -2,13 +2,14 @@ import uuid
 
 from ai_crm.internal.repository.postgresql.collect_response import (
     collect_response,
+    track_query,
 )
 from ai_crm.pkg import context
 from ai_crm.pkg.connectors.postgresql import psql
 from ai_crm.pkg.models.ai_crm import user as user_models
 
 
-@collect_response
+@collect_response(trusted=True)
 async def get_users_as_models(
     context: context.AnyContext,
 ) -> list[user_models.User]:
@@ -20,12 +21,18 @@ async def get_users_as_models(
 async def create_user(
     context: context.AnyContext, request: user_models.UserCreateRequest
 ) -> user_models.User:
+    """Create user unless the username or email is taken.
+
+    Raises:
+        EmptyResult: when a user with the username or email exists.
+    """
     user_id = str(uuid.uuid4())
     async with psql.get_connection(context) as conn:
         row = await conn.fetchrow(
             """
             INSERT INTO users (id, username, email, password_hash, first_name, last_name, is_active)
             VALUES ($1, $2, $3, $4, $5, $6, $7)
+            ON CONFLICT DO NOTHING
             RETURNING *
             """,
             user_id,
@@ -39,7 +46,7 @@ async def create_user(
         return row
 
 
-@collect_response
+@collect_response(trusted=True)
 async def get_user_by_email(
     context: context.AnyContext, email: str
 ) -> user_models.User:
@@ -48,7 +55,7 @@ async def get_user_by_email(
         return row
 
 
-@collect_response
+@collect_response(trusted=True)
 async def get_user_by_username(
     context: context.AnyContext, username: str
 ) -> user_models.User:
@@ -59,10 +66,40 @@ async def get_user_by_username(
         return row
 
 
-@collect_response
+@collect_response(trusted=True)
 async def get_user_by_id(
     context: context.AnyContext, user_id: str
 ) -> user_models.User:
     async with psql.get_connection(context, read_only=True) as conn:
         row = await conn.fetchrow("SELECT * FROM users WHERE id = $1", user_id)
         return row
+
+
+@collect_response(trusted=True)
+async def get_user_principal_by_id(
+    context: context.AnyContext, user_id: str
+) -> user_models.UserPrincipal:
+    async with psql.get_connection(context, read_only=True) as conn:
+        row = await conn.fetchrow(
+            """
+            SELECT
+                id, username, email, first_name, last_name, is_active,
+                created_at, updated_at
+            FROM users
+            WHERE id = $1
+            """,
+            user_id,
+        )
+        return row
+
+
+@track_query
+async def update_password_hash(
+    context: context.AnyContext, user_id: str, password_hash: str
+) -> None:
+    async with psql.get_connection(context) as conn:
+        await conn.execute(
+            "UPDATE users SET password_hash = $2 WHERE id = $1",
+            user_id,
+            password_hash,
+        )
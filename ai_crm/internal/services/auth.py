@@ -1,36 +1,33 @@
 """Authentication service."""
 
-from ai_crm.internal.repository.postgresql import users as users_repository
 from ai_crm.internal.services import users as users_lib
 from ai_crm.pkg import context
 from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.connectors.postgresql import consistency
 from ai_crm.pkg.logger import logger as logger_lib
 from ai_crm.pkg.models.ai_crm import auth as auth_models
 from ai_crm.pkg.models.ai_crm import user as user_models
 from ai_crm.pkg.models.exceptions import auth as auth_exceptions
-from ai_crm.pkg.models.exceptions import postgres as postgres_exceptons
-from ai_crm.pkg.models.exceptions import users as users_excpetions
 from ai_crm.pkg.utils import jwt as jwt_utils
 from ai_crm.pkg.utils import password as password_utils
+from ai_crm.pkg.utils import rate_limit as rate_limit_lib
 
 logger = logger_lib.get_logger(__name__)
 
+# Credential stuffing spreads attempts on an account over many IPs
+_login_email_limiter = rate_limit_lib.RateLimiter(
+    "login_email",
+    per_minute=settings.ai_crm_env.API.LOGIN_EMAIL_RATE_PER_MINUTE,
+    burst=settings.ai_crm_env.API.LOGIN_EMAIL_BURST,
+)
+
 
 async def register(
     context: context.AnyContext, request: auth_models.RegisterRequest
 ) -> auth_models.TokenResponse:
-    # TODO: create psql index and assert on index if this email/username already exist
-    try:
-        await users_repository.get_user_by_email(context, request.email)
-        await users_repository.get_user_by_username(context, request.username)
-        raise users_excpetions.UserAlreadyExists
-    except postgres_exceptons.EmptyResult:
-        pass
-
-    hashed_password = password_utils.hash_password(request.password)
-
-    logger.info(
-        f"Password hashed successfully for username: {request.username}, hash length: {len(hashed_password)}"
+    # Taken username or email is caught by the unique indexes on insert
+    hashed_password = await context.executor.run_password_task(
+        password_utils.hash_password, request.password
     )
 
     create_request = user_models.UserCreateRequest(
@@ -43,17 +40,27 @@ async def register(
     )
 
     user = await users_lib.create_user(context, create_request)
+    logger.info("User registered", user_id=user.id)
     return _create_tokens(user)
 
 
 async def login(
     context: context.AnyContext, request: auth_models.LoginRequest
 ) -> auth_models.TokenResponse:
+    await _login_email_limiter.check(request.email.strip().lower())
     user = await users_lib.get_user_by_email(context, request.email)
 
-    if not password_utils.verify_password(request.password, user.password_hash):
+    is_valid, new_hash = await context.executor.run_password_task(
+        password_utils.verify_and_update_password,
+        request.password,
+        user.password_hash,
+    )
+    if not is_valid:
         raise auth_exceptions.InvalidCredentials
 
+    if new_hash:
+        await _update_password_hash(context, user, new_hash)
+
     return _create_tokens(user)
 
 
@@ -68,7 +75,7 @@ async def refresh(
 
 async def get_current_user(
     context: context.AnyContext, token: str
-) -> user_models.User:
+) -> user_models.UserPrincipal:
     return await _get_user_from_jwt(context, token, token_type="access")
 
 
@@ -76,17 +83,38 @@ async def _get_user_from_jwt(
     context: context.AnyContext,
     token: str,
     token_type: str,
-) -> user_models.User:
+) -> user_models.UserPrincipal:
     """Validate jwt and get user"""
     payload = jwt_utils.decode_token(token, token_type=token_type)
     if not payload:
         raise auth_exceptions.InvalidToken
 
     user_id = payload.get("sub")
-    return await users_lib.get_user_by_user_id(context, user_id)
+    # Reads of the request see earlier writes of the user
+    consistency.bind_key(user_id)
+    return await users_lib.get_user_principal(context, user_id)
 
 
-def _create_tokens(user: user_models.User) -> auth_models.TokenResponse:
+async def _update_password_hash(
+    context: context.AnyContext, user: user_models.User, password_hash: str
+) -> None:
+    """Store hash of the current cost; login succeeds even if it fails."""
+    try:
+        await users_lib.update_password_hash(context, user.id, password_hash)
+    except Exception as error:
+        logger.warning(
+            "Failed to update password hash",
+            user_id=user.id,
+            error=repr(error),
+        )
+        return
+
+    logger.info("Password hash updated", user_id=user.id)
+
+
+def _create_tokens(
+    user: user_models.User | user_models.UserPrincipal,
+) -> auth_models.TokenResponse:
     token_data = {
         "sub": user.id,
         "username": user.username,
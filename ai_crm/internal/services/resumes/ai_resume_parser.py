@@ -1,17 +1,33 @@
 """AI-powered resume parsing service using GPT."""
 
+import asyncio
+import hashlib
+import io
+import json
 import textwrap
 
 import PyPDF2
 
+from ai_crm.internal.repository.postgresql import (
+    parsed_resumes as parsed_resumes_repository,
+)
 from ai_crm.pkg import context
 from ai_crm.pkg.clients.openai import client as openai_client
+from ai_crm.pkg.configuration import settings
 from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.metrics import ai as ai_metrics
 from ai_crm.pkg.models.ai_crm import parsed_resume as parsed_resume_models
+from ai_crm.pkg.models.base import exception as base_exceptions
 from ai_crm.pkg.models.exceptions import ai as ai_exceptions
+from ai_crm.pkg.models.exceptions import postgres as postgres_exceptions
+from ai_crm.pkg.utils import lru_cache
 
 logger = logger_lib.get_logger(__name__)
 
+# Short resumes are extracted by a single worker, longer documents are split
+# into chunks of this many pages and extracted in parallel.
+PDF_PAGES_PER_EXTRACTION_TASK = 8
+
 SYSTEM_PROMPT = textwrap.dedent(
     """
     You are an expert resume parser.
@@ -83,10 +99,33 @@ def _get_user_prompt(content: str) -> str:
     ).strip()
 
 
+# Any change of the prompts or of the ParsedResume schema yields a new
+# version, so cached parse results are never reused across such changes.
+PARSE_SCHEMA_VERSION = hashlib.sha256(
+    (
+        SYSTEM_PROMPT
+        + _get_user_prompt("")
+        + json.dumps(
+            parsed_resume_models.ParsedResume.model_json_schema(),
+            sort_keys=True,
+        )
+    ).encode()
+).hexdigest()[:16]
+
+# Callers get copies: personalization edits the parsed resume it gets
+_parsed_resume_cache: lru_cache.LRUCache[parsed_resume_models.ParsedResume] = (
+    lru_cache.LRUCache(maxsize=settings.ai_crm_env.API.PARSED_RESUME_CACHE_SIZE)
+)
+
+
 async def parse_pdf_resume(
     context: context.AnyContext, file_content: bytes
 ) -> parsed_resume_models.ParsedResume:
-    """Parse PDF resume using GPT.
+    """Parse PDF resume using GPT, reusing earlier results for the same file.
+
+    Results are cached by SHA-256 of the file bytes and
+    :data:`PARSE_SCHEMA_VERSION`: first in process memory, then in the
+    ``parsed_resumes`` table.
 
     Args:
         context: Application context
@@ -98,46 +137,154 @@ async def parse_pdf_resume(
     Raises:
         ResumeParsingFailed: If parsing fails
     """
+    content_hash = hashlib.sha256(file_content).hexdigest()
+
+    parsed_resume = await get_cached_parsed_resume(context, content_hash)
+    if parsed_resume:
+        return parsed_resume
+
+    parsed_resume = await _parse_pdf_resume_with_gpt(context, file_content)
+    await _save_parsed_resume(context, content_hash, parsed_resume)
+    return parsed_resume
+
+
+async def get_cached_parsed_resume(
+    context: context.AnyContext, content_hash: str
+) -> parsed_resume_models.ParsedResume | None:
+    cache_key = (content_hash, PARSE_SCHEMA_VERSION)
+
+    parsed_resume = _parsed_resume_cache.get(cache_key)
+    if parsed_resume:
+        logger.debug(
+            "Parsed resume cache hit", source="memory", hash=content_hash
+        )
+        return parsed_resume.model_copy(deep=True)
+
+    try:
+        record = await parsed_resumes_repository.get_parsed_resume(
+            context, content_hash, PARSE_SCHEMA_VERSION
+        )
+    except postgres_exceptions.EmptyResult:
+        return None
+
+    logger.debug(
+        "Parsed resume cache hit", source="database", hash=content_hash
+    )
+    _parsed_resume_cache.set(cache_key, record.parsed_data)
+    return record.parsed_data.model_copy(deep=True)
+
+
+async def _save_parsed_resume(
+    context: context.AnyContext,
+    content_hash: str,
+    parsed_resume: parsed_resume_models.ParsedResume,
+) -> None:
+    _parsed_resume_cache.set(
+        (content_hash, PARSE_SCHEMA_VERSION),
+        parsed_resume.model_copy(deep=True),
+    )
+
+    # The result is already in hand, a failed cache write must not fail
+    # the personalization itself.
     try:
-        text_content = _extract_text_from_pdf(file_content)
+        await parsed_resumes_repository.save_parsed_resume(
+            context, content_hash, PARSE_SCHEMA_VERSION, parsed_resume
+        )
+    except Exception:
+        logger.exception(
+            "Failed to persist parsed resume cache", hash=content_hash
+        )
+
+
+async def _parse_pdf_resume_with_gpt(
+    context: context.AnyContext, file_content: bytes
+) -> parsed_resume_models.ParsedResume:
+    try:
+        with ai_metrics.track_stage(ai_metrics.AIStage.EXTRACT):
+            text_content = await _extract_text_from_pdf(context, file_content)
 
         logger.info(f"Extracted {len(text_content)} characters from PDF")
 
         # TODO: add to prompt message about finding at least year in dates
         user_prompt = _get_user_prompt(text_content)
 
-        parsed_resume = await openai_client.parse_with_gpt(
-            response_model=parsed_resume_models.ParsedResume,
-            system_prompt=SYSTEM_PROMPT,
-            user_prompt=user_prompt,
-        )
+        with ai_metrics.track_stage(ai_metrics.AIStage.GPT_PARSE):
+            parsed_resume = await openai_client.parse_with_gpt(
+                context=context,
+                response_model=parsed_resume_models.ParsedResume,
+                system_prompt=SYSTEM_PROMPT,
+                user_prompt=user_prompt,
+            )
 
         logger.info(f"Successfully parsed resume for: {parsed_resume.name}")
         return parsed_resume
 
+    except base_exceptions.BaseAPIException:
+        raise
     except Exception as e:
         logger.exception(f"Resume parsing failed: {e}")
         raise ai_exceptions.ResumeParsingFailed from e
 
 
-def _extract_text_from_pdf(file_content: bytes) -> str:
+async def _extract_text_from_pdf(
+    context: context.AnyContext, file_content: bytes
+) -> str:
+    """Extract PDF text in the process pool, fanning out long documents."""
     try:
-        import io
+        text_parts, page_count = await context.executor.run_cpu_bound(
+            _extract_pages_text,
+            file_content,
+            0,
+            PDF_PAGES_PER_EXTRACTION_TASK,
+        )
 
-        pdf_file = io.BytesIO(file_content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        if page_count > PDF_PAGES_PER_EXTRACTION_TASK:
+            chunks = await asyncio.gather(
+                *(
+                    context.executor.run_cpu_bound(
+                        _extract_pages_text,
+                        file_content,
+                        start,
+                        start + PDF_PAGES_PER_EXTRACTION_TASK,
+                    )
+                    for start in range(
+                        PDF_PAGES_PER_EXTRACTION_TASK,
+                        page_count,
+                        PDF_PAGES_PER_EXTRACTION_TASK,
+                    )
+                )
+            )
+            for chunk_text_parts, _ in chunks:
+                text_parts.extend(chunk_text_parts)
 
-        text_parts = []
-        for page in pdf_reader.pages:
-            text_parts.append(page.extract_text())
+    except base_exceptions.BaseAPIException:
+        raise
+    except Exception as e:
+        logger.exception(f"PDF text extraction failed: {e}")
+        raise ai_exceptions.ResumeParsingFailed from e
 
-        full_text = "\n\n".join(text_parts)
+    full_text = "\n\n".join(text_parts)
+    if not full_text.strip():
+        logger.warning("PDF text extraction returned no text")
+        raise ai_exceptions.ResumeParsingFailed
 
-        if not full_text.strip():
-            raise ai_exceptions.ResumeParsingFailed
+    return full_text
 
-        return full_text
 
-    except Exception as e:
-        logger.exception(f"PDF text extraction failed: {e}")
-        raise ai_exceptions.ResumeParsingFailed from e
+def _extract_pages_text(
+    file_content: bytes, start: int, stop: int
+) -> tuple[list[str], int]:
+    """Extract text of pages ``[start, stop)``, runs in a worker process.
+
+    Returns:
+        Tuple of (page texts, total page count of the document)
+    """
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+    pages = pdf_reader.pages
+    page_count = len(pages)
+
+    text_parts = [
+        pages[page_number].extract_text()
+        for page_number in range(start, min(stop, page_count))
+    ]
+    return text_parts, page_count
@@ -6,7 +6,9 @@ import textwrap
 from ai_crm.pkg import context
 from ai_crm.pkg.clients.openai import client as openai_client
 from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.metrics import ai as ai_metrics
 from ai_crm.pkg.models.ai_crm import parsed_resume as parsed_resume_models
+from ai_crm.pkg.models.base import exception as base_exceptions
 from ai_crm.pkg.models.exceptions import ai as ai_exceptions
 
 logger = logger_lib.get_logger(__name__)
@@ -76,17 +78,19 @@ async def personalize_resume(
         resume_dict = parsed_resume.model_dump(mode="json")
         user_prompt = _get_personalization_prompt(resume_dict, job_description)
 
-        personalized_resume = await openai_client.personalize_with_gpt(
-            response_model=parsed_resume_models.ParsedResume,
-            system_prompt=PERSONALIZATION_SYSTEM_PROMPT,
-            user_prompt=user_prompt,
-        )
+        with ai_metrics.track_stage(ai_metrics.AIStage.GPT_PERSONALIZE):
+            personalized_resume = await openai_client.personalize_with_gpt(
+                context=context,
+                response_model=parsed_resume_models.ParsedResume,
+                system_prompt=PERSONALIZATION_SYSTEM_PROMPT,
+                user_prompt=user_prompt,
+            )
 
         logger.info("Successfully personalized resume with AI")
         return personalized_resume
 
     except Exception as e:
         logger.error(f"Resume personalization failed: {e}")
-        if isinstance(e, ai_exceptions.BaseAPIException):
+        if isinstance(e, base_exceptions.BaseAPIException):
             raise
         raise ai_exceptions.ResumePersonalizationFailed from e
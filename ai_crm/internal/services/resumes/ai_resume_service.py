@@ -1,5 +1,7 @@
 """Service for AI-powered resume operations."""
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 import uuid
 
@@ -12,29 +14,56 @@ from ai_crm.internal.services.resumes import (
 )
 from ai_crm.pkg import context
 from ai_crm.pkg.logger import logger as logger_lib
-from ai_crm.pkg.models.ai_crm import resume as resume_models
+from ai_crm.pkg.metrics import ai as ai_metrics
+from ai_crm.pkg.models.ai_crm import ai_resume as ai_resume_models
 
 logger = logger_lib.get_logger(__name__)
 
+TOTAL_STEPS = 5
+
+ProgressCallback = Callable[
+    [ai_resume_models.PersonalizationProgressEvent], Awaitable[None]
+]
+
+
+async def _report_progress(
+    on_progress: ProgressCallback | None,
+    stage: ai_resume_models.PersonalizationStage,
+    step: int,
+    **partial: str | None,
+) -> None:
+    if on_progress is None:
+        return
+
+    await on_progress(
+        ai_resume_models.PersonalizationProgressEvent(
+            stage=stage, step=step, total_steps=TOTAL_STEPS, **partial
+        )
+    )
+
 
 async def personalize_and_save_resume(
     context: context.AnyContext,
     resume_id: str,
     user_id: str,
     job_description: str,
-) -> resume_models.Resume:
-    """Personalize resume with AI and save as new resume.
+    on_progress: ProgressCallback | None = None,
+) -> ai_resume_models.PersonalizedResumes:
+    """Personalize resume with AI and save as new resumes.
 
     Workflow:
     1. Parse original resume with GPT
     2. Personalize based on job description
-    3. Generate DOCX file
-    4. Save to storage
-    5. Create database record (media_type='ai-cv')
-    6. Return DOCX file
+    3. Generate DOCX and PDF files concurrently in the process pool
+    4. Save both files to storage
+    5. Create database records (media_type='ai-cv')
+
+    Args:
+        on_progress: Awaited on every stage transition, with partial results
+                     once they are known (used for progress streaming).
 
     Returns:
-        New AI-personalized resume record
+        New AI-personalized PDF and DOCX resume records
 
     Raises:
         ResumeNotFound: If resume doesn't exist
@@ -44,25 +73,38 @@ async def personalize_and_save_resume(
         context, resume_id, user_id
     )
     file_content = await context.storage.get_file(resume_metadata.storage_path)
+    stage = ai_resume_models.PersonalizationStage
 
     logger.info("Step 1/5: Parsing resume with GPT...")
+    await _report_progress(on_progress, stage.PARSING, 1)
     parsed_resume = await ai_resume_parser.parse_pdf_resume(
         context, file_content
     )
+    await _report_progress(
+        on_progress,
+        stage.PARSED,
+        1,
+        name=parsed_resume.name,
+        position=parsed_resume.position,
+    )
 
     logger.info("Step 2/5: Personalizing resume with GPT...")
+    await _report_progress(on_progress, stage.PERSONALIZING, 2)
     personalized_resume = await ai_resume_personalizer.personalize_resume(
         context, parsed_resume, job_description
     )
-
-    logger.info("Step 3/6: Generating DOCX resume...")
-    docx_bytes = await resume_generator.generate_docx_resume(
-        context, personalized_resume
+    await _report_progress(
+        on_progress,
+        stage.PERSONALIZED,
+        2,
+        summary=personalized_resume.summary,
     )
 
-    logger.info("Step 4/6: Generating PDF resume...")
-    pdf_bytes = await resume_generator.generate_pdf_resume(
-        context, personalized_resume
+    logger.info("Step 3/5: Generating DOCX and PDF resumes...")
+    await _report_progress(on_progress, stage.GENERATING, 3)
+    docx_bytes, pdf_bytes = await asyncio.gather(
+        resume_generator.generate_docx_resume(context, personalized_resume),
+        resume_generator.generate_pdf_resume(context, personalized_resume),
     )
 
     unique_id = uuid.uuid4()
@@ -74,11 +116,16 @@ async def personalize_and_save_resume(
     docx_storage_path = f"{now.year:04d}/{now.month:02d}/{docx_filename}"
     pdf_storage_path = f"{now.year:04d}/{now.month:02d}/{pdf_filename}"
 
-    logger.info("Step 5/6: Saving files to storage...")
-    await context.storage.save_file(docx_storage_path, docx_bytes)
-    await context.storage.save_file(pdf_storage_path, pdf_bytes)
+    logger.info("Step 4/5: Saving files to storage...")
+    await _report_progress(on_progress, stage.STORING, 4)
+    with ai_metrics.track_stage(ai_metrics.AIStage.STORAGE):
+        await asyncio.gather(
+            context.storage.save_file(docx_storage_path, docx_bytes),
+            context.storage.save_file(pdf_storage_path, pdf_bytes),
+        )
 
-    logger.info("Step 6/6: Creating database records...")
+    logger.info("Step 5/5: Creating database records...")
+    await _report_progress(on_progress, stage.SAVING, 5)
     pdf_resume = await resumes_repository.create_resume(
         context=context,
         user_id=user_id,
@@ -107,7 +154,17 @@ async def personalize_and_save_resume(
         description=f"Personalized for: {job_description[:100]}...",
     )
 
+    await _report_progress(
+        on_progress,
+        stage.COMPLETED,
+        TOTAL_STEPS,
+        pdf_resume_id=pdf_resume.id,
+        docx_resume_id=docx_resume.id,
+    )
+
     logger.info(
         f"AI-personalized resumes saved - PDF: {pdf_resume.id}, DOCX: {docx_resume.id}"
     )
-    return pdf_resume
+    return ai_resume_models.PersonalizedResumes(
+        pdf=pdf_resume, docx=docx_resume
+    )
@@ -0,0 +1,146 @@
+"""Service for asynchronous AI resume personalization jobs."""
+
+import asyncio
+
+from starlette import status
+
+from ai_crm.internal.repository.postgresql import (
+    personalization_jobs as jobs_repository,
+)
+from ai_crm.internal.services.resumes import ai_resume_service, resumes
+from ai_crm.pkg import context
+from ai_crm.pkg.configuration import context_vars, settings
+from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.models.ai_crm import personalization_job as job_models
+from ai_crm.pkg.models.base import exception as base_exceptions
+from ai_crm.pkg.models.exceptions import ai as ai_exceptions
+from ai_crm.pkg.models.exceptions import postgres as postgres_exceptions
+
+logger = logger_lib.get_logger(__name__)
+
+
+async def submit_job(
+    context: context.AnyContext,
+    resume_id: str,
+    user_id: str,
+    job_description: str,
+) -> job_models.PersonalizationJob:
+    """Enqueue resume personalization.
+
+    Raises:
+        ResumeNotFound: If resume doesn't exist
+        ResumeAccessDenied: If user doesn't own the resume
+    """
+    await resumes.get_resume_by_id(context, resume_id, user_id)
+
+    job = await jobs_repository.create_job(
+        context, user_id, resume_id, job_description
+    )
+    logger.info("Personalization job submitted", job_id=job.id, user_id=user_id)
+    return job
+
+
+async def get_job(
+    context: context.AnyContext, job_id: str, user_id: str
+) -> job_models.PersonalizationJob:
+    """Get job of the user.
+
+    Raises:
+        PersonalizationJobNotFound: If job doesn't exist or isn't user's one
+    """
+    try:
+        job = await jobs_repository.get_job_by_id(context, job_id)
+    except postgres_exceptions.EmptyResult as e:
+        raise ai_exceptions.PersonalizationJobNotFound from e
+
+    # Don't reveal that a job of another user exists
+    if job.user_id != user_id:
+        raise ai_exceptions.PersonalizationJobNotFound
+
+    return job
+
+
+async def process_next_job(context: context.AnyContext) -> bool:
+    """Claim and run the oldest pending job.
+
+    Returns:
+        False if there was no job to claim
+    """
+    config = settings.ai_crm_env.JOBS
+
+    try:
+        job = await jobs_repository.claim_next_job(
+            context, config.LEASE_SECONDS
+        )
+    except postgres_exceptions.EmptyResult:
+        return False
+
+    # Logs of the job are correlated by its id, like requests are
+    token = context_vars.request_id.set(str(job.id))
+    try:
+        await _run_job(context, job)
+    finally:
+        context_vars.request_id.reset(token)
+    return True
+
+
+async def _run_job(
+    context: context.AnyContext, job: job_models.PersonalizationJob
+) -> None:
+    config = settings.ai_crm_env.JOBS
+
+    # A job abandoned by crashed workers too many times
+    if job.attempts > config.MAX_ATTEMPTS:
+        logger.error("Personalization job exceeded max attempts", job_id=job.id)
+        await jobs_repository.mark_job_failed(
+            context, job.id, "max_attempts_exceeded"
+        )
+        return
+
+    logger.info(
+        "Running personalization job", job_id=job.id, attempt=job.attempts
+    )
+    can_retry = job.attempts < config.MAX_ATTEMPTS
+
+    try:
+        result = await asyncio.wait_for(
+            ai_resume_service.personalize_and_save_resume(
+                context=context,
+                resume_id=job.resume_id,
+                user_id=job.user_id,
+                job_description=job.job_description,
+            ),
+            timeout=config.JOB_TIMEOUT_SECONDS,
+        )
+    except TimeoutError:
+        logger.error("Personalization job timed out", job_id=job.id)
+        await jobs_repository.mark_job_failed(
+            context, job.id, "job_timeout", retry=can_retry
+        )
+        return
+    except base_exceptions.BaseAPIException as error:
+        logger.error(
+            "Personalization job failed",
+            job_id=job.id,
+            error_code=error.error_code,
+        )
+        # Client errors (bad resume, access denied) will not go away
+        is_transient = error.http_code >= status.HTTP_500_INTERNAL_SERVER_ERROR
+        await jobs_repository.mark_job_failed(
+            context, job.id, error.error_code, retry=can_retry and is_transient
+        )
+        return
+    except Exception:
+        logger.exception("Personalization job crashed", job_id=job.id)
+        await jobs_repository.mark_job_failed(
+            context,
+            job.id,
+            base_exceptions.BaseError.error_code,
+            retry=can_retry,
+        )
+        return
+
+    await jobs_repository.mark_job_succeeded(
+        context, job.id, result.pdf.id, result.docx.id
+    )
+    logger.info("Personalization job succeeded", job_id=job.id)
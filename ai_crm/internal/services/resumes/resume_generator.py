@@ -21,7 +21,9 @@ from reportlab.platypus import (
 
 from ai_crm.pkg import context
 from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.metrics import ai as ai_metrics
 from ai_crm.pkg.models.ai_crm import parsed_resume as parsed_resume_models
+from ai_crm.pkg.models.base import exception as base_exceptions
 from ai_crm.pkg.models.exceptions import ai as ai_exceptions
 
 logger = logger_lib.get_logger(__name__)
@@ -31,26 +33,20 @@ async def generate_docx_resume(
     context: context.AnyContext,
     parsed_resume: parsed_resume_models.ParsedResume,
 ) -> bytes:
-    """Generate DOCX resume from parsed data."""
+    """Generate DOCX resume from parsed data in the process pool."""
     try:
         logger.info(f"Generating DOCX resume for: {parsed_resume.name}")
 
-        doc = Document()
-        _set_docx_document_margins(doc)
-        _add_docx_header(doc, parsed_resume)
-        _add_docx_summary(doc, parsed_resume)
-        _add_docx_professional_experience(doc, parsed_resume)
-        _add_docx_education(doc, parsed_resume)
-        _add_docx_certifications(doc, parsed_resume)
-        _add_docx_skills(doc, parsed_resume)
-
-        output = io.BytesIO()
-        doc.save(output)
-        output.seek(0)
+        with ai_metrics.track_stage(ai_metrics.AIStage.DOCX):
+            docx_bytes = await context.executor.run_cpu_bound(
+                _render_docx_resume, parsed_resume
+            )
 
         logger.info("Successfully generated DOCX resume")
-        return output.getvalue()
+        return docx_bytes
 
+    except base_exceptions.BaseAPIException:
+        raise
     except Exception as e:
         logger.exception(f"DOCX generation failed: {e}")
         raise ai_exceptions.ResumeGenerationFailed from e
@@ -60,41 +56,71 @@ async def generate_pdf_resume(
     context: context.AnyContext,
     parsed_resume: parsed_resume_models.ParsedResume,
 ) -> bytes:
-    """Generate PDF resume from parsed data."""
+    """Generate PDF resume from parsed data in the process pool."""
     try:
         logger.info(f"Generating PDF resume for: {parsed_resume.name}")
 
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=0.5 * inch,
-            bottomMargin=0.5 * inch,
-        )
-
-        styles = _get_pdf_styles()
-        story = []
-
-        _add_pdf_header(story, styles, parsed_resume)
-        _add_pdf_summary(story, styles, parsed_resume)
-        _add_pdf_professional_experience(story, styles, parsed_resume)
-        _add_pdf_education(story, styles, parsed_resume)
-        _add_pdf_certifications(story, styles, parsed_resume)
-        _add_pdf_skills(story, styles, parsed_resume)
-
-        doc.build(story)
-        buffer.seek(0)
+        with ai_metrics.track_stage(ai_metrics.AIStage.PDF):
+            pdf_bytes = await context.executor.run_cpu_bound(
+                _render_pdf_resume, parsed_resume
+            )
 
         logger.info("Successfully generated PDF resume")
-        return buffer.getvalue()
+        return pdf_bytes
 
+    except base_exceptions.BaseAPIException:
+        raise
     except Exception as e:
         logger.exception(f"PDF generation failed: {e}")
         raise ai_exceptions.ResumeGenerationFailed from e
 
 
+def _render_docx_resume(
+    parsed_resume: parsed_resume_models.ParsedResume,
+) -> bytes:
+    """Render DOCX document, runs in a worker process."""
+    doc = Document()
+    _set_docx_document_margins(doc)
+    _add_docx_header(doc, parsed_resume)
+    _add_docx_summary(doc, parsed_resume)
+    _add_docx_professional_experience(doc, parsed_resume)
+    _add_docx_education(doc, parsed_resume)
+    _add_docx_certifications(doc, parsed_resume)
+    _add_docx_skills(doc, parsed_resume)
+
+    output = io.BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+
+def _render_pdf_resume(
+    parsed_resume: parsed_resume_models.ParsedResume,
+) -> bytes:
+    """Render PDF document, runs in a worker process."""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        rightMargin=0.75 * inch,
+        leftMargin=0.75 * inch,
+        topMargin=0.5 * inch,
+        bottomMargin=0.5 * inch,
+    )
+
+    styles = _get_pdf_styles()
+    story = []
+
+    _add_pdf_header(story, styles, parsed_resume)
+    _add_pdf_summary(story, styles, parsed_resume)
+    _add_pdf_professional_experience(story, styles, parsed_resume)
+    _add_pdf_education(story, styles, parsed_resume)
+    _add_pdf_certifications(story, styles, parsed_resume)
+    _add_pdf_skills(story, styles, parsed_resume)
+
+    doc.build(story)
+    return buffer.getvalue()
+
+
 def _add_hyperlink(paragraph, url: str, text: str) -> None:
     """Add hyperlink to paragraph."""
     part = paragraph.part
@@ -1,10 +1,13 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
+import hashlib
 from pathlib import Path
 import uuid
 
+from fastapi import UploadFile
+
 from ai_crm.internal.repository.postgresql import resumes as resumes_repository
 from ai_crm.pkg import context
-from ai_crm.pkg.connectors.postgresql import psql
 from ai_crm.pkg.logger import logger as logger_lib
 from ai_crm.pkg.models.ai_crm import resume as resume_models
 from ai_crm.pkg.models.exceptions import postgres as postgres_exceptions
@@ -17,6 +20,8 @@ logger = logger_lib.get_logger(__name__)
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 ALLOWED_MIME_TYPES = ["application/pdf"]
 ALLOWED_EXTENSIONS = [".pdf"]
+UPLOAD_CHUNK_SIZE = 64 * 1024
+PDF_MAGIC_BYTES = b"%PDF-"
 
 
 async def _get_resume_by_id(
@@ -55,25 +60,72 @@ async def get_resume_by_id(
     return resume_metadata
 
 
+class _PdfUploadReader:
+    """Reads an upload chunk by chunk, validating and hashing it on the fly.
+
+    Keeps a single chunk in memory, so the upload is never fully loaded.
+    """
+
+    def __init__(self, file: UploadFile):
+        self._file = file
+        self._header = b""
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Yield upload chunks.
+
+        Raises:
+            FileTooLarge: As soon as more than MAX_FILE_SIZE bytes are read
+            InvalidFileType: If content doesn't start with PDF magic bytes
+        """
+        while chunk := await self._file.read(UPLOAD_CHUNK_SIZE):
+            self.size += len(chunk)
+            if self.size > MAX_FILE_SIZE:
+                logger.warning(
+                    "File too large, aborting upload",
+                    max_file_size=MAX_FILE_SIZE,
+                )
+                raise resume_exceptions.FileTooLarge
+
+            if len(self._header) < len(PDF_MAGIC_BYTES):
+                missing = len(PDF_MAGIC_BYTES) - len(self._header)
+                self._header += chunk[:missing]
+                self._check_header()
+
+            self.sha256.update(chunk)
+            yield chunk
+
+        if self._header != PDF_MAGIC_BYTES:
+            logger.warning("Invalid file content: upload is too short")
+            raise resume_exceptions.InvalidFileType
+
+    def _check_header(self) -> None:
+        if not PDF_MAGIC_BYTES.startswith(self._header):
+            logger.warning("Invalid file content", header=repr(self._header))
+            raise resume_exceptions.InvalidFileType
+
+
 # TODO: move to table assets
 async def upload_resume(
     context: context.AnyContext,
     user_id: str,
-    file_content: bytes,
-    original_filename: str,
+    file: UploadFile,
     title: str | None = None,
     description: str | None = None,
 ) -> resume_models.Resume:
-    """Upload resume file and create metadata record.
+    """Stream uploaded resume file to storage and create metadata record.
 
     Raises:
-        InvalidFileType: If file type is not PDF
+        InvalidFileType: If file is not PDF (extension or content)
         FileTooLarge: If file size exceeds limit
     """
-    file_size = len(file_content)
-    if file_size > MAX_FILE_SIZE:
+    original_filename = file.filename or "no_name_resume.pdf"
+
+    # Reject early when the size is known upfront
+    if file.size is not None and file.size > MAX_FILE_SIZE:
         logger.warning(
-            f"File too large: {file_size} bytes (max {MAX_FILE_SIZE})"
+            f"File too large: {file.size} bytes (max {MAX_FILE_SIZE})"
         )
         raise resume_exceptions.FileTooLarge
 
@@ -90,33 +142,42 @@ async def upload_resume(
     now = datetime.now()
     storage_path = f"{now.year:04d}/{now.month:02d}/{filename}"
 
-    async with psql.get_connection(context) as _:  # Open transaction
+    # Storage discards the partial file if validation fails mid-stream
+    reader = _PdfUploadReader(file)
+    await context.storage.save_stream(storage_path, reader.chunks())
+
+    try:
         resume = await resumes_repository.create_resume(
             context=context,
             user_id=user_id,
             filename=filename,
             original_filename=original_filename,
-            file_size=file_size,
+            file_size=reader.size,
             mime_type="application/pdf",
             storage_path=storage_path,
             storage_type=context.storage.get_storage_type(),
             media_type="cv",
             title=title,
             description=description,
+            content_hash=reader.sha256.hexdigest(),
         )
-        await context.storage.save_file(storage_path, file_content)
+    except Exception:
+        await context.storage.delete_file(storage_path)
+        raise
 
-    logger.info(f"Resume uploaded successfully: {resume.id} for user {user_id}")
+    logger.info("Resume uploaded", resume_id=resume.id, user_id=user_id)
     return resume
 
 
 async def download_resume(
     context: context.AnyContext, resume_id: str, user_id: str
-) -> tuple[bytes, str]:
-    """Download resume file.
+) -> resume_models.Resume:
+    """Get resume to download and make sure its file is in storage.
+
+    The file itself is not read: the caller streams it from storage.
 
     Returns:
-        Tuple of (file_content, original_filename)
+        Resume record (storage path, mime type, size and filename)
 
     Raises:
         ResumeNotFound: If resume doesn't exist
@@ -125,14 +186,12 @@ async def download_resume(
     """
     resume = await get_resume_by_id(context, resume_id, user_id)
 
-    try:
-        file_content = await context.storage.get_file(resume.storage_path)
-    except FileNotFoundError as e:
+    if not await context.storage.file_exists(resume.storage_path):
         logger.error(f"File not found in storage: {resume.storage_path}")
-        raise resume_exceptions.FileNotFoundInStorage from e
+        raise resume_exceptions.FileNotFoundInStorage
 
-    logger.info(f"Resume downloaded: {resume_id} by user {user_id}")
-    return file_content, resume.original_filename
+    logger.info("Resume downloaded", resume_id=resume_id, user_id=user_id)
+    return resume
 
 
 async def get_user_resumes(
@@ -141,7 +200,9 @@ async def get_user_resumes(
     resumes = await resumes_repository.get_user_resumes(
         context, user_id, only_active=True
     )
-    logger.info(f"Retrieved {len(resumes)} resumes for user {user_id}")
+    logger.debug(
+        "Retrieved resumes", user_id=user_id, resumes_count=len(resumes)
+    )
     return resumes
 
 
@@ -161,6 +222,6 @@ async def delete_resume(
 
     success = await resumes_repository.delete_resume(context, resume_id)
     if success:
-        logger.info(f"Resume deleted: {resume_id} by user {user_id}")
+        logger.info("Resume deleted", resume_id=resume_id, user_id=user_id)
 
     return success
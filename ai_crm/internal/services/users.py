@@ -1,8 +1,39 @@
 from ai_crm.internal.repository.postgresql import users as users_repository
 from ai_crm.pkg import context
+from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.metrics import auth as auth_metrics
 from ai_crm.pkg.models.ai_crm import user as user_models
 from ai_crm.pkg.models.exceptions import postgres as postgres_exceptons
 from ai_crm.pkg.models.exceptions import users as users_exceptions
+from ai_crm.pkg.utils import lru_cache
+from ai_crm.pkg.utils import shared_cache as shared_cache_lib
+
+logger = logger_lib.get_logger(__name__)
+
+_USER_CACHE_TTL = settings.ai_crm_env.API.USER_CACHE_TTL_SECONDS
+_SHARED_USER_KEY_PREFIX = "user:"
+
+# Authenticated users by id. A shared cache only ever gets principals:
+# password hashes stay in the database
+_user_cache: lru_cache.LRUCache[user_models.UserPrincipal] = lru_cache.LRUCache(
+    maxsize=settings.ai_crm_env.API.USER_CACHE_SIZE, ttl=_USER_CACHE_TTL
+)
+_shared_user_cache: shared_cache_lib.SharedCache | None = None
+# Bumped by every invalidation: a user read from the database before it
+# may be stale, so it isn't cached
+_user_cache_generation = 0
+
+
+def set_shared_user_cache(cache: shared_cache_lib.SharedCache | None) -> None:
+    """Keep users in a cache shared by workers, behind the in-process one.
+
+    Args:
+        cache: Shared store, ``None`` to use the in-process cache only.
+    """
+    global _shared_user_cache
+
+    _shared_user_cache = cache
 
 
 async def get_users(context: context.AnyContext) -> list[user_models.User]:
@@ -12,16 +43,37 @@ async def get_users(context: context.AnyContext) -> list[user_models.User]:
 async def create_user(
     context: context.AnyContext, request: user_models.UserCreateRequest
 ) -> user_models.User:
-    return await users_repository.create_user(context, request)
+    try:
+        return await users_repository.create_user(context, request)
+    except postgres_exceptons.EmptyResult as e:
+        raise users_exceptions.UserAlreadyExists from e
 
 
-async def get_user_by_user_id(
+async def get_user_principal(
     context: context.AnyContext, user_id: str
-) -> user_models.User:
-    try:
-        user = await users_repository.get_user_by_id(context, user_id)
-    except postgres_exceptons.EmptyResult as e:
-        raise users_exceptions.UserNotFound from e
+) -> user_models.UserPrincipal:
+    """Get active user by id, served from cache when possible.
+
+    Users are cached for ``API__USER_CACHE_TTL_SECONDS``: every change of a
+    user must call :func:`.invalidate_user`. Until the TTL expires, other
+    workers may still serve their in-process copy, and a shared cache may
+    get back a row another worker read just before the change.
+
+    Raises:
+        UserNotFound: when there is no such user.
+        InactiveUser: when the user is deactivated.
+    """
+    user = await _get_cached_user(user_id)
+    if user is None:
+        generation = _user_cache_generation
+        try:
+            user = await users_repository.get_user_principal_by_id(
+                context, user_id
+            )
+        except postgres_exceptons.EmptyResult as e:
+            raise users_exceptions.UserNotFound from e
+        if generation == _user_cache_generation:
+            await _cache_user(user)
 
     if not user.is_active:
         raise users_exceptions.InactiveUser
@@ -29,6 +81,33 @@ async def get_user_by_user_id(
     return user
 
 
+async def update_password_hash(
+    context: context.AnyContext, user_id: str, password_hash: str
+) -> None:
+    await users_repository.update_password_hash(context, user_id, password_hash)
+    await invalidate_user(user_id)
+
+
+async def invalidate_user(user_id: str) -> None:
+    """Drop cached user after it was updated or deactivated.
+
+    Other workers drop their in-process copy when its TTL expires.
+    """
+    global _user_cache_generation
+
+    _user_cache_generation += 1
+    _user_cache.pop(user_id)
+    if _shared_user_cache is not None:
+        try:
+            await _shared_user_cache.delete(_get_shared_user_key(user_id))
+        except Exception as error:
+            logger.warning(
+                "Failed to invalidate user in shared cache",
+                user_id=user_id,
+                error=repr(error),
+            )
+
+
 async def get_user_by_email(
     context: context.AnyContext, email: str
 ) -> user_models.User:
@@ -41,3 +120,58 @@ async def get_user_by_email(
         raise users_exceptions.InactiveUser
 
     return user
+
+
+async def _get_cached_user(
+    user_id: str,
+) -> user_models.UserPrincipal | None:
+    if not _USER_CACHE_TTL:
+        return None
+
+    user = _user_cache.get(user_id)
+    if user is not None:
+        auth_metrics.USER_CACHE_REQUESTS.labels(result="local").inc()
+        return user
+
+    if _shared_user_cache is not None:
+        try:
+            value = await _shared_user_cache.get(_get_shared_user_key(user_id))
+        except Exception as error:
+            logger.warning(
+                "Failed to get user from shared cache",
+                user_id=user_id,
+                error=repr(error),
+            )
+            value = None
+        if value is not None:
+            auth_metrics.USER_CACHE_REQUESTS.labels(result="shared").inc()
+            user = user_models.UserPrincipal.model_validate_json(value)
+            _user_cache.set(user_id, user)
+            return user
+
+    auth_metrics.USER_CACHE_REQUESTS.labels(result="miss").inc()
+    return None
+
+
+async def _cache_user(user: user_models.UserPrincipal) -> None:
+    if not _USER_CACHE_TTL:
+        return
+
+    _user_cache.set(user.id, user)
+    if _shared_user_cache is not None:
+        try:
+            await _shared_user_cache.set(
+                _get_shared_user_key(user.id),
+                user.model_dump_json(),
+                ttl=_USER_CACHE_TTL,
+            )
+        except Exception as error:
+            logger.warning(
+                "Failed to put user to shared cache",
+                user_id=user.id,
+                error=repr(error),
+            )
+
+
+def _get_shared_user_key(user_id: str) -> str:
+    return f"{_SHARED_USER_KEY_PREFIX}{user_id}"
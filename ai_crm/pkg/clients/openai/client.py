@@ -4,24 +4,20 @@ from typing import TypeVar
 
 from pydantic import BaseModel
 
+from ai_crm.pkg import context
 from ai_crm.pkg.configuration import settings
 from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.metrics import ai as ai_metrics
+from ai_crm.pkg.models.base import exception as base_exceptions
 from ai_crm.pkg.models.exceptions import ai as ai_exceptions
-from openai import AsyncOpenAI
 
 logger = logger_lib.get_logger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
 
-def get_openai_client() -> AsyncOpenAI:
-    """Get configured OpenAI client."""
-    return AsyncOpenAI(
-        api_key=settings.ai_crm_env.API.OPENAI_API_KEY.get_secret_value()
-    )
-
-
 async def parse_with_gpt(
+    context: context.AnyContext,
     response_model: type[T],
     system_prompt: str,
     user_prompt: str,
@@ -29,6 +25,7 @@ async def parse_with_gpt(
     """Parse content using GPT with structured output (json_schema).
 
     Args:
+        context: Application context with shared OpenAI client
         response_model: Pydantic model for response structure
         system_prompt: System prompt for GPT
         user_prompt: User prompt with content
@@ -39,7 +36,7 @@ async def parse_with_gpt(
     Raises:
         OpenAIAPIError: If API call fails
     """
-    client = get_openai_client()
+    client = context.openai.get_client()
 
     model = settings.ai_crm_env.API.OPENAI_MODEL
     max_tokens = settings.ai_crm_env.API.OPENAI_MAX_TOKENS
@@ -73,6 +70,14 @@ async def parse_with_gpt(
         parsed_message = response.choices[0].message
         usage = response.usage
 
+        ai_metrics.observe_openai_request(
+            operation="parse_with_gpt",
+            model=model,
+            status="success",
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0,
+        )
+
         if usage:
             logger.info(
                 f"OpenAI Response [parse_with_gpt]: "
@@ -91,9 +96,12 @@ async def parse_with_gpt(
         )
         return parsed_message.parsed
 
-    except ai_exceptions.BaseAPIException:
+    except base_exceptions.BaseAPIException:
         raise
     except Exception as e:
+        ai_metrics.observe_openai_request(
+            operation="parse_with_gpt", model=model, status="error"
+        )
         logger.exception(
             f"OpenAI API error in parse_with_gpt: {type(e).__name__}: {e}"
         )
@@ -101,6 +109,7 @@ async def parse_with_gpt(
 
 
 async def personalize_with_gpt(
+    context: context.AnyContext,
     response_model: type[T],
     system_prompt: str,
     user_prompt: str,
@@ -108,6 +117,7 @@ async def personalize_with_gpt(
     """Personalize resume using GPT with structured output (json_schema).
 
     Args:
+        context: Application context with shared OpenAI client
         response_model: Pydantic model for response structure
         system_prompt: System prompt for personalization
         user_prompt: User prompt with resume data and job description
@@ -118,7 +128,7 @@ async def personalize_with_gpt(
     Raises:
         OpenAIAPIError: If API call fails
     """
-    client = get_openai_client()
+    client = context.openai.get_client()
 
     model = settings.ai_crm_env.API.OPENAI_MODEL
     max_tokens = settings.ai_crm_env.API.OPENAI_MAX_TOKENS
@@ -152,6 +162,14 @@ async def personalize_with_gpt(
         parsed_message = response.choices[0].message
         usage = response.usage
 
+        ai_metrics.observe_openai_request(
+            operation="personalize_with_gpt",
+            model=model,
+            status="success",
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0,
+        )
+
         if usage:
             logger.info(
                 f"OpenAI Response [personalize_with_gpt]: "
@@ -172,7 +190,12 @@ async def personalize_with_gpt(
         )
         return parsed_message.parsed
 
+    except base_exceptions.BaseAPIException:
+        raise
     except Exception as e:
+        ai_metrics.observe_openai_request(
+            operation="personalize_with_gpt", model=model, status="error"
+        )
         logger.exception(
             f"OpenAI API error in personalize_with_gpt: "
             f"{type(e).__name__}: {e}"
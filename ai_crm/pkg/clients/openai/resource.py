@@ -0,0 +1,80 @@
+"""Shared OpenAI client with a pooled keep-alive HTTP transport."""
+
+import httpx
+
+from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.logger import logger as logger_lib
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+logger = logger_lib.get_logger(__name__)
+
+
+class Resource:
+    """OpenAI client manager that owns a single HTTP connection pool.
+
+    Every AI call must go through :meth:`.get_client`, so TCP/TLS connections
+    to the OpenAI API are reused instead of being opened per request.
+    """
+
+    def __init__(self, client: AsyncOpenAI | None = None):
+        """Initialize OpenAI resource.
+
+        Args:
+            client: Preconfigured client (e.g. a fake for local runs).
+                    When passed, the resource will not create its own one.
+        """
+        self._client: AsyncOpenAI | None = client
+        self._is_external_client = client is not None
+        self._config = settings.ai_crm_env.API
+
+    async def on_startup(self) -> None:
+        if self._client:
+            logger.info("Using externally provided OpenAI client")
+            return
+
+        logger.info(
+            "Initializing OpenAI client",
+            http2=self._config.OPENAI_HTTP2,
+            max_connections=self._config.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                self._config.OPENAI_MAX_KEEPALIVE_CONNECTIONS
+            ),
+        )
+
+        http_client = DefaultAsyncHttpxClient(
+            http2=self._config.OPENAI_HTTP2,
+            limits=httpx.Limits(
+                max_connections=self._config.OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=(
+                    self._config.OPENAI_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                keepalive_expiry=self._config.OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=httpx.Timeout(
+                self._config.OPENAI_TIMEOUT_SECONDS,
+                connect=self._config.OPENAI_CONNECT_TIMEOUT_SECONDS,
+            ),
+        )
+        self._client = AsyncOpenAI(
+            api_key=self._config.OPENAI_API_KEY.get_secret_value(),
+            http_client=http_client,
+            max_retries=self._config.OPENAI_MAX_RETRIES,
+        )
+
+    async def on_shutdown(self) -> None:
+        if not self._client or self._is_external_client:
+            return
+
+        logger.info("Closing OpenAI client connection pool...")
+        try:
+            await self._client.close()
+        except Exception as error:
+            logger.error("Error while closing OpenAI client", error=repr(error))
+        finally:
+            self._client = None
+
+    def get_client(self) -> AsyncOpenAI:
+        if not self._client:
+            raise RuntimeError("OpenAI client is not initialized")
+
+        return self._client
@@ -1,8 +1,26 @@
+import asyncio
 import contextvars
+from typing import TYPE_CHECKING
 
-psql_pool_singleton: contextvars.ContextVar[dict] = contextvars.ContextVar(
-    "_context_vars_psql_pool_singleton"
-)
+import asyncpg
+
+if TYPE_CHECKING:
+    from ai_crm.pkg.connectors.postgresql.consistency import (
+        ConsistencySession,
+    )
+
+# (owner task, connection, read_only) of the PostgreSQL connection in use
+psql_connection: contextvars.ContextVar[
+    tuple[asyncio.Task, asyncpg.Connection, bool] | None
+] = contextvars.ContextVar("_context_vars_psql_connection", default=None)
 read_only: contextvars.ContextVar[bool] = contextvars.ContextVar(
     "_context_vars_read_only"
 )
+# Id of the request (or job) being processed, attached to every log record
+request_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "_context_vars_request_id", default=None
+)
+# WAL positions for read-your-writes of the request being processed
+psql_consistency: contextvars.ContextVar["ConsistencySession | None"] = (
+    contextvars.ContextVar("_context_vars_psql_consistency", default=None)
+)
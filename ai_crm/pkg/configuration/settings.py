@@ -1,9 +1,16 @@
 import pathlib
+from typing import Annotated
 import urllib.parse
 
 from dotenv import find_dotenv
-from pydantic import field_validator
-from pydantic.types import PositiveInt, SecretStr
+from pydantic import Field, field_validator
+from pydantic.types import (
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+    SecretStr,
+)
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from ai_crm.pkg.models import logger
@@ -18,6 +25,25 @@ class Postgresql(BaseSettings):
 
     MIN_CONNECTION: PositiveInt = 1
     MAX_CONNECTION: PositiveInt = 16
+    # Waiting longer for a free connection fails the request with 503
+    ACQUIRE_TIMEOUT_SECONDS: PositiveFloat = 5.0
+    COMMAND_TIMEOUT_SECONDS: PositiveFloat = 30.0
+
+    # How often pool gauges are exported to Prometheus
+    POOL_METRICS_INTERVAL_SECONDS: PositiveFloat = 5.0
+
+    # Hosts are rechecked in background: role changes, outages and lag
+    HEALTH_CHECK_INTERVAL_SECONDS: PositiveFloat = 5.0
+    HEALTH_CHECK_TIMEOUT_SECONDS: PositiveFloat = 3.0
+    # Replicas lagging more are out of rotation until back under READMIT
+    MAX_REPLICATION_LAG_SECONDS: PositiveFloat = 10.0
+    REPLICA_READMIT_LAG_SECONDS: NonNegativeFloat = 5.0
+    # Reads after a write of the same user only go to replicas caught up
+    # with it; positions are kept for this many users per process
+    READ_YOUR_WRITES: bool = True
+    READ_YOUR_WRITES_CACHE_SIZE: PositiveInt = 100_000
+    # Validate rows of trusted repository functions too (debug, tests)
+    VALIDATE_TRUSTED_ROWS: bool = False
 
     def get_hosts_list(self) -> list[str]:
         if self.HOSTS:
@@ -30,8 +56,16 @@ class Postgresql(BaseSettings):
 
 
 class Logging(BaseSettings):
-    LEVEL: logger.LoggerLevel = logger.LoggerLevel.DEBUG
+    LEVEL: logger.LoggerLevel = logger.LoggerLevel.INFO
+    FORMAT: logger.LoggerFormat = logger.LoggerFormat.TEXT
     FOLDER_PATH: pathlib.Path = pathlib.Path("./logs")
+    # Records waiting for the writer thread, extra ones are dropped
+    QUEUE_SIZE: PositiveInt = 10_000
+
+    # Per logger (applies to its children too) limits of DEBUG/INFO records:
+    # share of records to keep and max records per second
+    SAMPLING: dict[str, Annotated[float, Field(ge=0, le=1)]] = {}
+    RATE_LIMITS: dict[str, PositiveFloat] = {}
 
     @field_validator("FOLDER_PATH")
     @classmethod
@@ -50,6 +84,8 @@ class APIServer(BaseSettings):
 
     # --- SECURITY SETTINGS ---
     X_ACCESS_TOKEN: SecretStr = SecretStr("secret")
+    # Cost of password hashes; hashes of another cost are updated on login
+    BCRYPT_ROUNDS: Annotated[int, Field(ge=4, le=31)] = 12
 
     # --- JWT SETTINGS ---
     JWT_SECRET_KEY: SecretStr = SecretStr(
@@ -58,6 +94,23 @@ class APIServer(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_SECONDS: PositiveInt = 1800  # 30 min
     REFRESH_TOKEN_EXPIRE_SECONDS: PositiveInt = 604_800  # 7 days
+    # Authenticated users are cached by id; 0 disables the cache. Other
+    # workers see updates of a user at most this late
+    USER_CACHE_TTL_SECONDS: NonNegativeFloat = 30.0
+    USER_CACHE_SIZE: PositiveInt = 10_000
+    # Verified tokens are cached until they expire; 0 disables the cache
+    TOKEN_CACHE_SIZE: NonNegativeInt = 10_000
+
+    # --- RATE LIMIT SETTINGS ---
+    # Token buckets: BURST attempts at once, PER_MINUTE in the long run
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_CACHE_SIZE: PositiveInt = 100_000
+    # Register, login and refresh by client IP
+    AUTH_IP_RATE_PER_MINUTE: PositiveFloat = 60.0
+    AUTH_IP_BURST: PositiveInt = 20
+    # Login by email, whatever the IP
+    LOGIN_EMAIL_RATE_PER_MINUTE: PositiveFloat = 5.0
+    LOGIN_EMAIL_BURST: PositiveInt = 5
 
     # --- OPENAI SETTINGS ---
     OPENAI_API_KEY: SecretStr = SecretStr("sk-your-api-key")
@@ -65,6 +118,40 @@ class APIServer(BaseSettings):
     OPENAI_MAX_TOKENS: PositiveInt = 4096
     OPENAI_TEMPERATURE: float = 0.7
 
+    # --- OPENAI HTTP POOL SETTINGS ---
+    OPENAI_HTTP2: bool = True
+    OPENAI_MAX_CONNECTIONS: PositiveInt = 100
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: PositiveInt = 20
+    OPENAI_KEEPALIVE_EXPIRY_SECONDS: PositiveFloat = 30.0
+    OPENAI_TIMEOUT_SECONDS: PositiveFloat = 120.0
+    OPENAI_CONNECT_TIMEOUT_SECONDS: PositiveFloat = 5.0
+    OPENAI_MAX_RETRIES: NonNegativeInt = 2
+
+    # --- AI CACHE SETTINGS ---
+    PARSED_RESUME_CACHE_SIZE: PositiveInt = 256
+
+
+class Executor(BaseSettings):
+    PROCESS_POOL_SIZE: PositiveInt = 2
+    TASK_TIMEOUT_SECONDS: PositiveFloat = 60.0
+    SHUTDOWN_TIMEOUT_SECONDS: PositiveFloat = 30.0
+    # Threads hashing passwords; requests over the queue get 429
+    PASSWORD_POOL_SIZE: PositiveInt = 2
+    PASSWORD_QUEUE_SIZE: NonNegativeInt = 32
+
+
+class Jobs(BaseSettings):
+    # Run the personalization worker inside the API process (local mode)
+    RUN_IN_API: bool = False
+    WORKER_CONCURRENCY: PositiveInt = 2
+    POLL_INTERVAL_SECONDS: PositiveFloat = 1.0
+    JOB_TIMEOUT_SECONDS: PositiveFloat = 300.0
+    # Must exceed JOB_TIMEOUT_SECONDS, otherwise a live job can be reclaimed
+    LEASE_SECONDS: PositiveFloat = 600.0
+    MAX_ATTEMPTS: PositiveInt = 3
+    # Port of the standalone worker's /metrics server, 0 disables it
+    METRICS_PORT: NonNegativeInt = 9100
+
 
 class Centrifugo(BaseSettings):
     HOST: str = "localhost"
@@ -80,6 +167,8 @@ class Settings(BaseSettings):
 
     # --- OTHER SETTINGS ---
     LOGGER: Logging
+    EXECUTOR: Executor = Field(default_factory=Executor)
+    JOBS: Jobs = Field(default_factory=Jobs)
 
     # --- DATA VOLUME ---
     DATA_VOLUME: pathlib.Path = pathlib.Path("./volume")
@@ -0,0 +1,114 @@
+"""Read-your-writes consistency of reads served by replicas.
+
+After a write, the WAL position (LSN) of the master is remembered for the
+current request and for the key it is bound to (the user). Later reads go
+to a replica only if it has replayed past that position, otherwise to the
+master. Reads of everyone else stay on replicas.
+
+Positions of keys live in the memory of the process. The API also returns
+the position to the client as a consistency token: sending it back makes
+the guarantee hold when the next request lands on another process.
+"""
+
+from collections.abc import Hashable
+import contextvars
+
+from ai_crm.pkg.configuration import context_vars, settings
+from ai_crm.pkg.utils.lru_cache import LRUCache
+
+# Position of the last write; the commit record is at or before it
+WRITE_LSN_QUERY = "SELECT pg_current_wal_lsn();"
+
+_last_writes: LRUCache[int] = LRUCache(
+    settings.ai_crm_env.POSTGRES.READ_YOUR_WRITES_CACHE_SIZE
+)
+
+
+class ConsistencySession:
+    """WAL positions seen by one request.
+
+    Mutable, so positions recorded in a copied context (sync dependencies,
+    child tasks) are still seen by the request.
+    """
+
+    def __init__(self, min_lsn: int | None = None):
+        self.key: Hashable | None = None
+        # Reads must see at least this position
+        self.min_lsn = min_lsn
+        # Position after the writes of the request
+        self.write_lsn: int | None = None
+
+
+def start_session(min_lsn: int | None = None) -> contextvars.Token:
+    """Track writes of the current request.
+
+    Args:
+        min_lsn: Position the client has already seen (consistency token).
+    """
+    return context_vars.psql_consistency.set(ConsistencySession(min_lsn))
+
+
+def end_session(token: contextvars.Token) -> None:
+    context_vars.psql_consistency.reset(token)
+
+
+def get_session() -> ConsistencySession | None:
+    return context_vars.psql_consistency.get()
+
+
+def bind_key(key: Hashable) -> None:
+    """Share positions of the request with others bound to the same key."""
+    session = get_session()
+    if session is None:
+        return
+
+    session.key = key
+    session.min_lsn = _max_lsn(session.min_lsn, _last_writes.get(key))
+
+
+def get_min_lsn() -> int | None:
+    """Get position a replica must have replayed to serve reads."""
+    session = get_session()
+    return session.min_lsn if session else None
+
+
+def is_tracking() -> bool:
+    return get_session() is not None
+
+
+def record_write(lsn: int) -> None:
+    session = get_session()
+    if session is None:
+        return
+
+    session.write_lsn = _max_lsn(session.write_lsn, lsn)
+    session.min_lsn = _max_lsn(session.min_lsn, lsn)
+    if session.key is not None:
+        _last_writes.set(
+            session.key, _max_lsn(_last_writes.get(session.key), lsn)
+        )
+
+
+def parse_lsn(value: str) -> int:
+    """Parse LSN in PostgreSQL text format, e.g. ``16/B374D848``.
+
+    Raises:
+        ValueError: If the value is not an LSN.
+    """
+    high, low = value.split("/")
+    lsn = (int(high, 16) << 32) + int(low, 16)
+    if not 0 <= lsn < 2**64:
+        raise ValueError(f"LSN out of range: {value}")
+    return lsn
+
+
+def format_lsn(lsn: int) -> str:
+    return f"{lsn >> 32:X}/{lsn & 0xFFFFFFFF:X}"
+
+
+def _max_lsn(first: int | None, second: int | None) -> int | None:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return max(first, second)
@@ -1,46 +1,241 @@
+import asyncio
+from collections.abc import AsyncIterator
+import contextlib
+import time
+
 import asyncpg
 
 from ai_crm.pkg.configuration import settings
 from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.metrics import postgresql as postgresql_metrics
+from ai_crm.pkg.models.exceptions import postgres as postgres_exceptions
 
 logger = logger_lib.get_logger(__name__)
 
-CHECK_SLAVE_QUERY = "SELECT pg_is_in_recovery() as is_in_recovery, NOW() - pg_last_xact_replay_timestamp() as replication_delay;"
+# A replica that has replayed everything it received isn't lagging, even if
+# the last replayed transaction is old (no writes on the master)
+CHECK_SLAVE_QUERY = """
+SELECT
+    pg_is_in_recovery() AS is_in_recovery,
+    CASE
+        WHEN NOT pg_is_in_recovery()
+          OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM NOW() - pg_last_xact_replay_timestamp()), 0
+        )
+    END::float8 AS replication_delay,
+    CASE
+        WHEN pg_is_in_recovery() THEN pg_last_wal_replay_lsn()
+        ELSE pg_current_wal_lsn()
+    END AS replay_lsn;
+"""
+
+# Weight of the newest sample in the moving average of host latency
+LATENCY_EWMA_ALPHA = 0.2
 
 
 class PostgreSQLHost:
     host: str
     dsn: str
     is_master: bool = False
-    replication_delay: int = 0
+    # Seconds the replica is behind the master
+    replication_delay: float = 0.0
+    # WAL position the host has applied, as of the last check
+    replay_lsn: int | None = None
     is_healthy: bool = False
+    # Replica taken out of rotation because of replication lag
+    is_lagging: bool = False
+    last_error: str | None = None
+    last_checked_at: float | None = None
+    # Requests acquiring or holding a connection of the host
+    outstanding: int = 0
+    # Moving average of seconds a request or a health probe holds the host,
+    # wait included
+    latency_ewma: float | None = None
     pool: asyncpg.Pool | None = None
 
     def __init__(self, host: str):
         self.host = host
         self.dsn = settings.ai_crm_env.POSTGRES.build_dsn_for_host(host)
         self.is_master = False
-        self.replication_delay = 0
+        self.replication_delay = 0.0
+        self.replay_lsn = None
         self.is_healthy = False
+        self.is_lagging = False
+        self.last_error = None
+        self.last_checked_at = None
+        self.outstanding = 0
+        self.latency_ewma = None
         self.pool = None
 
-    async def open_pool_and_fill_status(self) -> bool:
-        self.pool = await self.get_pool()
-        self.is_healthy = False
-        self.is_master = False
-        self.replication_delay = 0
+    @property
+    def role(self) -> str:
+        return "master" if self.is_master else "slave"
+
+    async def open_pool_and_fill_status(self, timeout: float = 10) -> None:
+        """Open pool if needed and refresh role, health and lag of the host.
+
+        The probe takes a connection straight from the pool, so it doesn't
+        count as a request in the load of the host. Its round-trip is a
+        latency sample, so the average of a replica without traffic follows
+        the host: a recovered one gets reads back, a saturated one stops
+        looking free. A host whose pool has all connections open and taken
+        for ``timeout`` is busy, not down: its last status is kept.
+
+        Raises:
+            Exception: If the host can't be reached. The host is marked as
+                unhealthy, its role and lag are kept as last seen.
+        """
+        self.last_checked_at = time.monotonic()
 
         try:
-            async with self.pool.acquire(timeout=10) as new_connection:
-                result = await new_connection.fetchrow(CHECK_SLAVE_QUERY)
-                self.is_healthy = True
-                self.is_master = not result["is_in_recovery"]
-                self.replication_delay = result["replication_delay"]
+            self.pool = await asyncio.wait_for(self.get_pool(), timeout)
+            started_at = time.perf_counter()
+            connection = await self.pool.acquire(timeout=timeout)
+        except TimeoutError as error:
+            if self._is_pool_saturated():
+                # A request would have waited at least as long
+                self.record_latency(timeout)
+                logger.warning(
+                    "Host is too busy to check, keeping last status",
+                    host=self.host,
+                    is_healthy=self.is_healthy,
+                )
+                return
+            self._mark_unhealthy(error)
+            raise error
         except Exception as error:
-            logger.error(
-                f"Error checking host {self.host} role: {str(type(error))}: {error}"
+            self._mark_unhealthy(error)
+            raise error
+
+        try:
+            result = await connection.fetchrow(
+                CHECK_SLAVE_QUERY, timeout=timeout
             )
+        except Exception as error:
+            self._mark_unhealthy(error)
             raise error
+        finally:
+            await self.pool.release(connection)
+
+        self.record_latency(time.perf_counter() - started_at)
+        self.is_healthy = True
+        self.is_master = not result["is_in_recovery"]
+        self.replication_delay = result["replication_delay"]
+        self.replay_lsn = result["replay_lsn"]
+        self.last_error = None
+
+    def _is_pool_saturated(self) -> bool:
+        pool = self.pool
+        return (
+            pool is not None
+            and pool.get_idle_size() == 0
+            and pool.get_size() >= pool.get_max_size()
+        )
+
+    def _mark_unhealthy(self, error: Exception) -> None:
+        self.is_healthy = False
+        self.last_error = f"{type(error).__name__}: {error}"
+        logger.error(
+            "Error checking host role",
+            host=self.host,
+            error=self.last_error,
+        )
+
+    @contextlib.asynccontextmanager
+    async def acquire(
+        self, timeout: float | None = None
+    ) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire connection, tracking load and latency of the host.
+
+        Args:
+            timeout: Max seconds to wait for a free connection, defaults to
+                :attr:`.Settings.POSTGRES.ACQUIRE_TIMEOUT_SECONDS`.
+
+        Raises:
+            PoolAcquireTimeout: If no connection got free in time.
+        """
+        pool = self.pool
+        if not pool:
+            raise RuntimeError(f"Pool of PostgreSQL host {self.host} is closed")
+
+        if timeout is None:
+            timeout = settings.ai_crm_env.POSTGRES.ACQUIRE_TIMEOUT_SECONDS
+        labels = {"host": self.host, "role": self.role}
+
+        self.outstanding += 1
+        started_at = time.perf_counter()
+        try:
+            try:
+                conn = await pool.acquire(timeout=timeout)
+            except TimeoutError as error:
+                postgresql_metrics.POOL_ACQUIRE_TIMEOUTS.labels(**labels).inc()
+                raise postgres_exceptions.PoolAcquireTimeout from error
+            finally:
+                postgresql_metrics.POOL_ACQUIRE_WAIT.labels(**labels).observe(
+                    time.perf_counter() - started_at
+                )
+
+            try:
+                yield conn
+            finally:
+                await pool.release(conn)
+        finally:
+            self.outstanding -= 1
+
+        # Only successful requests: failing fast must not look like speed
+        self.record_latency(time.perf_counter() - started_at)
+
+    def record_latency(self, seconds: float) -> None:
+        if self.latency_ewma is None:
+            self.latency_ewma = seconds
+        else:
+            self.latency_ewma += LATENCY_EWMA_ALPHA * (
+                seconds - self.latency_ewma
+            )
+
+    def has_replayed(self, lsn: int | None) -> bool:
+        """Check whether writes up to ``lsn`` are visible on the host."""
+        if lsn is None or self.is_master:
+            return True
+        return self.replay_lsn is not None and self.replay_lsn >= lsn
+
+    def get_load(self) -> int:
+        """Get number of requests in flight on the host.
+
+        Own counter includes requests waiting for a connection, pool usage
+        includes connections taken by others (health checks, metrics).
+        """
+        pool = self.pool
+        in_use = pool.get_size() - pool.get_idle_size() if pool else 0
+        return max(self.outstanding, in_use)
+
+    def get_expected_latency(self) -> float:
+        """Estimate seconds a new request would take on the host.
+
+        Requests in flight are ahead of the new one, so the average latency
+        is scaled by the load. A host without samples yet costs nothing, so
+        it gets probed first.
+        """
+        return (self.get_load() + 1) * (self.latency_ewma or 0.0)
+
+    def get_info(self) -> dict[str, str | bool | int | float | None]:
+        """Get status of the host as seen by the last check."""
+        return {
+            "host": self.host,
+            "role": self.role,
+            "is_healthy": self.is_healthy,
+            "is_lagging": self.is_lagging,
+            "replication_delay": self.replication_delay,
+            "outstanding": self.outstanding,
+            "latency_ewma": self.latency_ewma,
+            "last_error": self.last_error,
+            "seconds_since_check": (
+                time.monotonic() - self.last_checked_at
+                if self.last_checked_at is not None
+                else None
+            ),
+        }
 
     async def get_pool(self) -> asyncpg.Pool:
         if self.pool:
@@ -50,9 +245,25 @@ class PostgreSQLHost:
             dsn=self.dsn,
             min_size=settings.ai_crm_env.POSTGRES.MIN_CONNECTION,
             max_size=settings.ai_crm_env.POSTGRES.MAX_CONNECTION,
-            command_timeout=30,
+            command_timeout=settings.ai_crm_env.POSTGRES.COMMAND_TIMEOUT_SECONDS,
         )
 
+    def get_pool_stats(self) -> dict[str, str | bool | int | float]:
+        """Get pool usage snapshot, labelled by host and role."""
+        pool = self.pool
+        size = pool.get_size() if pool else 0
+        idle = pool.get_idle_size() if pool else 0
+        return {
+            "host": self.host,
+            "role": self.role,
+            "is_healthy": self.is_healthy,
+            "replication_delay": self.replication_delay,
+            "size": size,
+            "idle": idle,
+            "max_size": pool.get_max_size() if pool else 0,
+            "waiting": max(self.outstanding - (size - idle), 0),
+        }
+
     async def close_pool(self) -> None:
         if self.pool:
             await self.pool.close()
@@ -1,64 +1,146 @@
+"""Connections to PostgreSQL bound to the current task.
+
+Single statements don't need a transaction: reads run in autocommit mode
+on a replica, so a ``SELECT`` is one round-trip instead of three
+(``BEGIN``/query/``COMMIT``). Writes keep a transaction on the master.
+Several statements that must be atomic (or see one snapshot) go into an
+explicit :func:`transaction` scope; every :func:`get_connection` inside it
+reuses its connection::
+
+    async with psql.transaction(context):
+        user = await users_repository.get_user_by_id(context, user_id)
+        await resumes_repository.create_resume(context, ...)
+
+Reads after writes of the same user only go to replicas that have replayed
+them, see :mod:`.consistency`.
+"""
+
 import asyncio
+from collections.abc import AsyncIterator
 import contextlib
 
+import asyncpg
+
 from ai_crm.pkg import context
 from ai_crm.pkg.configuration import context_vars
+from ai_crm.pkg.connectors.postgresql import consistency
 from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.models.consts import postgres as psql_consts
 
 logger = logger_lib.get_logger(__name__)
 
 
-def _get_task_hash() -> int:
-    task = asyncio.current_task()
-    return hash(task)
+def _get_psql_pool_context() -> tuple[asyncpg.Connection | None, bool]:
+    bound = context_vars.psql_connection.get()
+    # Child tasks inherit the context, but must not share the connection:
+    # asyncpg connections can't run concurrent queries
+    if bound is None or bound[0] is not asyncio.current_task():
+        return None, False
 
+    _, conn, read_only = bound
+    return conn, read_only
 
-def _get_psql_pool_context():
-    psql_singleton_dict = context_vars.psql_pool_singleton.get({})
-    task_id = _get_task_hash()
 
-    conn, read_only_mode = psql_singleton_dict.get(task_id, (None, None))
-    logger.debug(f"task_id={task_id}, conn={conn}")
+@contextlib.asynccontextmanager
+async def _bind_connection(
+    conn: asyncpg.Connection, read_only: bool
+) -> AsyncIterator[None]:
+    """Make ``conn`` the connection of the task, restoring the outer one."""
+    token = context_vars.psql_connection.set(
+        (asyncio.current_task(), conn, read_only)
+    )
+    try:
+        yield
+    finally:
+        context_vars.psql_connection.reset(token)
 
-    return conn, read_only_mode
 
+@contextlib.asynccontextmanager
+async def get_connection(
+    context: context.AnyContext, read_only: bool = False
+) -> AsyncIterator[asyncpg.Connection]:
+    """Get connection of the current task or acquire a new one.
+
+    Args:
+        context: Context with the PostgreSQL resource.
+        read_only: Statements only read. Such a connection is taken from a
+            replica and runs in autocommit mode, without a transaction.
+
+    Notes:
+        A connection already used by the task is reused, unless it is a
+        read-only one and the caller is going to write.
+    """
+    current_conn, current_read_only = _get_psql_pool_context()
+
+    if current_conn and (read_only or not current_read_only):
+        logger.debug("Using existing connection")
+        yield current_conn
+        return
 
-def _set_psql_pool_context(conn, read_only_mode):
-    psql_singleton_dict = context_vars.psql_pool_singleton.get({})
-    task_id = _get_task_hash()
+    logger.debug("Creating a new connection", read_only=read_only)
+    async with context.postgresql.acquire(
+        read_only, min_lsn=consistency.get_min_lsn()
+    ) as new_connection:
+        async with _bind_connection(new_connection, read_only):
+            if read_only:
+                yield new_connection
+                return
 
-    psql_singleton_dict[task_id] = (conn, read_only_mode)
-    context_vars.psql_pool_singleton.set(psql_singleton_dict)
+            async with new_connection.transaction():
+                yield new_connection
+            await _record_write(new_connection)
 
 
 @contextlib.asynccontextmanager
-async def get_connection(context: context.AnyContext, read_only=False):
-    current_conn, read_only_mode = _get_psql_pool_context()
+async def transaction(
+    context: context.AnyContext,
+    isolation: psql_consts.IsolationLevel | None = None,
+    readonly: bool = False,
+    deferrable: bool = False,
+) -> AsyncIterator[asyncpg.Connection]:
+    """Run statements of the scope in one transaction.
 
-    if current_conn:
-        logger.info("using existing connection")
-        yield current_conn
-    else:
-        logger.info(
-            "creating a new RO connection"
-            if read_only
-            else "creating a new connection"
-        )
-        pool = context.postgresql.get_pool(read_only)
-
-        async with pool.acquire() as new_connection:
-            try:
-                transaction = new_connection.transaction()
-                await transaction.start()
-                # Save the conn and connection mode to use in nesting
-                _set_psql_pool_context(new_connection, read_only)
+    Nested scopes become savepoints of the outer transaction.
+
+    Args:
+        context: Context with the PostgreSQL resource.
+        isolation: Isolation level, the server default if not set.
+        readonly: ``READ ONLY`` transaction, served by a replica.
+        deferrable: ``DEFERRABLE``, only matters for serializable read-only
+            transactions: waits for a snapshot that can't fail on conflicts.
+
+    Notes:
+        Serializable transactions aren't available on hot standby servers,
+        so they always use the master.
+    """
+    current_conn, current_read_only = _get_psql_pool_context()
+
+    if current_conn and (readonly or not current_read_only):
+        # A savepoint, or the first transaction of an autocommit connection
+        async with current_conn.transaction(
+            isolation=isolation, readonly=readonly, deferrable=deferrable
+        ):
+            yield current_conn
+        return
+
+    use_replica = (
+        readonly and isolation != psql_consts.IsolationLevel.SERIALIZABLE
+    )
+    async with context.postgresql.acquire(
+        use_replica, min_lsn=consistency.get_min_lsn()
+    ) as new_connection:
+        async with _bind_connection(new_connection, readonly):
+            async with new_connection.transaction(
+                isolation=isolation, readonly=readonly, deferrable=deferrable
+            ):
                 yield new_connection
-                await transaction.commit()
-            except Exception as error:
-                logger.warning(
-                    f"an error occured: {error}, rolling back transaction {transaction}"
-                )
-                await transaction.rollback()
-                raise error
-            finally:
-                _set_psql_pool_context(None, None)
+            if not readonly:
+                await _record_write(new_connection)
+
+
+async def _record_write(conn: asyncpg.Connection) -> None:
+    """Remember position of the committed write for read-your-writes."""
+    if consistency.is_tracking():
+        consistency.record_write(
+            await conn.fetchval(consistency.WRITE_LSN_QUERY)
+        )
@@ -1,8 +1,14 @@
+import asyncio
+from collections.abc import AsyncIterator
+import contextlib
+import math
+
 import asyncpg
 
 from ai_crm.pkg.configuration import settings
 from ai_crm.pkg.connectors.postgresql.host import PostgreSQLHost
 from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.metrics import postgresql as postgresql_metrics
 
 logger = logger_lib.get_logger(__name__)
 
@@ -16,6 +22,8 @@ class Resource:
         self._slave_hosts: list[PostgreSQLHost] = []
         self._slave_round_robin_index: int = 0
         self._config = settings.ai_crm_env.POSTGRES
+        self._metrics_task: asyncio.Task | None = None
+        self._health_check_task: asyncio.Task | None = None
 
     async def on_startup(self) -> None:
         logger.info("Initializing PostgreSQL connection pools...")
@@ -28,6 +36,9 @@ class Resource:
             )
             raise error
 
+        self._metrics_task = asyncio.create_task(self._export_pool_metrics())
+        self._health_check_task = asyncio.create_task(self._check_health())
+
         logger.info(
             f"PostgreSQL pools initialized successfully. Master: {self._master_host.host if self._master_host else 'None'}, Slaves: {[h.host for h in self._slave_hosts]}"
         )
@@ -35,6 +46,14 @@ class Resource:
     async def on_shutdown(self) -> None:
         logger.info("Closing PostgreSQL connection pools...")
 
+        for task in (self._health_check_task, self._metrics_task):
+            if task:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._health_check_task = None
+        self._metrics_task = None
+
         for host in self._hosts:
             try:
                 logger.info(f"Closing pool for {host.host}")
@@ -61,16 +80,8 @@ class Resource:
                     f"Failed to open pool and fill status for host {host}: {str(type(error))}: {error}"
                 )
 
-            if not pg_host.is_healthy:
-                logger.warning(f"Host {host} is unhealthy, skipping...")
-                continue
-
-            if pg_host.is_master:
-                self._master_host = pg_host
-                logger.info(f"Host {host}: Master")
-            else:
-                self._slave_hosts.append(pg_host)
-                logger.info(f"Host {host}: Slave")
+        # Unhealthy hosts are kept: the health check will admit them later
+        self._update_roles()
 
         if not self._master_host:
             raise RuntimeError(
@@ -78,42 +89,187 @@ class Resource:
             )
 
     def get_pool(self, read_only: bool = False) -> asyncpg.Pool:
-        """Get connection pool with master/slave selection and RoundRobin for slaves."""
+        """Get connection pool of the host :meth:`.acquire` would use."""
+        return self._get_host(read_only).pool
+
+    @contextlib.asynccontextmanager
+    async def acquire(
+        self, read_only: bool = False, min_lsn: int | None = None
+    ) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire connection of the master, or of a replica for reads.
+
+        Args:
+            read_only: Connection is used for reads only.
+            min_lsn: WAL position the reads must see. Replicas that haven't
+                replayed it yet are skipped.
+        """
+        async with self._get_host(read_only, min_lsn).acquire() as conn:
+            yield conn
+
+    def _get_host(
+        self, read_only: bool, min_lsn: int | None = None
+    ) -> PostgreSQLHost:
         if read_only:
-            return self._get_slave_pool_round_robin()
-        else:
-            return self._get_master_pool()
+            slave = self._select_slave(min_lsn)
+            if slave:
+                logger.debug("Using slave", host=slave.host)
+                return slave
 
-    def _get_master_pool(self) -> asyncpg.Pool:
+            if min_lsn is None or not self._slave_hosts:
+                logger.warning(
+                    "No healthy slave pools available, falling back to master"
+                )
+            else:
+                logger.debug("No slave replayed recent writes, using master")
+
+        return self._get_master_host()
+
+    def _get_master_host(self) -> PostgreSQLHost:
         if not self._master_host or not self._master_host.pool:
             raise RuntimeError(
                 "Master PostgreSQL pool is not initialized or unhealthy"
             )
 
-        logger.debug(f"Using master pool: {self._master_host.host}")
-        return self._master_host.pool
+        logger.debug("Using master", host=self._master_host.host)
+        return self._master_host
 
-    def _get_slave_pool_round_robin(self) -> asyncpg.Pool:
-        healthy_slaves = [
-            s for s in self._slave_hosts if s.is_healthy and s.pool
-        ]
+    def _select_slave(
+        self, min_lsn: int | None = None
+    ) -> PostgreSQLHost | None:
+        """Pick replica with the lowest expected latency.
 
-        if not healthy_slaves:
-            logger.warning(
-                "No healthy slave pools available, falling back to master"
-            )
-            return self._get_master_pool()
+        A replica that is saturated or slow costs more than an idle one, so
+        it gets less traffic until it recovers.
+        """
+        slaves = self._slave_hosts
+        if not slaves:
+            return None
 
-        # Round-robin selection
-        selected_slave = healthy_slaves[
-            self._slave_round_robin_index % len(healthy_slaves)
-        ]
+        # Rotate the start, so equally loaded replicas share the traffic
         self._slave_round_robin_index = (
             self._slave_round_robin_index + 1
-        ) % len(healthy_slaves)
+        ) % len(slaves)
+
+        selected, selected_cost = None, math.inf
+        for offset in range(len(slaves)):
+            slave = slaves[
+                (self._slave_round_robin_index + offset) % len(slaves)
+            ]
+            if not slave.has_replayed(min_lsn):
+                continue
+
+            cost = slave.get_expected_latency()
+            if cost < selected_cost:
+                selected, selected_cost = slave, cost
+
+        return selected
+
+    async def _export_pool_metrics(self) -> None:
+        while True:
+            for host in self._hosts:
+                try:
+                    postgresql_metrics.set_pool_stats(**host.get_pool_stats())
+                except Exception as error:
+                    logger.error(
+                        "Failed to export pool metrics",
+                        host=host.host,
+                        error=repr(error),
+                    )
+
+            await asyncio.sleep(self._config.POOL_METRICS_INTERVAL_SECONDS)
 
-        logger.debug(f"Using slave pool (RR): {selected_slave.host}")
-        return selected_slave.pool
+    async def _check_health(self) -> None:
+        """Refresh status of every host and reroute traffic accordingly."""
+        while True:
+            await asyncio.sleep(self._config.HEALTH_CHECK_INTERVAL_SECONDS)
+
+            # The loop must survive a bug, or routing freezes until restart
+            try:
+                await asyncio.gather(
+                    *(self._check_host(host) for host in self._hosts)
+                )
+                self._update_roles()
+            except Exception:
+                logger.exception("Failed to check health of PostgreSQL hosts")
+
+    async def _check_host(self, host: PostgreSQLHost) -> None:
+        # Errors are logged and recorded by the host
+        with contextlib.suppress(Exception):
+            await host.open_pool_and_fill_status(
+                timeout=self._config.HEALTH_CHECK_TIMEOUT_SECONDS
+            )
+
+    def _update_roles(self) -> None:
+        """Pick the master and the replicas in rotation from host statuses."""
+        masters = [h for h in self._hosts if h.is_healthy and h.is_master]
+        # On a split brain keep the current master, to not flip-flop writes
+        master = (
+            self._master_host
+            if self._master_host in masters
+            else next(iter(masters), None)
+        )
+        if master is None and self._master_host is not None:
+            # Writes failing on the old master beat having nowhere to send
+            # them; it is replaced once another master is seen healthy
+            logger.error(
+                "No healthy PostgreSQL master, keeping the last one",
+                master=self._master_host.host,
+                last_error=self._master_host.last_error,
+            )
+            master = self._master_host
+        if master is not self._master_host:
+            # Expected at startup, an incident later
+            log = logger.warning if self._master_host else logger.info
+            log(
+                "PostgreSQL master changed",
+                old_master=self._master_host.host
+                if self._master_host
+                else None,
+                new_master=master.host if master else None,
+            )
+            self._master_host = master
+
+        slaves = []
+        for host in self._hosts:
+            if host is master or not host.is_healthy or host.is_master:
+                continue
+
+            self._update_lagging(host)
+            if not host.is_lagging:
+                slaves.append(host)
+
+        if slaves != self._slave_hosts:
+            logger.info(
+                "PostgreSQL replicas in rotation changed",
+                slaves=[h.host for h in slaves],
+            )
+            self._slave_hosts = slaves
+
+    def _update_lagging(self, host: PostgreSQLHost) -> None:
+        # Lower threshold to come back, so a replica near the limit doesn't
+        # flap in and out of rotation
+        if (
+            not host.is_lagging
+            and host.replication_delay
+            > self._config.MAX_REPLICATION_LAG_SECONDS
+        ):
+            host.is_lagging = True
+            logger.warning(
+                "Replica ejected because of replication lag",
+                host=host.host,
+                replication_delay=host.replication_delay,
+            )
+        elif (
+            host.is_lagging
+            and host.replication_delay
+            <= self._config.REPLICA_READMIT_LAG_SECONDS
+        ):
+            host.is_lagging = False
+            logger.info(
+                "Replica readmitted after catching up",
+                host=host.host,
+                replication_delay=host.replication_delay,
+            )
 
     def get_hosts_info(self) -> dict[str, any]:
         return {
@@ -121,4 +277,5 @@ class Resource:
             "slaves": [s.host for s in self._slave_hosts],
             "total_hosts": len(self._hosts),
             "healthy_hosts": len([h for h in self._hosts if h.is_healthy]),
+            "hosts": [h.get_info() for h in self._hosts],
         }
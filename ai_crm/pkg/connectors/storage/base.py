@@ -1,6 +1,8 @@
 """Base storage interface for file operations."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
 
 
 class BaseStorage(ABC):
@@ -17,6 +19,25 @@ class BaseStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_stream(
+        self, file_path: str, chunks: AsyncIterable[bytes]
+    ) -> str:
+        """Save file to storage chunk by chunk.
+
+        The file appears in storage only once ``chunks`` is exhausted. If
+        iterating ``chunks`` raises, nothing is saved and the error is
+        propagated.
+
+        Args:
+            file_path: Relative path where file should be saved
+            chunks: File content chunks
+
+        Returns:
+            Storage path of saved file
+        """
+        pass
+
     @abstractmethod
     async def get_file(self, file_path: str) -> bytes:
         """Retrieve file from storage.
@@ -29,6 +50,38 @@ class BaseStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def open_stream(
+        self, file_path: str, chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[bytes]:
+        """Read file from storage chunk by chunk.
+
+        Args:
+            file_path: Path to file in storage
+            chunk_size: Max size of a chunk in bytes
+
+        Returns:
+            Async iterator over file chunks
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        pass
+
+    def local_path(self, file_path: str) -> Path | None:
+        """Get path of file on the local filesystem.
+
+        Storages keeping files on local disk return a path, so the file can
+        be sent without reading it into memory (sendfile).
+
+        Args:
+            file_path: Path to file in storage
+
+        Returns:
+            Absolute path or None if storage isn't local
+        """
+        return None
+
     @abstractmethod
     async def delete_file(self, file_path: str) -> bool:
         """Delete file from storage.
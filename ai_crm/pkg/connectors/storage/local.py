@@ -1,5 +1,6 @@
 """Local filesystem storage implementation."""
 
+from collections.abc import AsyncIterable, AsyncIterator
 from pathlib import Path
 
 import aiofiles
@@ -34,7 +35,27 @@ class LocalStorage(BaseStorage):
         async with aiofiles.open(full_path, "wb") as f:
             await f.write(file_content)
 
-        logger.info(f"File saved to local storage: {file_path}")
+        logger.info("File saved to local storage", file_path=file_path)
+        return file_path
+
+    async def save_stream(
+        self, file_path: str, chunks: AsyncIterable[bytes]
+    ) -> str:
+        full_path = self.base_path / file_path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and rename, so a partial file is never seen
+        part_path = full_path.with_name(f"{full_path.name}.part")
+
+        try:
+            async with aiofiles.open(part_path, "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+            part_path.replace(full_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+        logger.info("File streamed to local storage", file_path=file_path)
         return file_path
 
     async def get_file(self, file_path: str) -> bytes:
@@ -46,9 +67,24 @@ class LocalStorage(BaseStorage):
         async with aiofiles.open(full_path, "rb") as f:
             content = await f.read()
 
-        logger.info(f"File retrieved from local storage: {file_path}")
+        logger.debug("File retrieved from local storage", file_path=file_path)
         return content
 
+    async def open_stream(
+        self, file_path: str, chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[bytes]:
+        full_path = self.base_path / file_path
+
+        if not full_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        async with aiofiles.open(full_path, "rb") as f:
+            while chunk := await f.read(chunk_size):
+                yield chunk
+
+    def local_path(self, file_path: str) -> Path | None:
+        return (self.base_path / file_path).resolve()
+
     async def delete_file(self, file_path: str) -> bool:
         full_path = self.base_path / file_path
 
@@ -57,7 +93,7 @@ class LocalStorage(BaseStorage):
             return False
 
         full_path.unlink()
-        logger.info(f"File deleted from local storage: {file_path}")
+        logger.info("File deleted from local storage", file_path=file_path)
         return True
 
     async def file_exists(self, file_path: str) -> bool:
@@ -1,5 +1,7 @@
 """S3-compatible storage implementation (Yandex Cloud S3)."""
 
+from collections.abc import AsyncIterable, AsyncIterator
+
 from ai_crm.pkg.connectors.storage.base import BaseStorage
 from ai_crm.pkg.logger import logger as logger_lib
 
@@ -31,11 +33,25 @@ class S3Storage(BaseStorage):
             "S3 storage not yet implemented. " "Use LocalStorage for now."
         )
 
+    async def save_stream(
+        self, file_path: str, chunks: AsyncIterable[bytes]
+    ) -> str:
+        raise NotImplementedError(
+            "S3 storage not yet implemented. " "Use LocalStorage for now."
+        )
+
     async def get_file(self, file_path: str) -> bytes:
         raise NotImplementedError(
             "S3 storage not yet implemented. " "Use LocalStorage for now."
         )
 
+    def open_stream(
+        self, file_path: str, chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[bytes]:
+        raise NotImplementedError(
+            "S3 storage not yet implemented. " "Use LocalStorage for now."
+        )
+
     async def delete_file(self, file_path: str) -> bool:
         raise NotImplementedError(
             "S3 storage not yet implemented. " "Use LocalStorage for now."
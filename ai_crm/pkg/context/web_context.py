@@ -1,8 +1,11 @@
 from fastapi import Request
+from openai import AsyncOpenAI
 
+from ai_crm.pkg.clients.openai import resource as OpenAIResource
 from ai_crm.pkg.connectors.postgresql import resource as PostgreSQLResource
 from ai_crm.pkg.connectors.storage import factory as storage_factory
 from ai_crm.pkg.connectors.storage.base import BaseStorage
+from ai_crm.pkg.executors import resource as ExecutorResource
 from ai_crm.pkg.logger import logger as logger_lib
 
 logger = logger_lib.get_logger(__name__)
@@ -11,8 +14,16 @@ logger = logger_lib.get_logger(__name__)
 class WebContext:
     """Web context that manages application resources and lifecycle."""
 
-    def __init__(self):
+    def __init__(self, openai_client: AsyncOpenAI | None = None):
+        """Initialize web context.
+
+        Args:
+            openai_client: Client to use instead of the real one, e.g. a fake
+                           for local runs and tests.
+        """
         self.postgresql = PostgreSQLResource.Resource()
+        self.openai = OpenAIResource.Resource(openai_client)
+        self.executor = ExecutorResource.Resource()
         self.storage: BaseStorage | None = None
         logger.info("WebContext initialized")
 
@@ -21,6 +32,8 @@ class WebContext:
         logger.info("Starting up WebContext...")
 
         await self.postgresql.on_startup()
+        await self.openai.on_startup()
+        await self.executor.on_startup()
 
         self.storage = storage_factory.get_storage("local")
         logger.info(f"Storage initialized: {self.storage.get_storage_type()}")
@@ -31,6 +44,8 @@ class WebContext:
         """Cleanup all resources on shutdown."""
         logger.info("Shutting down WebContext...")
 
+        await self.executor.on_shutdown()
+        await self.openai.on_shutdown()
         await self.postgresql.on_shutdown()
 
         logger.info("WebContext shutdown completed")
@@ -0,0 +1,159 @@
+"""Worker pools for CPU-bound work that must not block the event loop."""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import functools
+import multiprocessing
+
+from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.models.exceptions import executor as executor_exceptions
+
+logger = logger_lib.get_logger(__name__)
+
+
+class Resource:
+    """Worker pools manager for CPU-bound tasks.
+
+    Functions passed to :meth:`.run_cpu_bound` (PDF parsing, rendering) and
+    their arguments must be picklable: module-level functions and plain data
+    or pydantic models.
+
+    Password hashing runs in a thread pool of its own (bcrypt releases the
+    GIL), see :meth:`.run_password_task`, so a burst of logins neither
+    blocks the event loop nor waits behind PDF rendering.
+    """
+
+    def __init__(self):
+        self._config = settings.ai_crm_env.EXECUTOR
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._password_pool: ThreadPoolExecutor | None = None
+        # Tasks running or queued in the password pool
+        self._password_slots = asyncio.Semaphore(
+            self._config.PASSWORD_POOL_SIZE + self._config.PASSWORD_QUEUE_SIZE
+        )
+
+    async def on_startup(self) -> None:
+        logger.info(
+            "Starting process pool", workers=self._config.PROCESS_POOL_SIZE
+        )
+        self._process_pool = self._create_process_pool()
+        self._password_pool = ThreadPoolExecutor(
+            max_workers=self._config.PASSWORD_POOL_SIZE,
+            thread_name_prefix="password",
+        )
+
+    async def on_shutdown(self) -> None:
+        if self._password_pool:
+            self._password_pool.shutdown(wait=False, cancel_futures=True)
+            self._password_pool = None
+
+        if not self._process_pool:
+            return
+
+        logger.info("Shutting down process pool...")
+        process_pool, self._process_pool = self._process_pool, None
+
+        try:
+            await asyncio.wait_for(
+                asyncio.to_thread(
+                    process_pool.shutdown, wait=True, cancel_futures=True
+                ),
+                timeout=self._config.SHUTDOWN_TIMEOUT_SECONDS,
+            )
+        except TimeoutError:
+            logger.warning(
+                "Process pool did not finish running tasks in time",
+                timeout_seconds=self._config.SHUTDOWN_TIMEOUT_SECONDS,
+            )
+
+        logger.info("Process pool shut down")
+
+    async def run_cpu_bound[T](
+        self,
+        fn: Callable[..., T],
+        *args: object,
+        timeout: float | None = None,
+    ) -> T:
+        """Run ``fn(*args)`` in a worker process.
+
+        Args:
+            fn: Module-level function to run.
+            *args: Picklable positional arguments for ``fn``.
+            timeout: Seconds to wait for the result. Defaults to
+                     :attr:`.Executor.TASK_TIMEOUT_SECONDS`.
+
+        Notes:
+            On timeout the caller stops waiting, but a task that has already
+            started keeps its worker busy until it finishes.
+
+        Raises:
+            TaskTimeout: If the task did not finish in time.
+        """
+        timeout = timeout or self._config.TASK_TIMEOUT_SECONDS
+        loop = asyncio.get_running_loop()
+        process_pool = self._get_process_pool()
+
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(
+                    process_pool, functools.partial(fn, *args)
+                ),
+                timeout=timeout,
+            )
+        except TimeoutError as e:
+            logger.error(
+                "CPU-bound task timed out",
+                task=fn.__name__,
+                timeout_seconds=timeout,
+            )
+            raise executor_exceptions.TaskTimeout from e
+        except BrokenProcessPool:
+            # Tasks failing together must replace the pool only once
+            if self._process_pool is process_pool:
+                logger.exception(
+                    "Process pool is broken, recreating it", task=fn.__name__
+                )
+                process_pool.shutdown(wait=False, cancel_futures=True)
+                self._process_pool = self._create_process_pool()
+            raise
+
+    async def run_password_task[T](
+        self, fn: Callable[..., T], *args: object
+    ) -> T:
+        """Run password hashing or verification ``fn(*args)`` in a thread.
+
+        Raises:
+            ExecutorOverloaded: If ``EXECUTOR__PASSWORD_QUEUE_SIZE`` tasks
+                                already wait for a thread.
+        """
+        if self._password_slots.locked():
+            raise executor_exceptions.ExecutorOverloaded
+
+        async with self._password_slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_password_pool(), functools.partial(fn, *args)
+            )
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if not self._process_pool:
+            raise RuntimeError("Process pool is not initialized")
+
+        return self._process_pool
+
+    def _get_password_pool(self) -> ThreadPoolExecutor:
+        if not self._password_pool:
+            raise RuntimeError("Password pool is not initialized")
+
+        return self._password_pool
+
+    def _create_process_pool(self) -> ProcessPoolExecutor:
+        # Workers are forked from a clean single-threaded server process
+        # instead of the multi-threaded API worker.
+        return ProcessPoolExecutor(
+            max_workers=self._config.PROCESS_POOL_SIZE,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
@@ -0,0 +1,81 @@
+"""Cheap pre-record filters: sampling and rate limiting per logger."""
+
+import logging
+import random
+import threading
+import time
+
+from ai_crm.pkg.configuration import context_vars
+from ai_crm.pkg.logger.formatters import REQUEST_ID_ATTRIBUTE
+
+
+class RequestContextFilter(logging.Filter):
+    """Attach request id of the current task to the record.
+
+    Must run in the thread that logs (handler filter), because the listener
+    thread doesn't see the context variables of the request.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, REQUEST_ID_ATTRIBUTE):
+            setattr(record, REQUEST_ID_ATTRIBUTE, context_vars.request_id.get())
+        return True
+
+
+class LogThrottle:
+    """Decides whether a low-severity record should be created at all.
+
+    Combines probabilistic sampling with a token bucket limit, both
+    optional. Called before the record is built, so dropped calls cost a
+    couple of comparisons.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float | None = None,
+        rate_limit: float | None = None,
+    ):
+        """Initialize throttle.
+
+        Args:
+            sample_rate: Share of records to keep, from 0 to 1.
+            rate_limit: Max records per second, bursts up to one second.
+        """
+        self._sample_rate = sample_rate
+        self._rate_limit = rate_limit
+        self._tokens = rate_limit or 0.0
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        if self._sample_rate is not None and (
+            random.random() >= self._sample_rate
+        ):
+            return False
+
+        if self._rate_limit is None:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._rate_limit,
+                self._tokens + (now - self._updated_at) * self._rate_limit,
+            )
+            self._updated_at = now
+
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+            return True
+
+
+def find_logger_setting[T](name: str, settings: dict[str, T]) -> T | None:
+    """Get setting of the logger or of its closest configured parent."""
+    while name:
+        if name in settings:
+            return settings[name]
+        name = name.rpartition(".")[0]
+
+    return None
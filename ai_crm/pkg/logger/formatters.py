@@ -0,0 +1,63 @@
+"""Log record formatters.
+
+Both formatters run in the logging listener thread, so the cost of building
+the message and serializing fields is not paid by the event loop.
+"""
+
+from datetime import UTC, datetime
+import json
+import logging
+from typing import Any
+
+# Record attributes set by the logger itself, anything else is a field
+FIELDS_ATTRIBUTE = "fields"
+REQUEST_ID_ATTRIBUTE = "request_id"
+
+
+def get_record_fields(record: logging.LogRecord) -> dict[str, Any]:
+    return getattr(record, FIELDS_ATTRIBUTE, None) or {}
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable format, fields are appended as ``key=value`` pairs."""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:  # noqa: N802
+        # Called before the traceback is added, so fields stay on the line
+        message = super().formatMessage(record)
+
+        request_id = getattr(record, REQUEST_ID_ATTRIBUTE, None)
+        fields = get_record_fields(record)
+        if not request_id and not fields:
+            return message
+
+        pairs = [f"request_id={request_id}"] if request_id else []
+        pairs.extend(f"{key}={value!r}" for key, value in fields.items())
+        return f"{message}| {' '.join(pairs)}"
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, ready for log shippers (Loki, ELK)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, tz=UTC
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "location": f"{record.filename}:{record.funcName}:{record.lineno}",
+        }
+
+        request_id = getattr(record, REQUEST_ID_ATTRIBUTE, None)
+        if request_id:
+            payload[REQUEST_ID_ATTRIBUTE] = request_id
+
+        payload.update(get_record_fields(record))
+
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+
+        return json.dumps(payload, default=str, ensure_ascii=False)
@@ -1,16 +1,120 @@
-"""Methods for working with logger."""
+"""Methods for working with logger.
 
+Handlers are configured once per process. Loggers only put records into an
+in-memory queue; a background :class:`logging.handlers.QueueListener` thread
+formats them and does the file and stream I/O, so the event loop never waits
+for the disk. The single :class:`RotatingFileHandler` is the only owner of
+the log file and its rotation.
+
+Loggers are :class:`StructuredLogger` adapters: pass the message as a
+constant with ``%s`` args or key/value fields, not as an f-string, so
+records below the level (or dropped by sampling) cost almost nothing::
+
+    logger.info("Resume uploaded", resume_id=resume.id, size=size)
+"""
+
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import os
 from pathlib import Path
+import queue
+import threading
 
 from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.logger.filters import (
+    LogThrottle,
+    RequestContextFilter,
+    find_logger_setting,
+)
+from ai_crm.pkg.logger.formatters import (
+    FIELDS_ATTRIBUTE,
+    JsonFormatter,
+    TextFormatter,
+)
+from ai_crm.pkg.models import logger as logger_models
 
 _log_format = (
     "%(asctime)s - [%(levelname)s] - %(name)s - (%(filename)s).%("
     "funcName)s(%(lineno)d) - %(message)s "
 )
 
+# Loggers of the application propagate records to this one
+_ROOT_LOGGER_NAME = "ai_crm"
+
+_configure_lock = threading.Lock()
+_queue_handler: "_NonBlockingQueueHandler | None" = None
+_listener: QueueListener | None = None
+
+# Keyword arguments understood by ``logging.Logger.log``
+_LOG_KWARGS = frozenset(("exc_info", "stack_info", "stacklevel", "extra"))
+
+
+class StructuredLogger(logging.LoggerAdapter):
+    """Logger accepting key/value fields, with optional sampling.
+
+    DEBUG and INFO records may be sampled and rate limited per logger (see
+    ``LOGGER__SAMPLING`` and ``LOGGER__RATE_LIMITS``). Warnings and errors
+    are always kept.
+    """
+
+    def __init__(
+        self, logger: logging.Logger, throttle: LogThrottle | None = None
+    ):
+        super().__init__(logger)
+        self._throttle = throttle
+
+    def log(self, level: int, msg: object, *args, **kwargs) -> None:
+        if not self.isEnabledFor(level):
+            return
+        if (
+            self._throttle is not None
+            and level <= logging.INFO
+            and not self._throttle.allow()
+        ):
+            return
+
+        msg, kwargs = self.process(msg, kwargs)
+        # Skip this frame when finding the caller's file and line
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def process(self, msg: object, kwargs: dict) -> tuple[object, dict]:
+        fields = {
+            key: kwargs.pop(key)
+            for key in list(kwargs)
+            if key not in _LOG_KWARGS
+        }
+        if fields:
+            kwargs["extra"] = {
+                **kwargs.get("extra", {}),
+                FIELDS_ATTRIBUTE: fields,
+            }
+        return msg, kwargs
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """Queue handler that never blocks and defers formatting.
+
+    The default :meth:`QueueHandler.prepare` formats the message in the
+    calling thread. Records stay in this process, so they are passed as is
+    and formatted by the listener thread. When the queue is full (the disk
+    is stalled), records are dropped instead of blocking the event loop.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped_records = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_records += 1
+
 
 def get_file_handler(file_name: str) -> RotatingFileHandler:
     """Get file handler for logger.
@@ -42,7 +146,7 @@ def get_file_handler(file_name: str) -> RotatingFileHandler:
         maxBytes=5242880,
         backupCount=10,
     )
-    file_handler.setFormatter(logging.Formatter(_log_format))
+    file_handler.setFormatter(_get_formatter())
     return file_handler
 
 
@@ -50,10 +154,89 @@ def get_stream_handler():
     """Get stream handler for logger."""
 
     stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(logging.Formatter(_log_format))
+    stream_handler.setFormatter(_get_formatter())
     return stream_handler
 
 
+def _get_formatter() -> logging.Formatter:
+    if settings.ai_crm_env.LOGGER.FORMAT == logger_models.LoggerFormat.JSON:
+        return JsonFormatter()
+
+    return TextFormatter(_log_format)
+
+
+def configure_logging() -> QueueHandler:
+    """Configure shared handlers and start the listener thread.
+
+    Safe to call many times: handlers are created only once per process.
+
+    Returns:
+        Queue handler attached to the application root logger.
+    """
+    global _queue_handler, _listener
+
+    with _configure_lock:
+        if _queue_handler is not None:
+            return _queue_handler
+
+        config = settings.ai_crm_env.LOGGER
+        file_path = str(
+            Path(
+                config.FOLDER_PATH,
+                f"{settings.ai_crm_env.INSTANCE_APP_NAME}.log",
+            ).absolute(),
+        )
+
+        log_queue: queue.Queue = queue.Queue(maxsize=config.QUEUE_SIZE)
+        _queue_handler = _NonBlockingQueueHandler(log_queue)
+        _queue_handler.addFilter(RequestContextFilter())
+        _listener = QueueListener(
+            log_queue,
+            get_file_handler(file_name=file_path),
+            get_stream_handler(),
+            respect_handler_level=True,
+        )
+        _listener.start()
+
+        root_logger = logging.getLogger(_ROOT_LOGGER_NAME)
+        root_logger.addHandler(_queue_handler)
+        root_logger.setLevel(config.LEVEL.upper())
+        root_logger.propagate = False
+
+        atexit.register(shutdown_logging)
+        # Listener thread doesn't survive fork (gunicorn --preload, pools)
+        os.register_at_fork(after_in_child=_restart_listener)
+
+        return _queue_handler
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+
+    with _configure_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def _restart_listener() -> None:
+    global _configure_lock, _listener
+
+    # The lock may have been held by another thread at the time of fork
+    _configure_lock = threading.Lock()
+    if _listener is None:
+        return
+
+    # Records queued by the parent are written by the parent itself
+    log_queue: queue.Queue = queue.Queue(maxsize=_listener.queue.maxsize)
+    _queue_handler.queue = log_queue
+    _listener = QueueListener(
+        log_queue, *_listener.handlers, respect_handler_level=True
+    )
+    _listener.start()
+
+
 def get_logger(name):
     """Get logger.
 
@@ -62,7 +245,7 @@ def get_logger(name):
             Name of the logger.
 
     Returns:
-        LoggerLevel instance.
+        :class:`StructuredLogger` instance.
 
     Examples:
         ::
@@ -72,14 +255,23 @@ def get_logger(name):
             >>> logger.info("Hello, World!")
             2021-01-01 00:00:00,000 - [INFO] - app.pkg.logger - (logger.py).get_logger(43) - Hello, World!  # pylint: disable=line-too-long
     """
+    queue_handler = configure_logging()
+    config = settings.ai_crm_env.LOGGER
     logger = logging.getLogger(name)
-    file_path = str(
-        Path(
-            settings.ai_crm_env.LOGGER.FOLDER_PATH,
-            f"{settings.ai_crm_env.INSTANCE_APP_NAME}.log",
-        ).absolute(),
+
+    # Application loggers propagate to the root one, others need the handler
+    is_app_logger = name == _ROOT_LOGGER_NAME or name.startswith(
+        f"{_ROOT_LOGGER_NAME}."
+    )
+    if not is_app_logger and queue_handler not in logger.handlers:
+        logger.addHandler(queue_handler)
+        logger.setLevel(config.LEVEL.upper())
+
+    sample_rate = find_logger_setting(name, config.SAMPLING)
+    rate_limit = find_logger_setting(name, config.RATE_LIMITS)
+    throttle = (
+        LogThrottle(sample_rate=sample_rate, rate_limit=rate_limit)
+        if sample_rate is not None or rate_limit is not None
+        else None
     )
-    logger.addHandler(get_file_handler(file_name=file_path))
-    logger.addHandler(get_stream_handler())
-    logger.setLevel(settings.ai_crm_env.LOGGER.LEVEL.upper())
-    return logger
+    return StructuredLogger(logger, throttle)
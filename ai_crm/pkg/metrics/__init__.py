@@ -0,0 +1,6 @@
+"""Prometheus metrics of the application.
+
+Metrics are module-level singletons registered in the default registry. When
+``PROMETHEUS_MULTIPROC_DIR`` is set (gunicorn with several workers), every
+process writes its samples there and :mod:`.exposition` merges them.
+"""
@@ -0,0 +1,93 @@
+"""AI pipeline and OpenAI usage metrics."""
+
+from collections.abc import Iterator
+import contextlib
+import time
+
+from prometheus_client import Counter, Histogram
+
+from ai_crm.pkg.models.base import enum as base_enum
+
+STAGE_BUCKETS = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    20.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+
+class AIStage(str, base_enum.BaseEnum):
+    EXTRACT = "extract"
+    GPT_PARSE = "gpt_parse"
+    GPT_PERSONALIZE = "gpt_personalize"
+    DOCX = "docx"
+    PDF = "pdf"
+    STORAGE = "storage"
+
+
+STAGE_DURATION = Histogram(
+    "ai_pipeline_stage_duration_seconds",
+    "Histogram of AI pipeline stage duration by stage and outcome",
+    ["stage", "status"],
+    buckets=STAGE_BUCKETS,
+)
+OPENAI_REQUESTS = Counter(
+    "openai_requests_total",
+    "Total count of OpenAI API requests by operation, model and outcome",
+    ["operation", "model", "status"],
+)
+OPENAI_TOKENS = Counter(
+    "openai_tokens_total",
+    "Total count of OpenAI tokens by operation, model and token type",
+    ["operation", "model", "token_type"],
+)
+
+
+@contextlib.contextmanager
+def track_stage(stage: AIStage) -> Iterator[None]:
+    """Observe duration of the wrapped AI pipeline stage.
+
+    Examples:
+        >>> with track_stage(AIStage.DOCX):
+        ...     docx_bytes = await generate_docx_resume(context, resume)
+    """
+    status = "success"
+    started_at = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        STAGE_DURATION.labels(stage=stage.value, status=status).observe(
+            time.perf_counter() - started_at
+        )
+
+
+def observe_openai_request(
+    operation: str,
+    model: str,
+    status: str,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+) -> None:
+    OPENAI_REQUESTS.labels(
+        operation=operation, model=model, status=status
+    ).inc()
+
+    if prompt_tokens:
+        OPENAI_TOKENS.labels(
+            operation=operation, model=model, token_type="prompt"
+        ).inc(prompt_tokens)
+    if completion_tokens:
+        OPENAI_TOKENS.labels(
+            operation=operation, model=model, token_type="completion"
+        ).inc(completion_tokens)
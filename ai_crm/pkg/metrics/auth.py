@@ -0,0 +1,19 @@
+"""Authentication metrics."""
+
+from prometheus_client import Counter
+
+USER_CACHE_REQUESTS = Counter(
+    "auth_user_cache_requests_total",
+    "Total count of authenticated user lookups by cache tier that served it",
+    ["result"],
+)
+TOKEN_CACHE_REQUESTS = Counter(
+    "auth_token_cache_requests_total",
+    "Total count of JWT verifications by whether the cache served them",
+    ["result"],
+)
+RATE_LIMITED_REQUESTS = Counter(
+    "auth_rate_limited_requests_total",
+    "Total count of requests rejected by rate limits by limiter",
+    ["limiter"],
+)
@@ -0,0 +1,40 @@
+"""Expose collected metrics in Prometheus text format."""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def is_multiprocess_mode() -> bool:
+    return MULTIPROC_DIR_ENV in os.environ
+
+
+def get_registry() -> CollectorRegistry:
+    """Get registry to collect metrics from.
+
+    In multiprocess mode a fresh registry merging samples of all live
+    processes is built on every call, as ``prometheus_client`` requires.
+    """
+    if not is_multiprocess_mode():
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def generate_metrics() -> tuple[bytes, str]:
+    """Render metrics.
+
+    Returns:
+        Tuple of (payload, content_type)
+    """
+    return generate_latest(get_registry()), CONTENT_TYPE_LATEST
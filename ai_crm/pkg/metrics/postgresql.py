@@ -0,0 +1,123 @@
+"""PostgreSQL connection pool and query metrics."""
+
+from collections.abc import Iterator
+import contextlib
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from ai_crm.pkg.models.exceptions import postgres as postgres_exceptions
+
+ACQUIRE_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+POOL_CONNECTIONS = Gauge(
+    "postgresql_pool_connections",
+    "Connections of PostgreSQL pool by host, role and state",
+    ["host", "role", "state"],
+    multiprocess_mode="livesum",
+)
+POOL_MAX_CONNECTIONS = Gauge(
+    "postgresql_pool_max_connections",
+    "Maximum size of PostgreSQL pool by host and role",
+    ["host", "role"],
+    multiprocess_mode="livesum",
+)
+HOST_HEALTHY = Gauge(
+    "postgresql_host_healthy",
+    "Whether PostgreSQL host is healthy (1) or not (0)",
+    ["host", "role"],
+    multiprocess_mode="livemin",
+)
+POOL_WAITING_REQUESTS = Gauge(
+    "postgresql_pool_waiting_requests",
+    "Requests waiting for a connection of PostgreSQL pool by host and role",
+    ["host", "role"],
+    multiprocess_mode="livesum",
+)
+POOL_ACQUIRE_WAIT = Histogram(
+    "postgresql_pool_acquire_wait_seconds",
+    "Histogram of time spent waiting for a pool connection by host and role",
+    ["host", "role"],
+    buckets=ACQUIRE_BUCKETS,
+)
+POOL_ACQUIRE_TIMEOUTS = Counter(
+    "postgresql_pool_acquire_timeouts_total",
+    "Total count of pool connection waits that timed out by host and role",
+    ["host", "role"],
+)
+QUERIES = Counter(
+    "postgresql_queries_total",
+    "Total count of repository calls by function and outcome",
+    ["function", "status"],
+)
+QUERY_DURATION = Histogram(
+    "postgresql_query_duration_seconds",
+    "Histogram of repository call duration by function, acquire included",
+    ["function"],
+)
+REPLICATION_DELAY = Gauge(
+    "postgresql_replication_delay_seconds",
+    "Replication lag of PostgreSQL host, 0 for the master",
+    ["host", "role"],
+    multiprocess_mode="livemax",
+)
+
+
+def set_pool_stats(
+    host: str,
+    role: str,
+    is_healthy: bool,
+    replication_delay: float,
+    size: int,
+    idle: int,
+    max_size: int,
+    waiting: int,
+) -> None:
+    POOL_CONNECTIONS.labels(host=host, role=role, state="idle").set(idle)
+    POOL_CONNECTIONS.labels(host=host, role=role, state="in_use").set(
+        size - idle
+    )
+    POOL_MAX_CONNECTIONS.labels(host=host, role=role).set(max_size)
+    POOL_WAITING_REQUESTS.labels(host=host, role=role).set(waiting)
+    HOST_HEALTHY.labels(host=host, role=role).set(int(is_healthy))
+    REPLICATION_DELAY.labels(host=host, role=role).set(replication_delay)
+
+
+@contextlib.contextmanager
+def track_query(function: str) -> Iterator[None]:
+    """Observe duration and outcome of the wrapped repository call.
+
+    Args:
+        function: Repository function, as ``module.function``.
+    """
+    status = "success"
+    started_at = time.perf_counter()
+    try:
+        yield
+    except postgres_exceptions.EmptyResult:
+        # Not found is a normal answer, not a database problem
+        status = "empty"
+        raise
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        QUERY_DURATION.labels(function=function).observe(
+            time.perf_counter() - started_at
+        )
+        QUERIES.labels(function=function, status=status).inc()
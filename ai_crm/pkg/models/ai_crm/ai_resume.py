@@ -1,7 +1,11 @@
 """Models for AI resume personalization endpoints."""
 
+from datetime import datetime
+
 from pydantic import Field
 
+from ai_crm.pkg.models.ai_crm import resume as resume_models
+from ai_crm.pkg.models.base import enum as base_enum
 from ai_crm.pkg.models.base import model as base_models
 
 
@@ -29,3 +33,57 @@ class PersonalizeResumeResponse(base_models.BaseModel):
         description="URL to download personalized resume",
         example="/api/v1/resumes/ai/download/temp_uuid.docx",
     )
+
+
+class PersonalizedResumes(base_models.BaseModel):
+    pdf: resume_models.Resume = Field(description="Personalized PDF resume")
+    docx: resume_models.Resume = Field(description="Personalized DOCX resume")
+
+
+class PersonalizationStage(str, base_enum.BaseEnum):
+    PARSING = "parsing"
+    PARSED = "parsed"
+    PERSONALIZING = "personalizing"
+    PERSONALIZED = "personalized"
+    GENERATING = "generating"
+    STORING = "storing"
+    SAVING = "saving"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class PersonalizationProgressEvent(base_models.BaseModel):
+    stage: PersonalizationStage = Field(
+        description="Pipeline stage", example=PersonalizationStage.PARSED
+    )
+    step: int = Field(description="Current step number", example=1)
+    total_steps: int = Field(description="Total number of steps", example=5)
+    timestamp: datetime = Field(
+        default_factory=datetime.now,
+        description="Time of the stage transition",
+    )
+
+    # Partial results
+    name: str | None = Field(
+        None, description="Parsed full name (after parsing)", example=None
+    )
+    position: str | None = Field(
+        None, description="Parsed position (after parsing)", example=None
+    )
+    summary: str | None = Field(
+        None,
+        description="Personalized summary (after personalizing)",
+        example=None,
+    )
+    pdf_resume_id: str | None = Field(
+        None, description="Personalized PDF resume id (when completed)"
+    )
+    docx_resume_id: str | None = Field(
+        None, description="Personalized DOCX resume id (when completed)"
+    )
+
+    # Failure
+    error_code: str | None = Field(None, description="Error code if failed")
+    error_message: str | None = Field(
+        None, description="Error message if failed"
+    )
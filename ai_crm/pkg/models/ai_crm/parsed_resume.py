@@ -1,6 +1,6 @@
-from datetime import date
+from datetime import date, datetime
 
-from pydantic import Field
+from pydantic import Field, Json
 
 from ai_crm.pkg.models.base import model as base_models
 
@@ -63,3 +63,15 @@ class ParsedResume(base_models.BaseModel):
     skills: Skills = Field(
         default_factory=Skills, description="Skills overview"
     )
+
+
+class ParsedResumeRecord(base_models.BaseModel):
+    """Cached GPT parse result keyed by file content hash."""
+
+    id: str = Field(description="Record id (UUID)")
+    content_hash: str = Field(description="SHA-256 of the resume file bytes")
+    schema_version: str = Field(
+        description="Version of the parsing prompt and schema"
+    )
+    parsed_data: Json[ParsedResume] = Field(description="Parsed resume")
+    created_at: datetime = Field(description="Created at")
@@ -0,0 +1,87 @@
+"""Models for asynchronous AI resume personalization jobs."""
+
+from datetime import datetime
+
+from pydantic import Field
+
+from ai_crm.pkg.models.base import enum as base_enum
+from ai_crm.pkg.models.base import model as base_models
+
+
+class PersonalizationJobStatus(str, base_enum.BaseEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class PersonalizationJobFields:
+    id: str = Field(
+        description="Job id (UUID)",
+        example="123e4567-e89b-12d3-a456-426614174000",
+    )
+    user_id: str = Field(
+        description="User id who submitted the job (UUID)",
+        example="123e4567-e89b-12d3-a456-426614174001",
+    )
+    resume_id: str = Field(
+        description="Resume id to personalize (UUID)",
+        example="123e4567-e89b-12d3-a456-426614174002",
+    )
+    job_description: str = Field(
+        description="Job description to tailor resume for",
+        example="We are looking for a Senior Software Engineer...",
+    )
+    status: PersonalizationJobStatus = Field(
+        description="Job status", example=PersonalizationJobStatus.PENDING
+    )
+    attempts: int = Field(description="Number of processing attempts")
+    error_code: str | None = Field(
+        None, description="Error code if the job failed", example=None
+    )
+    pdf_resume_id: str | None = Field(
+        None, description="Personalized PDF resume id", example=None
+    )
+    docx_resume_id: str | None = Field(
+        None, description="Personalized DOCX resume id", example=None
+    )
+    locked_until: datetime | None = Field(
+        None, description="Lease expiration of a running job"
+    )
+    created_at: datetime = Field(
+        description="Created at", example=datetime.now()
+    )
+    updated_at: datetime = Field(
+        description="Updated at", example=datetime.now()
+    )
+    started_at: datetime | None = Field(None, description="Started at")
+    finished_at: datetime | None = Field(None, description="Finished at")
+
+
+class PersonalizationJob(base_models.BaseModel):
+    id: str = PersonalizationJobFields.id
+    user_id: str = PersonalizationJobFields.user_id
+    resume_id: str = PersonalizationJobFields.resume_id
+    job_description: str = PersonalizationJobFields.job_description
+    status: PersonalizationJobStatus = PersonalizationJobFields.status
+    attempts: int = PersonalizationJobFields.attempts
+    error_code: str | None = PersonalizationJobFields.error_code
+    pdf_resume_id: str | None = PersonalizationJobFields.pdf_resume_id
+    docx_resume_id: str | None = PersonalizationJobFields.docx_resume_id
+    locked_until: datetime | None = PersonalizationJobFields.locked_until
+    created_at: datetime = PersonalizationJobFields.created_at
+    updated_at: datetime = PersonalizationJobFields.updated_at
+    started_at: datetime | None = PersonalizationJobFields.started_at
+    finished_at: datetime | None = PersonalizationJobFields.finished_at
+
+
+# Responses
+class PersonalizationJobResponse(base_models.BaseModel):
+    id: str = PersonalizationJobFields.id
+    resume_id: str = PersonalizationJobFields.resume_id
+    status: PersonalizationJobStatus = PersonalizationJobFields.status
+    error_code: str | None = PersonalizationJobFields.error_code
+    pdf_resume_id: str | None = PersonalizationJobFields.pdf_resume_id
+    docx_resume_id: str | None = PersonalizationJobFields.docx_resume_id
+    created_at: datetime = PersonalizationJobFields.created_at
+    finished_at: datetime | None = PersonalizationJobFields.finished_at
@@ -26,6 +26,11 @@ class ResumeFields:
         description="Storage path", example="resumes/2024/01/uuid.pdf"
     )
     storage_type: str = Field(description="Storage type", example="local")
+    content_hash: str | None = Field(
+        None,
+        description="SHA-256 of file content (hex)",
+        example="9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+    )
     media_type: str = Field(description="Media type", example="cv")
     title: str | None = Field(
         None, description="Resume title", example="Software Engineer Resume"
@@ -53,6 +58,7 @@ class Resume(base_models.BaseModel):
     mime_type: str = ResumeFields.mime_type
     storage_path: str = ResumeFields.storage_path
     storage_type: str = ResumeFields.storage_type
+    content_hash: str | None = ResumeFields.content_hash
     media_type: str = ResumeFields.media_type
     title: str | None = ResumeFields.title
     description: str | None = ResumeFields.description
@@ -39,6 +39,19 @@ class User(base_models.BaseModel):
     updated_at: datetime = UserFields.updated_at
 
 
+class UserPrincipal(base_models.BaseModel):
+    """Authenticated user, without credentials."""
+
+    id: str = UserFields.id
+    username: str = UserFields.username
+    email: EmailStr = UserFields.email
+    first_name: str | None = UserFields.first_name
+    last_name: str | None = UserFields.last_name
+    is_active: bool = UserFields.is_active
+    created_at: datetime = UserFields.created_at
+    updated_at: datetime = UserFields.updated_at
+
+
 # Requests
 class UserCreateRequest(base_models.BaseModel):
     username: str = UserFields.username
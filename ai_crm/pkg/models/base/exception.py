@@ -5,6 +5,8 @@ class BaseError(Exception):
     error_code = "internal_error"
     error_msg = "Unhandled exception"
     http_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    # Extra headers of the error response
+    headers: dict[str, str] | None = None
 
     def __init__(self, error_code=None, error_msg=None, details=None):
         super().__init__(error_msg)
@@ -38,3 +40,33 @@ class BaseAPIException(BaseError):
                 },
             },
         }
+
+
+def generate_openapi_responses(
+    *exceptions: type[BaseAPIException],
+) -> dict[int, dict]:
+    """Document exceptions of a router, one response per status code.
+
+    Unlike merging :meth:`BaseAPIException.generate_openapi` results, which
+    keeps only the last exception of each status code, exceptions sharing a
+    code become examples of the same response.
+    """
+    responses: dict[int, dict] = {}
+    for exc in exceptions:
+        response = responses.setdefault(
+            exc.http_code,
+            {
+                "description": "",
+                "content": {"application/json": {"examples": {}}},
+            },
+        )
+        response["description"] = " / ".join(
+            filter(None, (response["description"], exc.error_msg))
+        )
+        examples = response["content"]["application/json"]["examples"]
+        examples[exc.error_code] = {
+            "summary": exc.error_msg,
+            "value": {"message": exc.error_msg},
+        }
+
+    return responses
@@ -1 +1,11 @@
+from ai_crm.pkg.models.base import enum as base_enum
+
 DELETE_ZERO = "DELETE 0"
+
+
+class IsolationLevel(str, base_enum.BaseEnum):
+    """Transaction isolation levels, as accepted by asyncpg."""
+
+    READ_COMMITTED = "read_committed"
+    REPEATABLE_READ = "repeatable_read"
+    SERIALIZABLE = "serializable"
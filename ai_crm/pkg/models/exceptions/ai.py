@@ -23,3 +23,9 @@ class OpenAIAPIError(base_exceptions.BaseAPIException):
     error_code = "openai_api_error"
     error_msg = "OpenAI API request failed"
     http_code = 503
+
+
+class PersonalizationJobNotFound(base_exceptions.BaseAPIException):
+    error_code = "personalization_job_not_found"
+    error_msg = "Personalization job not found"
+    http_code = 404
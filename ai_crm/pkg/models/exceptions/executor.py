@@ -0,0 +1,15 @@
+from starlette import status
+
+from ai_crm.pkg.models.base import exception as base_exceptions
+
+
+class TaskTimeout(base_exceptions.BaseAPIException):
+    error_code = "task_timeout"
+    error_msg = "Processing took too long, please try again later."
+    http_code = status.HTTP_504_GATEWAY_TIMEOUT
+
+
+class ExecutorOverloaded(base_exceptions.BaseAPIException):
+    error_code = "too_many_requests"
+    error_msg = "Too many requests, please try again later."
+    http_code = status.HTTP_429_TOO_MANY_REQUESTS
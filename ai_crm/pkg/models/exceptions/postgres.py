@@ -7,3 +7,9 @@ class EmptyResult(base_exceptions.BaseAPIException):
     error_code = "empty_result"
     error_msg = "Empty result."
     http_code = status.HTTP_404_NOT_FOUND
+
+
+class PoolAcquireTimeout(base_exceptions.BaseAPIException):
+    error_code = "database_overloaded"
+    error_msg = "Database is overloaded, try again later."
+    http_code = status.HTTP_503_SERVICE_UNAVAILABLE
@@ -0,0 +1,16 @@
+import math
+
+from starlette import status
+
+from ai_crm.pkg.models.base import exception as base_exceptions
+
+
+class RateLimitExceeded(base_exceptions.BaseAPIException):
+    error_code = "rate_limit_exceeded"
+    error_msg = "Too many attempts, please try again later."
+    http_code = status.HTTP_429_TOO_MANY_REQUESTS
+
+    def __init__(self, retry_after: float, details=None):
+        super().__init__(details=details)
+        self.retry_after = retry_after
+        self.headers = {"Retry-After": str(math.ceil(retry_after))}
@@ -8,3 +8,8 @@ class LoggerLevel(str, base_enum.BaseEnum):
     DEBUG = "DEBUG"
     CRITICAL = "CRITICAL"
     NOTSET = "NOTSET"
+
+
+class LoggerFormat(str, base_enum.BaseEnum):
+    TEXT = "text"
+    JSON = "json"
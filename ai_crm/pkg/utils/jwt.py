@@ -1,10 +1,64 @@
-"""JWT token utilities."""
+"""JWT token utilities.
+
+Tokens are verified by a :class:`TokenVerifier` (python-jose by default,
+see :func:`.set_token_verifier`). Verified claims are cached until the
+token expires, so a token presented again costs a dictionary lookup.
+"""
 
 import datetime as dt
+import time
+from typing import Protocol
 
 from jose import JWTError, jwt
 
 from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.metrics import auth as auth_metrics
+from ai_crm.pkg.utils import lru_cache
+
+
+class TokenVerifier(Protocol):
+    """Backend checking signature and standard claims of a token."""
+
+    def verify(self, token: str) -> dict | None:
+        """Get claims of a valid token.
+
+        Returns:
+            Claims, or None if the token is malformed, forged or expired.
+        """
+
+
+class JoseTokenVerifier:
+    """:class:`TokenVerifier` based on python-jose."""
+
+    def __init__(self, secret_key: str, algorithm: str):
+        self._secret_key = secret_key
+        self._algorithms = [algorithm]
+
+    def verify(self, token: str) -> dict | None:
+        try:
+            return jwt.decode(
+                token, self._secret_key, algorithms=self._algorithms
+            )
+        except JWTError:
+            return None
+
+
+_token_verifier: TokenVerifier = JoseTokenVerifier(
+    settings.ai_crm_env.API.JWT_SECRET_KEY.get_secret_value(),
+    settings.ai_crm_env.API.JWT_ALGORITHM,
+)
+# Verified claims by token signature
+_verified_tokens: lru_cache.LRUCache[dict] = lru_cache.LRUCache(
+    maxsize=settings.ai_crm_env.API.TOKEN_CACHE_SIZE
+)
+
+
+def set_token_verifier(verifier: TokenVerifier) -> None:
+    """Verify tokens with another backend from now on."""
+    global _token_verifier
+
+    _token_verifier = verifier
+    _verified_tokens.clear()
 
 
 def create_access_token(
@@ -86,17 +140,33 @@ def decode_token(token: str, token_type: str = "access") -> dict | None:
     Returns:
         Decoded token payload as dictionary, or None if token is invalid.
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.ai_crm_env.API.JWT_SECRET_KEY.get_secret_value(),
-            algorithms=[settings.ai_crm_env.API.JWT_ALGORITHM],
-        )
-
-        # Verify token type
-        if payload.get("type") != token_type:
-            return None
+    payload = _verify_token(token)
 
-        return payload
-    except JWTError:
+    # Verify token type
+    if payload is None or payload.get("type") != token_type:
         return None
+
+    return payload
+
+
+def _verify_token(token: str) -> dict | None:
+    if not _verified_tokens.maxsize:
+        return _token_verifier.verify(token)
+
+    # The signature is a MAC of header and claims, so it identifies them:
+    # a token with a copied signature is either rejected by the verifier
+    # or yields the claims of the token it was copied from.
+    signature = token.rpartition(".")[2]
+    payload = _verified_tokens.get(signature)
+    if payload is not None:
+        if payload["exp"] >= time.time():
+            auth_metrics.TOKEN_CACHE_REQUESTS.labels(result="hit").inc()
+            return payload.copy()
+        _verified_tokens.pop(signature)
+
+    auth_metrics.TOKEN_CACHE_REQUESTS.labels(result="miss").inc()
+    payload = _token_verifier.verify(token)
+    # Tokens without expiration are verified every time
+    if payload is not None and "exp" in payload:
+        _verified_tokens.set(signature, payload.copy())
+    return payload
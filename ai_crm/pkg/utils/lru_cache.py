@@ -0,0 +1,64 @@
+"""Bounded in-process LRU cache."""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+import time
+
+
+class LRUCache[V]:
+    """Dictionary-like cache that evicts the least recently used entry.
+
+    With ``ttl``, entries also expire that many seconds after they were set.
+    Expired entries are dropped lazily, when they are read or evicted.
+
+    Not thread-safe: it is meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[Hashable, V] = OrderedDict()
+        self._expires_at: dict[Hashable, float] = {}
+
+    def get(self, key: Hashable) -> V | None:
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return None
+        if self._is_expired(key):
+            self.pop(key)
+            return None
+        return self._data[key]
+
+    def set(self, key: Hashable, value: V) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.ttl is not None:
+            self._expires_at[key] = self._clock() + self.ttl
+        while len(self._data) > self.maxsize:
+            evicted_key, _ = self._data.popitem(last=False)
+            self._expires_at.pop(evicted_key, None)
+
+    def pop(self, key: Hashable) -> V | None:
+        self._expires_at.pop(key, None)
+        return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._expires_at.clear()
+
+    def _is_expired(self, key: Hashable) -> bool:
+        expires_at = self._expires_at.get(key)
+        return expires_at is not None and expires_at <= self._clock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data and not self._is_expired(key)
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,8 +1,23 @@
-"""Password hashing and verification utilities."""
+"""Password hashing and verification utilities.
+
+Every function takes hundreds of milliseconds of CPU: call them through
+:meth:`.executors.Resource.run_password_task`, not on the event loop.
+"""
 
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from ai_crm.pkg.configuration import settings
+
+_ROUNDS = settings.ai_crm_env.API.BCRYPT_ROUNDS
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    # Hashes of any other cost need an update
+    bcrypt__default_rounds=_ROUNDS,
+    bcrypt__min_rounds=_ROUNDS,
+    bcrypt__max_rounds=_ROUNDS,
+)
 
 
 def hash_password(password: str) -> str:
@@ -11,3 +26,14 @@ def hash_password(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify password and rehash it if the hash is outdated.
+
+    Returns:
+        Tuple of (is_valid, new hash to store or None).
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
@@ -0,0 +1,121 @@
+"""Token bucket rate limiting.
+
+A bucket of a key holds up to ``burst`` tokens and gains ``per_minute``
+tokens a minute; every attempt takes one. Buckets live in a
+:class:`RateLimitStore`: by default in the memory of the process, so each
+worker limits on its own and a client gets up to workers times the limit.
+A store shared by workers (e.g. Redis running the same arithmetic in a
+script) makes limits global, see :func:`.set_rate_limit_store`.
+"""
+
+from collections.abc import Callable
+import time
+from typing import Protocol
+
+from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.metrics import auth as auth_metrics
+from ai_crm.pkg.models.exceptions import rate_limit as rate_limit_exceptions
+from ai_crm.pkg.utils import lru_cache
+
+logger = logger_lib.get_logger(__name__)
+
+
+class RateLimitStore(Protocol):
+    """Storage of token buckets."""
+
+    async def consume(self, key: str, rate: float, burst: int) -> float:
+        """Take a token from the bucket of ``key``.
+
+        Args:
+            key: Bucket key.
+            rate: Tokens added per second.
+            burst: Capacity of the bucket, a new bucket is full.
+
+        Returns:
+            0 if the token was taken, else seconds until one is available.
+        """
+
+
+class InMemoryRateLimitStore:
+    """:class:`RateLimitStore` in the memory of this process.
+
+    Keeps at most ``maxsize`` buckets: a bucket evicted as least recently
+    used is full again when its key comes back.
+    """
+
+    def __init__(
+        self, maxsize: int, clock: Callable[[], float] = time.monotonic
+    ):
+        # Bucket is (tokens, updated_at)
+        self._buckets: lru_cache.LRUCache[tuple[float, float]] = (
+            lru_cache.LRUCache(maxsize)
+        )
+        self._clock = clock
+
+    async def consume(self, key: str, rate: float, burst: int) -> float:
+        now = self._clock()
+        tokens, updated_at = self._buckets.get(key) or (burst, now)
+        tokens = min(burst, tokens + (now - updated_at) * rate)
+
+        if tokens < 1:
+            self._buckets.set(key, (tokens, now))
+            return (1 - tokens) / rate
+
+        self._buckets.set(key, (tokens - 1, now))
+        return 0.0
+
+
+_store: RateLimitStore = InMemoryRateLimitStore(
+    settings.ai_crm_env.API.RATE_LIMIT_CACHE_SIZE
+)
+
+
+def set_rate_limit_store(store: RateLimitStore) -> None:
+    """Keep buckets in another store, e.g. one shared by workers."""
+    global _store
+
+    _store = store
+
+
+class RateLimiter:
+    """Limits attempts per key (client IP, email).
+
+    Args:
+        name: Name of the limiter, prefixes keys and labels metrics.
+        per_minute: Attempts a minute allowed in the long run.
+        burst: Attempts allowed at once.
+    """
+
+    def __init__(self, name: str, per_minute: float, burst: int):
+        self.name = name
+        self._rate = per_minute / 60
+        self._burst = burst
+
+    async def check(self, key: str) -> None:
+        """Count an attempt for ``key``.
+
+        Attempts are allowed if the store fails: the limit protects CPU,
+        it doesn't authenticate.
+
+        Raises:
+            RateLimitExceeded: If ``key`` has no attempts left.
+        """
+        if not settings.ai_crm_env.API.RATE_LIMIT_ENABLED:
+            return
+
+        try:
+            retry_after = await _store.consume(
+                f"{self.name}:{key}", self._rate, self._burst
+            )
+        except Exception as error:
+            logger.warning(
+                "Failed to check rate limit",
+                limiter=self.name,
+                error=repr(error),
+            )
+            return
+
+        if retry_after:
+            auth_metrics.RATE_LIMITED_REQUESTS.labels(limiter=self.name).inc()
+            raise rate_limit_exceptions.RateLimitExceeded(retry_after)
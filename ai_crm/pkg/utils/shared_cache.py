@@ -0,0 +1,46 @@
+"""Cache shared by the processes of the application.
+
+In-process caches are cheap but each worker fills and invalidates its own.
+A shared store (e.g. Redis) implements :class:`SharedCache` to let workers
+reuse entries and to make invalidation reach all of them.
+:class:`InMemorySharedCache` stands in for it in local runs.
+"""
+
+import time
+from typing import Protocol
+
+
+class SharedCache(Protocol):
+    """Key/value store with expiration, shared by processes."""
+
+    async def get(self, key: str) -> str | None:
+        """Get value or ``None`` when it is missing or expired."""
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Set value that expires in ``ttl`` seconds."""
+
+    async def delete(self, key: str) -> None:
+        """Remove value, if any."""
+
+
+class InMemorySharedCache:
+    """:class:`SharedCache` living in the memory of this process.
+
+    Shares nothing between processes: meant for local runs and tests.
+    """
+
+    def __init__(self):
+        self._data: dict[str, tuple[str, float]] = {}
+
+    async def get(self, key: str) -> str | None:
+        value, expires_at = self._data.get(key, (None, 0.0))
+        if expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        self._data[key] = (value, time.monotonic() + ttl)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
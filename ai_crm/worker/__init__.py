@@ -0,0 +1,45 @@
+"""Standalone personalization worker process."""
+
+import asyncio
+import signal
+
+import prometheus_client
+
+from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.context.web_context import WebContext
+from ai_crm.pkg.logger import logger as logger_lib
+from ai_crm.pkg.metrics import exposition
+from ai_crm.worker.personalization import PersonalizationWorker
+
+logger = logger_lib.get_logger(__name__)
+
+
+async def _serve() -> None:
+    web_context = WebContext()
+    worker = PersonalizationWorker(web_context)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await web_context.on_startup()
+    try:
+        await worker.on_startup()
+        await stop.wait()
+    finally:
+        await worker.on_shutdown()
+        await web_context.on_shutdown()
+
+
+def main() -> None:
+    logger.info("Starting personalization worker process")
+
+    metrics_port = settings.ai_crm_env.JOBS.METRICS_PORT
+    if metrics_port:
+        prometheus_client.start_http_server(
+            metrics_port, registry=exposition.get_registry()
+        )
+        logger.info("Worker metrics are exposed", port=metrics_port)
+
+    asyncio.run(_serve())
@@ -0,0 +1,104 @@
+"""Worker that runs queued AI resume personalization jobs."""
+
+import asyncio
+
+from ai_crm.internal.services.resumes import personalization_jobs
+from ai_crm.pkg import context
+from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.logger import logger as logger_lib
+
+logger = logger_lib.get_logger(__name__)
+
+
+class PersonalizationWorker:
+    """Pool of loops claiming jobs from ``personalization_jobs``.
+
+    Every loop claims one job at a time with ``FOR UPDATE SKIP LOCKED``, so
+    any number of workers in any number of processes can share the table.
+
+    Examples:
+        Drive the queue from a test without background loops::
+
+            >>> context = WebContext(openai_client=fake_openai_client)
+            >>> await context.on_startup()
+            >>> await PersonalizationWorker(context).run_until_idle()
+    """
+
+    def __init__(
+        self,
+        context: context.AnyContext,
+        concurrency: int | None = None,
+        poll_interval: float | None = None,
+    ):
+        config = settings.ai_crm_env.JOBS
+
+        self._context = context
+        self._concurrency = concurrency or config.WORKER_CONCURRENCY
+        self._poll_interval = poll_interval or config.POLL_INTERVAL_SECONDS
+        self._stopping = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    async def on_startup(self) -> None:
+        logger.info(
+            "Starting personalization worker",
+            concurrency=self._concurrency,
+            poll_interval_seconds=self._poll_interval,
+        )
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._loop(number))
+            for number in range(self._concurrency)
+        ]
+
+    async def on_shutdown(self) -> None:
+        """Stop claiming jobs and wait for the running ones to finish.
+
+        A job interrupted by a hard kill stays ``running`` until its lease
+        expires and is then claimed again.
+        """
+        if not self._tasks:
+            return
+
+        logger.info("Stopping personalization worker...")
+        self._stopping.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_once(self) -> bool:
+        """Claim and run a single job.
+
+        Returns:
+            False if the queue was empty
+        """
+        return await personalization_jobs.process_next_job(self._context)
+
+    async def run_until_idle(self) -> int:
+        """Run jobs one by one until the queue is empty.
+
+        Returns:
+            Number of processed jobs
+        """
+        processed = 0
+        while await self.run_once():
+            processed += 1
+        return processed
+
+    async def _loop(self, number: int) -> None:
+        while not self._stopping.is_set():
+            try:
+                has_job = await self.run_once()
+            except Exception:
+                logger.exception(
+                    "Personalization worker loop failed", loop=number
+                )
+                has_job = False
+
+            if has_job:
+                continue
+
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), timeout=self._poll_interval
+                )
+            except TimeoutError:
+                pass
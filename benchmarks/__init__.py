@@ -0,0 +1,7 @@
+"""Benchmarks of the hot paths, runnable without external services.
+
+Run a benchmark as a module from the project root, with the same
+environment as the API (``.env``)::
+
+    python -m benchmarks.psql_connection_soak
+"""
@@ -0,0 +1,111 @@
+"""Cost of converting database rows to models in ``collect_response``.
+
+Converts the result of ``get_user_resumes`` with ``--rows`` resumes, the
+way the decorator did before (a new ``TypeAdapter`` per call), with one
+adapter built at decoration time, and without validation for trusted
+rows (``collect_response(trusted=True)``).
+
+Usage::
+
+    python -m benchmarks.collect_response --rows 1000
+"""
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+import time
+import uuid
+
+import pydantic
+
+from ai_crm.internal.repository.postgresql.collect_response import (
+    collect_response,
+)
+from ai_crm.pkg.models.ai_crm import resume as resume_models
+
+
+def _build_rows(count: int) -> list[dict]:
+    # asyncpg.Record can't be built by hand; dict(row) costs the same
+    user_id = str(uuid.uuid4())
+    now = datetime.now(UTC)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "filename": f"{uuid.uuid4()}.pdf",
+            "original_filename": f"resume {number}.pdf",
+            "file_size": 102400 + number,
+            "mime_type": "application/pdf",
+            "storage_path": f"resumes/{user_id}/{uuid.uuid4()}.pdf",
+            "storage_type": "local",
+            "content_hash": uuid.uuid4().hex * 2,
+            "media_type": "cv",
+            "title": f"Software Engineer Resume {number}",
+            "description": None,
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for number in range(count)
+    ]
+
+
+def _collect_response_per_call(fn):
+    """The decorator before: adapter built and list detected per call."""
+
+    async def convert(response, annotations: str):
+        if annotations.startswith("list"):
+            return [dict(record) for record in response]
+        return dict(response)
+
+    async def inner(*args, **kwargs):
+        response = await fn(*args, **kwargs)
+        return_annotation = fn.__annotations__["return"]
+        type_adapter = pydantic.TypeAdapter(return_annotation)
+        converted_response = await convert(
+            response=response, annotations=str(return_annotation)
+        )
+        return type_adapter.validate_python(converted_response)
+
+    return inner
+
+
+async def _measure(
+    get_user_resumes: Callable[[], Awaitable[list]], calls: int
+) -> float:
+    await get_user_resumes()  # warmup
+    started_at = time.perf_counter()
+    for _ in range(calls):
+        await get_user_resumes()
+    return (time.perf_counter() - started_at) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = _build_rows(args.rows)
+
+    async def get_user_resumes() -> list[resume_models.Resume]:
+        return rows
+
+    variants = {
+        "per-call adapter": _collect_response_per_call(get_user_resumes),
+        "cached adapter": collect_response(get_user_resumes),
+        "trusted rows": collect_response(trusted=True)(get_user_resumes),
+    }
+
+    print(f"{'collect_response':<18} {'ms/call':>8} {'us/row':>7}")
+    for name, decorated in variants.items():
+        per_call = asyncio.run(_measure(decorated, args.calls))
+        print(
+            f"{name:<18} {per_call * 1000:>8.2f} "
+            f"{per_call / args.rows * 1e6:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
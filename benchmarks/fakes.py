@@ -0,0 +1,85 @@
+"""In-memory stand-ins for PostgreSQL pools and connections."""
+
+import asyncio
+from collections.abc import AsyncIterator
+import contextlib
+
+
+class FakeConnection:
+    """Connection answering every query after ``latency`` seconds."""
+
+    def __init__(self, latency: float = 0.0, row: dict | None = None):
+        self.latency = latency
+        self.row = row or {}
+
+    @contextlib.asynccontextmanager
+    async def transaction(self, **_kwargs) -> AsyncIterator[None]:
+        yield
+
+    async def fetchrow(self, *_args, **_kwargs) -> dict:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.row
+
+
+class FakePool:
+    """Pool handing out a fixed set of connections, like asyncpg's one."""
+
+    def __init__(
+        self, size: int = 10, latency: float = 0.0, row: dict | None = None
+    ):
+        self._size = size
+        self._all_connections = [
+            FakeConnection(latency, row) for _ in range(size)
+        ]
+        self._connections: asyncio.Queue[FakeConnection] = asyncio.Queue()
+        for conn in self._all_connections:
+            self._connections.put_nowait(conn)
+
+    def set_latency(self, latency: float) -> None:
+        for conn in self._all_connections:
+            conn.latency = latency
+
+    async def acquire(self, timeout: float | None = None) -> FakeConnection:
+        return await asyncio.wait_for(self._connections.get(), timeout)
+
+    async def release(self, conn: FakeConnection) -> None:
+        self._connections.put_nowait(conn)
+
+    def get_size(self) -> int:
+        return self._size
+
+    def get_idle_size(self) -> int:
+        return self._connections.qsize()
+
+    def get_max_size(self) -> int:
+        return self._size
+
+
+class FakePostgreSQL:
+    """Replacement of :class:`.postgresql.Resource` with one pool per mode."""
+
+    def __init__(self, size: int = 10, latency: float = 0.0):
+        self._master = FakePool(size, latency)
+        self._replica = FakePool(size, latency)
+
+    def get_pool(self, read_only: bool = False) -> FakePool:
+        return self._replica if read_only else self._master
+
+    @contextlib.asynccontextmanager
+    async def acquire(
+        self, read_only: bool = False, min_lsn: int | None = None
+    ) -> AsyncIterator[FakeConnection]:
+        pool = self.get_pool(read_only)
+        conn = await pool.acquire()
+        try:
+            yield conn
+        finally:
+            await pool.release(conn)
+
+
+class FakeContext:
+    """Context with only the PostgreSQL resource."""
+
+    def __init__(self, postgresql: FakePostgreSQL):
+        self.postgresql = postgresql
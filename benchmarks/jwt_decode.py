@@ -0,0 +1,69 @@
+"""Cost of verifying the access token of a request.
+
+``--users`` clients send ``--requests`` requests in total, each with its
+own access token, the way they do between logins. Compares full decoding
+with python-jose on every request (as ``decode_token`` did before) with
+the verified-token cache of :func:`.jwt.decode_token`.
+
+Usage::
+
+    python -m benchmarks.jwt_decode --users 1000
+"""
+
+import argparse
+from collections.abc import Callable
+import time
+import uuid
+
+from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.utils import jwt as jwt_utils
+
+
+def _measure(decode: Callable[[str], dict | None], tokens: list[str]) -> float:
+    started_at = time.perf_counter()
+    for token in tokens:
+        if decode(token) is None:
+            raise RuntimeError("Token is rejected")
+    return (time.perf_counter() - started_at) / len(tokens)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=50_000)
+    args = parser.parse_args()
+
+    user_tokens = [
+        jwt_utils.create_access_token(
+            {"sub": str(uuid.uuid4()), "username": f"user{number}"}
+        )
+        for number in range(args.users)
+    ]
+    tokens = [
+        user_tokens[number % args.users] for number in range(args.requests)
+    ]
+
+    verifier = jwt_utils.JoseTokenVerifier(
+        settings.ai_crm_env.API.JWT_SECRET_KEY.get_secret_value(),
+        settings.ai_crm_env.API.JWT_ALGORITHM,
+    )
+
+    def decode_without_cache(token: str) -> dict | None:
+        payload = verifier.verify(token)
+        if payload is None or payload.get("type") != "access":
+            return None
+        return payload
+
+    variants = {
+        "python-jose": decode_without_cache,
+        "verified cache": jwt_utils.decode_token,
+    }
+
+    print(f"{'decode_token':<15} {'us/request':>10}")
+    for name, decode in variants.items():
+        per_request = _measure(decode, tokens)
+        print(f"{name:<15} {per_request * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Login rate limits under a simulated credential stuffing attack.
+
+For ``--seconds`` of simulated time, ``--attackers`` IPs send ``--rate``
+login attempts a second in total. The attempts target ``--victims``
+accounts. Meanwhile, every second a real user logs in from an IP of
+their own. Each attempt the limits let through costs one bcrypt
+verification. The benchmark counts those with and without the limits of
+:mod:`.rate_limit`, and the real users' logins that got through.
+
+Usage::
+
+    python -m benchmarks.login_rate_limit --rate 1000
+"""
+
+import argparse
+import asyncio
+import time
+
+from ai_crm.pkg.configuration import settings
+from ai_crm.pkg.models.exceptions import rate_limit as rate_limit_exceptions
+from ai_crm.pkg.utils import rate_limit as rate_limit_lib
+
+# bcrypt verification with the default cost
+_BCRYPT_SECONDS = 0.25
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _simulate(
+    args: argparse.Namespace, is_limited: bool
+) -> tuple[int, int, int, float]:
+    clock = _Clock()
+    rate_limit_lib.set_rate_limit_store(
+        rate_limit_lib.InMemoryRateLimitStore(
+            settings.ai_crm_env.API.RATE_LIMIT_CACHE_SIZE, clock=clock
+        )
+    )
+    config = settings.ai_crm_env.API
+    ip_limiter = rate_limit_lib.RateLimiter(
+        "auth_ip", config.AUTH_IP_RATE_PER_MINUTE, config.AUTH_IP_BURST
+    )
+    email_limiter = rate_limit_lib.RateLimiter(
+        "login_email",
+        config.LOGIN_EMAIL_RATE_PER_MINUTE,
+        config.LOGIN_EMAIL_BURST,
+    )
+
+    async def attempt(ip: str, email: str) -> bool:
+        if not is_limited:
+            return True
+        try:
+            await ip_limiter.check(ip)
+            await email_limiter.check(email)
+        except rate_limit_exceptions.RateLimitExceeded:
+            return False
+        return True
+
+    verifications = users_logged_in = checks = 0
+    check_seconds = 0.0
+    for second in range(args.seconds):
+        for number in range(args.rate):
+            clock.now = second + number / args.rate
+            attempt_number = second * args.rate + number
+            started_at = time.perf_counter()
+            is_allowed = await attempt(
+                f"10.0.0.{attempt_number % args.attackers}",
+                f"victim{attempt_number % args.victims}@example.com",
+            )
+            check_seconds += time.perf_counter() - started_at
+            checks += 1
+            verifications += is_allowed
+
+        if await attempt(f"user-ip-{second}", f"user{second}@example.com"):
+            verifications += 1
+            users_logged_in += 1
+
+    return verifications, users_logged_in, checks, check_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=int, default=60)
+    parser.add_argument("--rate", type=int, default=1000)
+    parser.add_argument("--attackers", type=int, default=50)
+    parser.add_argument("--victims", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'login':<12} {'bcrypt calls':>12} {'cpu s/s':>8} "
+        f"{'users in':>8} {'us/check':>8}"
+    )
+    for name, is_limited in (("unlimited", False), ("rate limits", True)):
+        verifications, users_logged_in, checks, check_seconds = asyncio.run(
+            _simulate(args, is_limited)
+        )
+        print(
+            f"{name:<12} {verifications:>12} "
+            f"{verifications * _BCRYPT_SECONDS / args.seconds:>8.1f} "
+            f"{users_logged_in:>4}/{args.seconds:<3} "
+            f"{check_seconds / checks * 1e6:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Soak test of the per-task connection binding in :mod:`.psql`.
+
+Every simulated request is a separate task doing a read, a write and a
+transaction with nested repository calls, like a handler does. Memory must
+stay flat: nothing may be kept per finished task.
+
+Usage::
+
+    python -m benchmarks.psql_connection_soak --requests 1000000
+"""
+
+import argparse
+import asyncio
+import gc
+import resource
+import sys
+import time
+
+from ai_crm.pkg.connectors.postgresql import psql
+from benchmarks.fakes import FakeContext, FakePostgreSQL
+
+
+async def _handle_request(context: FakeContext) -> None:
+    async with psql.get_connection(context, read_only=True) as conn:
+        await conn.fetchrow("SELECT")
+
+    async with psql.get_connection(context) as conn:
+        await conn.fetchrow("INSERT")
+
+    async with psql.transaction(context):
+        async with psql.get_connection(context, read_only=True) as conn:
+            await conn.fetchrow("SELECT")
+        async with psql.get_connection(context) as conn:
+            await conn.fetchrow("UPDATE")
+
+
+def _get_rss_mb() -> float:
+    # Linux: /proc is exact, ru_maxrss only gives the peak
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * resource.getpagesize() / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+async def _soak(requests: int, concurrency: int, checkpoints: int) -> float:
+    context = FakeContext(FakePostgreSQL(size=concurrency))
+    # The parent uses the database first (startup checks, job loops), so
+    # every request task inherits a context where the binding was set
+    await _handle_request(context)
+
+    checkpoint_every = max(requests // checkpoints, concurrency)
+    baseline = None
+    done = 0
+    started_at = time.perf_counter()
+
+    print(f"{'requests':>10} {'rss, MB':>9} {'objects':>9} {'req/s':>9}")
+    while done < requests:
+        batch = min(concurrency, requests - done)
+        await asyncio.gather(*(_handle_request(context) for _ in range(batch)))
+        done += batch
+
+        if done % checkpoint_every < batch or done == requests:
+            gc.collect()
+            rss_mb = _get_rss_mb()
+            # The first checkpoint is after warmup: caches and pools are full
+            baseline = rss_mb if baseline is None else baseline
+            rate = done / (time.perf_counter() - started_at)
+            print(
+                f"{done:>10} {rss_mb:>9.1f} "
+                f"{len(gc.get_objects()):>9} {rate:>9.0f}"
+            )
+
+    return rss_mb - baseline
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1_000_000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--checkpoints", type=int, default=10)
+    parser.add_argument(
+        "--max-growth-mb",
+        type=float,
+        default=2.0,
+        help="fail if RSS grows more than this after warmup",
+    )
+    args = parser.parse_args()
+
+    growth = asyncio.run(
+        _soak(args.requests, args.concurrency, args.checkpoints)
+    )
+    print(f"RSS growth after warmup: {growth:.1f} MB")
+    if growth > args.max_growth_mb:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
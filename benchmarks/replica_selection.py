@@ -0,0 +1,162 @@
+"""Replica selection: load and latency aware vs plain round-robin.
+
+Readers hammer three replicas, one of them ``--slow-factor`` times slower
+(an overloaded or remote host) for the first half of the run. Round-robin
+keeps sending it a third of the reads, so they queue up on its pool; the
+selector of :class:`.postgresql.Resource` sends it only what it can serve
+fast. Health checks run every ``--check-interval`` seconds, so once the
+replica recovers, it gets its share of reads back (``after`` column).
+
+Usage::
+
+    python -m benchmarks.replica_selection --slow-factor 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from ai_crm.pkg.connectors.postgresql.host import PostgreSQLHost
+from ai_crm.pkg.connectors.postgresql.resource import Resource
+from benchmarks.fakes import FakePool
+
+
+class _RoundRobinResource(Resource):
+    """Selection used before: rotate over replicas regardless of load."""
+
+    def _select_slave(
+        self, min_lsn: int | None = None
+    ) -> PostgreSQLHost | None:
+        slaves = self._slave_hosts
+        self._slave_round_robin_index = (
+            self._slave_round_robin_index + 1
+        ) % len(slaves)
+        return slaves[self._slave_round_robin_index]
+
+
+# Row of the health check query on a replica without lag
+_REPLICA_STATUS = {
+    "is_in_recovery": True,
+    "replication_delay": 0.0,
+    "replay_lsn": 0,
+}
+
+
+def _build_resource(
+    resource_class: type[Resource],
+    pool_size: int,
+    latency: float,
+    slow_factor: float,
+) -> Resource:
+    resource = resource_class()
+    latencies = [latency, latency, latency * slow_factor]
+    for number, host_latency in enumerate(latencies):
+        host = PostgreSQLHost(f"replica-{number}")
+        host.is_healthy = True
+        host.pool = FakePool(pool_size, host_latency, _REPLICA_STATUS)
+        resource._hosts.append(host)
+        resource._slave_hosts.append(host)
+    return resource
+
+
+async def _run(
+    resource: Resource, args: argparse.Namespace
+) -> tuple[list[float], dict[str, int], dict[str, int]]:
+    """Run readers, the slow replica recovers halfway through.
+
+    Returns:
+        Latencies of all reads, reads per host before and after recovery.
+    """
+    latencies: list[float] = []
+    before = {host.host: 0 for host in resource._hosts}
+    after = dict(before)
+    started_at = time.perf_counter()
+    recovers_at = started_at + args.duration / 2
+    deadline = started_at + args.duration
+
+    async def reader() -> None:
+        while time.perf_counter() < deadline:
+            read_started_at = time.perf_counter()
+            host = resource._get_host(read_only=True)
+            async with host.acquire() as conn:
+                await conn.fetchrow("SELECT")
+            latencies.append(time.perf_counter() - read_started_at)
+            per_host = before if read_started_at < recovers_at else after
+            per_host[host.host] += 1
+
+    async def recover() -> None:
+        await asyncio.sleep(recovers_at - time.perf_counter())
+        resource._hosts[-1].pool.set_latency(args.latency)
+
+    async def check_health() -> None:
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(args.check_interval)
+            await asyncio.gather(
+                *(resource._check_host(host) for host in resource._hosts)
+            )
+
+    await asyncio.gather(
+        recover(),
+        check_health(),
+        *(reader() for _ in range(args.readers)),
+    )
+    return latencies, before, after
+
+
+def _report(
+    name: str,
+    latencies: list[float],
+    before: dict[str, int],
+    after: dict[str, int],
+    duration: float,
+) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    slow_host = list(before)[-1]
+    print(
+        f"{name:<12} {len(latencies) / duration:>9.0f} "
+        f"{quantiles[49] * 1000:>8.1f} {quantiles[98] * 1000:>8.1f} "
+        f"{_get_share(before, slow_host):>7.0%} "
+        f"{_get_share(after, slow_host):>7.0%}"
+    )
+
+
+def _get_share(per_host: dict[str, int], host: str) -> float:
+    return per_host[host] / max(sum(per_host.values()), 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=60)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument(
+        "--latency", type=float, default=0.002, help="seconds per query"
+    )
+    parser.add_argument("--slow-factor", type=float, default=10.0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument(
+        "--check-interval",
+        type=float,
+        default=0.5,
+        help="seconds between health checks",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'selection':<12} {'reads/s':>9} {'p50, ms':>8} {'p99, ms':>8} "
+        f"{'slow host share':>15}"
+    )
+    print(f"{'':<40}{'before':>7} {'after':>7}")
+    for name, resource_class in (
+        ("round-robin", _RoundRobinResource),
+        ("least-cost", Resource),
+    ):
+        resource = _build_resource(
+            resource_class, args.pool_size, args.latency, args.slow_factor
+        )
+        latencies, before, after = asyncio.run(_run(resource, args))
+        _report(name, latencies, before, after, args.duration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Gunicorn configuration with Prometheus multiprocess mode support.
+
+``PROMETHEUS_MULTIPROC_DIR`` must be set in the environment of the master
+process, so workers inherit it before importing ``prometheus_client``.
+"""
+
+import os
+import pathlib
+import shutil
+
+from prometheus_client import multiprocess
+
+
+def on_starting(server) -> None:
+    """Drop metric files left by a previous run."""
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not multiproc_dir:
+        return
+
+    shutil.rmtree(multiproc_dir, ignore_errors=True)
+    pathlib.Path(multiproc_dir).mkdir(parents=True, exist_ok=True)
+
+
+def child_exit(server, worker) -> None:
+    """Remove live gauges of a dead worker from aggregation."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,18 @@
+-- Create parsed_resumes table for caching GPT parse results by file content
+-- depends: 0003_add_media_type_to_resumes
+
+CREATE TABLE parsed_resumes (
+    id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::TEXT,
+
+    -- SHA-256 of the original file bytes
+    content_hash CHAR(64) NOT NULL,
+    -- Version of the parsing prompt and ParsedResume schema
+    schema_version VARCHAR(64) NOT NULL,
+
+    parsed_data JSONB NOT NULL,
+
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT parsed_resumes_content_hash_schema_version_key
+        UNIQUE (content_hash, schema_version)
+);
@@ -0,0 +1,39 @@
+-- Create personalization_jobs table for asynchronous AI personalization
+-- depends: 0004_create_parsed_resumes_table
+
+CREATE TABLE personalization_jobs (
+    id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::TEXT,
+    user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    resume_id TEXT NOT NULL REFERENCES resumes(id) ON DELETE CASCADE,
+    job_description TEXT NOT NULL,
+
+    -- Status: pending -> running -> succeeded | failed
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error_code VARCHAR(100),
+
+    -- Result
+    pdf_resume_id TEXT REFERENCES resumes(id) ON DELETE SET NULL,
+    docx_resume_id TEXT REFERENCES resumes(id) ON DELETE SET NULL,
+
+    -- A running job whose lease expired is considered abandoned by a
+    -- crashed worker and can be claimed again
+    locked_until TIMESTAMP WITH TIME ZONE,
+
+    -- Timestamps
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
+-- Create indexes for better performance
+CREATE INDEX idx_personalization_jobs_user_id ON personalization_jobs(user_id);
+CREATE INDEX idx_personalization_jobs_claim
+    ON personalization_jobs(created_at)
+    WHERE status IN ('pending', 'running');
+
+CREATE TRIGGER set_updated_at_on_personalization_jobs
+BEFORE UPDATE ON personalization_jobs
+FOR EACH ROW
+EXECUTE FUNCTION trigger_updated_at();
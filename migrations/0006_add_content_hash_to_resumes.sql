@@ -0,0 +1,6 @@
+-- Add content_hash column (SHA-256 of file content) to resumes table
+-- depends: 0005_create_personalization_jobs_table
+
+ALTER TABLE resumes ADD COLUMN content_hash CHAR(64);
+
+CREATE INDEX idx_resumes_content_hash ON resumes(content_hash);